@@ -7,7 +7,6 @@ Uploads videos from Google Sheets to YouTube with resume capabilities
 import os
 import json
 import logging
-import pickle
 import re
 import time
 import tempfile
@@ -22,7 +21,7 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
 import httplib2
 
 # Type definitions
@@ -46,7 +45,7 @@ class FailedUpload:
 class Config:
     """Configuration for the uploader"""
     credentials_file: str
-    token_file: str = 'token.pickle'
+    token_file: str = 'token.json'
     progress_file: str = 'upload_progress.json'
     log_file: str = 'upload_log.txt'
     temp_dir: Optional[str] = None
@@ -64,21 +63,22 @@ class DefaultFileOperations:
     def read_file(self, path: str, mode: str = 'r') -> Optional[Any]:
         try:
             with open(path, mode) as f:
-                if mode == 'rb':
-                    return pickle.load(f)
-                elif mode == 'r':
-                    return f.read()
+                return f.read()
         except FileNotFoundError:
             return None
         except Exception:
             return None
     
     def write_file(self, path: str, content: Any, mode: str = 'w') -> None:
-        with open(path, mode) as f:
-            if mode == 'wb':
-                pickle.dump(content, f)
-            elif mode == 'w':
-                f.write(content if isinstance(content, str) else json.dumps(content, indent=2))
+        # Write to a temp file and rename it over the target so a crash never leaves a torn file
+        with tempfile.NamedTemporaryFile(mode, dir=os.path.dirname(path) or '.', delete=False) as f:
+            if isinstance(content, (str, bytes)):
+                f.write(content)
+            else:
+                f.write(json.dumps(content, separators=(',', ':')))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, path)
     
     def exists(self, path: str) -> bool:
         return os.path.exists(path)
@@ -90,32 +90,26 @@ class DefaultFileOperations:
         os.makedirs(path, exist_ok=exist_ok)
 
 # Pure utility functions
+DRIVE_FILE_ID_PATTERN = re.compile(r'(?:/file/d/|[?&]id=)([a-zA-Z0-9_-]+)')
+INSERT_PART = 'snippet,status'
+
 def extract_file_id_from_drive_link(link: str) -> Optional[str]:
     """Extract file ID from various Google Drive URL formats"""
-    patterns = [
-        r'/file/d/([a-zA-Z0-9-_]+)',
-        r'id=([a-zA-Z0-9-_]+)',
-        r'/open\?id=([a-zA-Z0-9-_]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, link)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = DRIVE_FILE_ID_PATTERN.search(link)
+    return match.group(1) if match else None
 
 def parse_video_row(row: List[str]) -> Optional[VideoData]:
     """Parse a spreadsheet row into VideoData"""
     if len(row) < 5:
         return None
     
+    drive_link, title, description, tag_string, unique_id = row[:5]
     return VideoData(
-        drive_link=row[0],
-        title=row[1],
-        description=row[2],
-        tags=[tag.strip() for tag in row[3].split(',')] if row[3] else [],
-        unique_id=row[4]
+        drive_link=drive_link,
+        title=title,
+        description=description,
+        tags=[tag.strip() for tag in tag_string.split(',')] if tag_string else [],
+        unique_id=unique_id
     )
 
 def serialize_progress(processed_ids: Set[str], last_row: int, failed: List[FailedUpload]) -> str:
@@ -124,7 +118,7 @@ def serialize_progress(processed_ids: Set[str], last_row: int, failed: List[Fail
         'processed_ids': list(processed_ids),
         'last_processed_row': last_row,
         'failed_uploads': [asdict(fu) for fu in failed]
-    }, indent=2)
+    }, separators=(',', ':'))
 
 def deserialize_progress(data: str) -> Tuple[Set[str], int, List[FailedUpload]]:
     """Deserialize JSON string to progress data"""
@@ -162,12 +156,18 @@ def save_progress(
 
 # Authentication functions
 def load_credentials(token_file: str, file_ops: FileOperations) -> Optional[Credentials]:
-    """Load saved credentials from file"""
-    return file_ops.read_file(token_file, 'rb')
+    """Load saved credentials from a JSON token file"""
+    content = file_ops.read_file(token_file)
+    if not content:
+        return None
+    try:
+        return Credentials.from_authorized_user_info(json.loads(content))
+    except ValueError:
+        return None
 
 def save_credentials(token_file: str, creds: Credentials, file_ops: FileOperations) -> None:
-    """Save credentials to file"""
-    file_ops.write_file(token_file, creds, 'wb')
+    """Save credentials to a JSON token file"""
+    file_ops.write_file(token_file, creds.to_json())
 
 def authenticate_with_oauth(
     credentials_file: str,
@@ -202,11 +202,11 @@ def download_file_from_drive(
         request = drive_service.files().get_media(fileId=file_id)
         
         with open(output_path, 'wb') as f:
-            downloader = MediaFileUpload(output_path, resumable=True)
+            downloader = MediaIoBaseDownload(f, request, chunksize=16 * 1024 * 1024)
             done = False
             
             while not done:
-                _, done = downloader.next_chunk()
+                _, done = downloader.next_chunk(num_retries=5)
         
         return True
     except HttpError:
@@ -233,7 +233,7 @@ def upload_video_to_youtube(
     }
     
     insert_request = youtube_service.videos().insert(
-        part=','.join(body.keys()),
+        part=INSERT_PART,
         body=body,
         media_body=MediaFileUpload(
             video_path,
@@ -492,8 +492,7 @@ class YouTubeBulkUploader:
         
         self.logger.info(f"Retrying {len(failed_to_retry)} failed uploads...")
         
-        for failed in failed_to_retry:
-            processed_ids.discard(failed.unique_id)
+        processed_ids.difference_update(failed.unique_id for failed in failed_to_retry)
         
         save_progress(
             self.config.progress_file,
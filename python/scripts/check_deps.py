@@ -4,6 +4,7 @@
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -76,25 +77,35 @@ def check_tool_versions():
         "ruff": ["ruff", "--version"],
     }
     
-    versions = {}
-    for tool, cmd in tools.items():
+    def get_version(cmd: List[str]) -> str:
         try:
             result = subprocess.run(cmd, capture_output=True, text=True)
-            versions[tool] = result.stdout.strip() or result.stderr.strip()
+            return result.stdout.strip() or result.stderr.strip()
         except FileNotFoundError:
-            versions[tool] = "Not installed"
+            return "Not installed"
     
-    return versions
+    # Each tool spends most of its time starting up, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        futures = {tool: executor.submit(get_version, cmd) for tool, cmd in tools.items()}
+        return {tool: future.result() for tool, future in futures.items()}
 
 
 def main():
     """Run all checks and display results."""
     print("🔍 Checking Python Dependencies and Configuration\n")
     
+    # pip queries the package index and the tools start slowly, so run both
+    # in the background while pyproject.toml is checked
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        outdated_future = executor.submit(check_outdated_packages)
+        versions_future = executor.submit(check_tool_versions)
+        config_checks = check_pyproject_toml()
+        outdated = outdated_future.result()
+        versions = versions_future.result()
+    
     # Check outdated packages
     print("📦 Outdated Packages:")
     print("=" * 60)
-    outdated = check_outdated_packages()
     if outdated:
         print(f"{'Package':<30} {'Current':<15} {'Latest':<15}")
         print("-" * 60)
@@ -105,7 +116,6 @@ def main():
     
     print("\n📋 Configuration Status:")
     print("=" * 60)
-    config_checks = check_pyproject_toml()
     
     if not config_checks.get("exists"):
         print("❌ pyproject.toml not found!")
@@ -122,7 +132,6 @@ def main():
     
     print("\n🔧 Tool Versions:")
     print("=" * 60)
-    versions = check_tool_versions()
     for tool, version_info in versions.items():
         print(f"{tool:<10} {version_info}")
     
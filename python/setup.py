@@ -16,6 +16,7 @@ setup(
         "google-auth-httplib2>=0.2.0",
         "google-api-python-client>=2.100.0",
         "python-dotenv>=1.0.0",
+        "orjson>=3.8.0",
     ],
     extras_require={
         "dev": [
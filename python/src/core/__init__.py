@@ -1,12 +1,13 @@
 """Core business logic components."""
 
 from .dependency_container import DependencyContainer
-from .spreadsheet_processor import process_video_rows
+from .spreadsheet_processor import process_indexed_rows, process_video_rows
 from .video_processor import VideoProcessor
 from .youtube_bulk_uploader import YouTubeBulkUploader
 
 __all__ = [
     "DependencyContainer",
+    "process_indexed_rows",
     "process_video_rows",
     "VideoProcessor",
     "YouTubeBulkUploader",
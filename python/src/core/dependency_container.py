@@ -1,11 +1,15 @@
 """Dependency injection container for assembling services."""
 
+from typing import Optional
+
 from models import Config
 from services import (
     AuthenticationService,
+    DriveMetadataCache,
     FileOperations,
     GoogleDriveService,
     GoogleSheetsService,
+    HttpTransport,
     Logger,
     ProgressTracker,
     YouTubeService,
@@ -14,6 +18,9 @@ from services import (
 from .video_processor import VideoProcessor
 from .youtube_bulk_uploader import YouTubeBulkUploader
 
+# Socket timeout in seconds for YouTube upload connections
+UPLOAD_TIMEOUT = 120
+
 
 class DependencyContainer:
     """Container for managing and injecting dependencies."""
@@ -29,14 +36,27 @@ class DependencyContainer:
         
         # Initialize basic services
         self.file_operations = FileOperations()
-        self.logger = Logger(self.file_operations, config.log_file)
-        self.progress_tracker = ProgressTracker(self.file_operations, config.progress_file)
+        self.logger = Logger(
+            self.file_operations, config.log_file, flush_every=64, flush_interval=2.0
+        )
+        self.progress_tracker = ProgressTracker(
+            self.file_operations,
+            config.progress_file,
+            flush_every=256,
+            flush_interval=60.0,
+            journal_file=config.progress_journal_file,
+            journal_sync_every=16,
+        )
         
         # Authentication service (needs to be initialized before Google services)
         self.auth_service = AuthenticationService(
             config, self.file_operations, self.logger
         )
 
+        # Created with the uploader; kept so close() can release them
+        self.metadata_cache: Optional[DriveMetadataCache] = None
+        self.video_processor: Optional[VideoProcessor] = None
+
     def create_youtube_bulk_uploader(self) -> YouTubeBulkUploader:
         """
         Create and return a fully configured YouTubeBulkUploader instance.
@@ -47,15 +67,25 @@ class DependencyContainer:
         # Initialize authentication and get credentials
         credentials = self.auth_service.initialize()
         
-        # Create Google API services with authenticated credentials
-        sheets_service = GoogleSheetsService(credentials)
+        # Sheets and Drive share one keep-alive transport with the metadata cache
+        http_transport = HttpTransport(credentials, cache_dir=self.config.http_cache_dir)
+        sheets_service = GoogleSheetsService(credentials, http_transport)
+        self.metadata_cache = DriveMetadataCache(self.config.drive_metadata_cache)
         drive_service = GoogleDriveService(
-            credentials, self.file_operations, self.logger
+            credentials,
+            self.file_operations,
+            self.logger,
+            http_transport,
+            metadata_cache=self.metadata_cache,
+            chunk_size=self.config.download_chunk_size,
         )
-        youtube_service = YouTubeService(credentials, self.file_operations)
+        # Uploads get their own per-thread connections, without the response
+        # cache, and a longer timeout while YouTube finishes processing the body
+        upload_transport = HttpTransport(credentials, timeout=UPLOAD_TIMEOUT)
+        youtube_service = YouTubeService(credentials, self.file_operations, upload_transport)
         
         # Create video processor
-        video_processor = VideoProcessor(
+        self.video_processor = VideoProcessor(
             drive_service, youtube_service, self.file_operations, self.config
         )
         
@@ -63,8 +93,19 @@ class DependencyContainer:
         return YouTubeBulkUploader(
             auth_service=self.auth_service,
             sheets_service=sheets_service,
-            video_processor=video_processor,
+            video_processor=self.video_processor,
             progress_tracker=self.progress_tracker,
             logger=self.logger,
             config=self.config,
-        )
\ No newline at end of file
+        )
+
+    def close(self) -> None:
+        """Wait for background work to finish and release open files and connections."""
+        if self.video_processor is not None:
+            self.video_processor.close()
+        if self.metadata_cache is not None:
+            self.metadata_cache.close()
+        # Write out anything still buffered before the append descriptors close
+        self.progress_tracker.flush()
+        self.logger.flush()
+        self.file_operations.close()
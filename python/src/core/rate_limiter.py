@@ -0,0 +1,72 @@
+"""Token bucket rate limiting for YouTube API quota."""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by concurrent upload workers.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Each
+    call to ``acquire`` waits until enough tokens are available, so workers start
+    uploads as fast as the quota allows instead of pausing for a fixed delay.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize token bucket, starting full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the largest burst
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        # Created on first use so it binds to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, cost: float = 1) -> None:
+        """
+        Wait until ``cost`` tokens are available, then take them.
+
+        Args:
+            cost: Number of tokens to take
+
+        Raises:
+            ValueError: If cost exceeds the bucket capacity
+        """
+        if cost > self.capacity:
+            raise ValueError(f"cost {cost} exceeds bucket capacity {self.capacity}")
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < cost:
+                await asyncio.sleep((cost - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= cost
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
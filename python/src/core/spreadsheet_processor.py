@@ -1,23 +1,116 @@
 """Spreadsheet processing logic for bulk video uploads."""
 
 import asyncio
-from typing import List
+from typing import Iterator, List, Optional, Set, Tuple
 
 from interfaces import ILogger, IProgressTracker
-from utils.data_parser import parse_video_row
+from models import UPLOAD_QUOTA_COST, VideoData
+from utils.data_parser import UNIQUE_ID_COLUMN, parse_video_row
+from utils.drive_utils import extract_file_id_from_drive_link
 
+from .rate_limiter import TokenBucket
 from .video_processor import VideoProcessor
 
 
+class _RowWatermark:
+    """Tracks the highest row below which every scheduled video has finished."""
+
+    def __init__(self, row_indices: Optional[List[int]] = None) -> None:
+        """
+        Initialize watermark.
+
+        Args:
+            row_indices: Scheduled row indexes (0-based) in ascending order
+        """
+        self._row_indices = list(row_indices or [])
+        self._finished: Set[int] = set()
+        self._position = 0
+
+    def add(self, row_index: int) -> None:
+        """
+        Schedule another row.
+
+        Args:
+            row_index: Row index (0-based), greater than any already scheduled
+        """
+        self._row_indices.append(row_index)
+
+    def finish(self, row_index: int) -> Optional[int]:
+        """
+        Record a finished row.
+
+        Args:
+            row_index: Row index (0-based) that finished, successfully or not
+
+        Returns:
+            New last processed row number (1-based) if the watermark advanced, None otherwise
+        """
+        self._finished.add(row_index)
+        start = self._position
+        while (
+            self._position < len(self._row_indices)
+            and self._row_indices[self._position] in self._finished
+        ):
+            self._position += 1
+
+        if self._position == start:
+            return None
+        return self._row_indices[self._position - 1] + 1
+
+
+def _parse_pending_video(
+    i: int,
+    row: List[str],
+    logger: ILogger,
+    progress_tracker: IProgressTracker,
+) -> Optional[VideoData]:
+    """
+    Parse a row, skipping empty, invalid and already processed videos.
+
+    Args:
+        i: Row index (0-based)
+        row: Spreadsheet row containing video data
+        logger: Logger for output
+        progress_tracker: Progress tracking service
+
+    Returns:
+        Video data still to be processed, or None if the row is skipped
+    """
+    # Skip empty rows
+    if not row:
+        logger.log(f"Row {i + 1} is empty, skipping")
+        return None
+
+    # Skip already processed videos before paying for a full parse
+    unique_id = row[UNIQUE_ID_COLUMN].strip() if len(row) > UNIQUE_ID_COLUMN else ""
+    if unique_id and progress_tracker.is_video_processed(unique_id):
+        logger.log(f"Skipping already processed video: {unique_id}")
+        return None
+
+    # Parse video data from row
+    try:
+        video_data = parse_video_row(row)
+        if not video_data:
+            logger.log(f"Row {i + 1} has invalid data, skipping")
+            return None
+    except Exception:
+        logger.log(f"Row {i + 1} has invalid data, skipping")
+        return None
+
+    return video_data
+
+
 async def process_video_rows(
     rows: List[List[str]],
     start_row: int,
     logger: ILogger,
     progress_tracker: IProgressTracker,
     video_processor: VideoProcessor,
+    max_concurrent: int = 4,
+    rate_limiter: Optional[TokenBucket] = None,
 ) -> None:
     """
-    Process video rows from spreadsheet sequentially.
+    Process video rows from spreadsheet with bounded concurrency.
 
     Args:
         rows: Spreadsheet rows containing video data
@@ -25,47 +118,133 @@ async def process_video_rows(
         logger: Logger for output
         progress_tracker: Progress tracking service
         video_processor: Video processing service
+        max_concurrent: Maximum number of videos processed at once
+        rate_limiter: Optional quota bucket each upload draws from before starting
     """
-    for i in range(start_row, len(rows)):
-        row = rows[i]
+    await process_indexed_rows(
+        ((i, rows[i]) for i in range(start_row, len(rows))),
+        logger=logger,
+        progress_tracker=progress_tracker,
+        video_processor=video_processor,
+        max_concurrent=max_concurrent,
+        total_rows=len(rows),
+        rate_limiter=rate_limiter,
+    )
 
-        # Skip empty rows
-        if not row:
-            logger.log(f"Row {i + 1} is empty, skipping")
-            continue
 
-        # Parse video data from row
-        try:
-            video_data = parse_video_row(row)
-            if not video_data:
-                logger.log(f"Row {i + 1} has invalid data, skipping")
-                continue
-        except Exception:
-            logger.log(f"Row {i + 1} has invalid data, skipping")
-            continue
+async def process_indexed_rows(
+    indexed_rows: Iterator[Tuple[int, List[str]]],
+    logger: ILogger,
+    progress_tracker: IProgressTracker,
+    video_processor: VideoProcessor,
+    max_concurrent: int = 4,
+    total_rows: Optional[int] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+) -> int:
+    """
+    Process (row index, row) pairs as they arrive, with bounded concurrency.
+
+    Rows are pulled from ``indexed_rows`` off the event loop, so a paged sheet
+    fetch does not block videos that are already uploading. Up to
+    ``max_concurrent`` videos are downloaded and uploaded at the same time, each
+    first taking its YouTube quota cost from ``rate_limiter`` if given, while
+    the Drive metadata of the next ``max_concurrent`` videos is prefetched; no
+    further rows are read until one of those finishes. The last processed row
+    only advances once every earlier scheduled row has finished, so resuming
+    never skips a video that was still in flight.
 
-        # Skip already processed videos
-        if progress_tracker.is_video_processed(video_data.unique_id):
-            logger.log(f"Skipping already processed video: {video_data.unique_id}")
-            continue
+    Args:
+        indexed_rows: Iterator of (row index (0-based), row) pairs in ascending order
+        logger: Logger for output
+        progress_tracker: Progress tracking service
+        video_processor: Video processing service
+        max_concurrent: Maximum number of videos processed at once
+        total_rows: Total number of rows for progress messages, if known
+        rate_limiter: Optional quota bucket each upload draws from before starting
 
-        # Process the video
-        logger.log(f"Processing video {i + 1}/{len(rows)}: {video_data.unique_id}")
+    Returns:
+        Number of rows read from ``indexed_rows``
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    # Videos running plus the same number waiting with their metadata prefetched
+    lookahead = asyncio.Semaphore(2 * max(1, max_concurrent))
+    watermark = _RowWatermark()
+    tasks: List["asyncio.Future[None]"] = []
+    rows_read = 0
 
+    async def process_one(i: int, video_data: VideoData) -> None:
+        # The lookahead slot was taken before this row was read
         try:
-            youtube_id = video_processor.process_video(video_data)
-            
-            logger.log(
-                f"Successfully uploaded: {video_data.unique_id} -> YouTube ID: {youtube_id}"
-            )
-            
-            progress_tracker.mark_video_processed(video_data.unique_id)
-            progress_tracker.update_last_processed_row(i + 1)
-            
-        except Exception as e:
-            error_message = str(e)
-            logger.error(f"Failed to process {video_data.unique_id}: {error_message}")
-            progress_tracker.mark_video_failed(video_data.unique_id, error_message)
-
-        # Rate limiting delay (2 seconds between videos)
-        await asyncio.sleep(2)
\ No newline at end of file
+            # Fetch Drive metadata while earlier videos are still transferring
+            await loop.run_in_executor(None, video_processor.prefetch, video_data)
+            await upload_one(i, video_data)
+        finally:
+            lookahead.release()
+
+    async def upload_one(i: int, video_data: VideoData) -> None:
+        async with semaphore:
+            try:
+                if rate_limiter:
+                    await rate_limiter.acquire(UPLOAD_QUOTA_COST)
+
+                position = f"{i + 1}/{total_rows}" if total_rows is not None else f"{i + 1}"
+                logger.log(f"Processing video {position}: {video_data.unique_id}")
+
+                # process_video blocks on network I/O, so run it off the event loop
+                youtube_id = await loop.run_in_executor(
+                    None, video_processor.process_video, video_data
+                )
+
+                logger.log(
+                    f"Successfully uploaded: {video_data.unique_id} -> YouTube ID: {youtube_id}"
+                )
+
+                progress_tracker.mark_video_processed(video_data.unique_id)
+                last_row = watermark.finish(i)
+                if last_row is not None:
+                    progress_tracker.update_last_processed_row(last_row)
+
+            except Exception as e:
+                error_message = str(e)
+                logger.error(f"Failed to process {video_data.unique_id}: {error_message}")
+                progress_tracker.mark_video_failed(video_data.unique_id, error_message)
+                watermark.finish(i)
+
+    try:
+        while True:
+            # Wait for a free slot before reading, so rows are not pulled
+            # faster than videos finish
+            await lookahead.acquire()
+            scheduled = False
+            try:
+                # Fetching the next row may block on a page request
+                item = await loop.run_in_executor(None, next, indexed_rows, None)
+                if item is None:
+                    break
+
+                rows_read += 1
+                i, row = item
+                video_data = _parse_pending_video(i, row, logger, progress_tracker)
+                if video_data is None:
+                    continue
+
+                # Fail bad links up front instead of spending a slot and quota on them
+                if extract_file_id_from_drive_link(video_data.drive_link) is None:
+                    error_message = "Invalid Google Drive link"
+                    logger.error(f"Failed to process {video_data.unique_id}: {error_message}")
+                    progress_tracker.mark_video_failed(video_data.unique_id, error_message)
+                    continue
+
+                watermark.add(i)
+                tasks.append(asyncio.ensure_future(process_one(i, video_data)))
+                scheduled = True
+            finally:
+                if not scheduled:
+                    lookahead.release()
+    finally:
+        # Let videos already started finish even if reading further rows failed
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    return rows_read
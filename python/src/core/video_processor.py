@@ -1,16 +1,27 @@
 """Video processor for downloading and uploading individual videos."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from interfaces import IFileOperations, IGoogleDriveService, IYouTubeService
 from models import Config, VideoData
+from services.media_pipe import MediaPipe, PipeMediaUpload
 from utils.drive_utils import extract_file_id_from_drive_link
 
 
 class VideoProcessor:
     """Processes individual videos: download from Drive, upload to YouTube."""
 
+    __slots__ = (
+        "drive_service",
+        "youtube_service",
+        "file_operations",
+        "config",
+        "_download_executor",
+        "_cleanup_executor",
+    )
+
     def __init__(
         self,
         drive_service: IGoogleDriveService,
@@ -31,6 +42,14 @@ class VideoProcessor:
         self.youtube_service = youtube_service
         self.file_operations = file_operations
         self.config = config
+        # Pipelined downloads run on long-lived threads so each keeps its
+        # thread-local keep-alive connection to Drive between videos
+        self._download_executor = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_uploads, thread_name_prefix="download"
+        )
+        # Deleting a multi-GB temp file can take a while, so it happens in the
+        # background and the worker moves on to the next video
+        self._cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cleanup")
 
     def process_video(
         self,
@@ -56,7 +75,11 @@ class VideoProcessor:
         if not file_id:
             raise ValueError("Invalid Google Drive link")
 
-        # Ensure temp directory exists
+        if self.config.enable_pipeline:
+            return self._process_video_pipelined(file_id, video_data, progress_callback)
+
+        # Ensure temp directory exists; FileOperations skips directories it
+        # has already created
         self.file_operations.mkdir(self.config.temp_dir, exist_ok=True)
 
         # Create temp file path
@@ -77,8 +100,76 @@ class VideoProcessor:
 
         finally:
             # Clean up temp file
+            self._cleanup_executor.submit(self._remove_temp_file, temp_video_path)
+
+    def close(self) -> None:
+        """Wait for background downloads and temp file cleanup to finish."""
+        self._download_executor.shutdown(wait=True)
+        self._cleanup_executor.shutdown(wait=True)
+
+    def prefetch(self, video_data: VideoData) -> None:
+        """
+        Fetch a video's Drive metadata before it is processed.
+
+        Best effort: failures are ignored and surface again in process_video.
+
+        Args:
+            video_data: Video metadata
+        """
+        file_id = extract_file_id_from_drive_link(video_data.drive_link)
+        if not file_id:
+            return
+
+        try:
+            self.drive_service.prefetch_metadata(file_id)
+        except Exception:
+            pass
+
+    def _remove_temp_file(self, path: str) -> None:
+        """Delete a temp file, ignoring one that is already gone."""
+        try:
+            self.file_operations.unlink(path)
+        except FileNotFoundError:
+            # File already removed, no problem
+            pass
+
+    def _process_video_pipelined(
+        self,
+        file_id: str,
+        video_data: VideoData,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> str:
+        """
+        Stream the Drive download straight into the YouTube upload.
+
+        The download runs on a pooled thread and feeds a bounded MediaPipe, so
+        both transfers overlap and nothing is written to the temp directory.
+
+        Args:
+            file_id: Google Drive file ID
+            video_data: Video metadata
+            progress_callback: Optional callback for upload progress updates
+
+        Returns:
+            YouTube video ID of uploaded video
+        """
+        pipe = MediaPipe()
+
+        def download() -> None:
             try:
-                self.file_operations.unlink(temp_video_path)
-            except FileNotFoundError:
-                # File already removed, no problem
-                pass
\ No newline at end of file
+                self.drive_service.download_to_stream(file_id, pipe)
+            except Exception as e:
+                pipe.finish(e)
+            else:
+                pipe.finish()
+
+        download_future = self._download_executor.submit(download)
+
+        try:
+            return self.youtube_service.upload_stream(
+                PipeMediaUpload(pipe), video_data, progress_callback=progress_callback
+            )
+        finally:
+            # Unblock the download if the upload stopped reading early
+            pipe.abort()
+            download_future.result()
@@ -1,7 +1,6 @@
 """Main orchestrator for bulk YouTube uploads."""
 
 import asyncio
-from typing import List
 
 from interfaces import (
     IAuthenticationService,
@@ -11,7 +10,8 @@ from interfaces import (
 )
 from models import Config
 
-from .spreadsheet_processor import process_video_rows
+from .rate_limiter import TokenBucket
+from .spreadsheet_processor import process_indexed_rows
 from .video_processor import VideoProcessor
 
 
@@ -44,6 +44,7 @@ class YouTubeBulkUploader:
         self.progress_tracker = progress_tracker
         self.logger = logger
         self.config = config
+        self.rate_limiter = TokenBucket(config.quota_units_per_second, config.quota_burst_units)
 
     async def initialize(self) -> None:
         """Initialize authentication."""
@@ -57,26 +58,37 @@ class YouTubeBulkUploader:
             Exception: If fatal error occurs
         """
         try:
-            # Fetch spreadsheet data
-            rows = await self._fetch_spreadsheet_rows()
-
-            if len(rows) == 0:
-                self.logger.log("No data found in spreadsheet")
-                return
-
             # Get current progress to determine start position
             progress = self.progress_tracker.get_progress()
             start_row = max(1, progress.last_processed_row)
 
-            # Process videos
-            await process_video_rows(
-                rows=rows,
+            # Rows are fetched a page at a time while earlier videos upload
+            rows = self.sheets_service.iter_spreadsheet_rows(
+                self.config.spreadsheet_id,
+                self.config.sheet_range,
                 start_row=start_row,
-                logger=self.logger,
-                progress_tracker=self.progress_tracker,
-                video_processor=self.video_processor,
             )
 
+            # Process videos, saving batched progress even if interrupted
+            try:
+                rows_read = await process_indexed_rows(
+                    rows,
+                    logger=self.logger,
+                    progress_tracker=self.progress_tracker,
+                    video_processor=self.video_processor,
+                    max_concurrent=self.config.max_concurrent_uploads,
+                    rate_limiter=self.rate_limiter,
+                )
+            finally:
+                self.progress_tracker.flush()
+
+            # Nothing after the resume point is not the same as an empty sheet
+            if rows_read == 0 and not await asyncio.get_running_loop().run_in_executor(
+                None, self._sheet_has_rows
+            ):
+                self.logger.log("No data found in spreadsheet")
+                return
+
             # Log final statistics
             self._log_final_stats()
 
@@ -85,32 +97,32 @@ class YouTubeBulkUploader:
             self.logger.error(f"Fatal error: {error_message}")
             raise
 
+        finally:
+            self.logger.flush()
+
     async def retry_failed_uploads(self) -> None:
         """Retry all failed uploads by clearing them from processed list."""
         progress = self.progress_tracker.get_progress()
         failed_uploads = list(progress.failed_uploads)
 
-        # Clear failed uploads list
-        progress.failed_uploads = []
-        self.progress_tracker.save_progress(progress)
-
         self.logger.log(f"Retrying {len(failed_uploads)} failed uploads...")
 
-        # Remove failed videos from processed list so they can be retried
-        for failed in failed_uploads:
-            progress.processed_ids.discard(failed.unique_id)
+        # Clear failed uploads and remove them from the processed list so they
+        # can be retried, then save both changes at once
+        progress.failed_uploads = []
+        progress.processed_ids.difference_update(failed.unique_id for failed in failed_uploads)
 
         self.progress_tracker.save_progress(progress)
 
         # Re-process the spreadsheet - it will skip successful uploads and retry failed ones
         await self.process_spreadsheet()
 
-    async def _fetch_spreadsheet_rows(self) -> List[List[str]]:
-        """Fetch rows from configured spreadsheet."""
-        return self.sheets_service.fetch_spreadsheet_data(
-            self.config.spreadsheet_id,
-            self.config.sheet_range
+    def _sheet_has_rows(self) -> bool:
+        """Check whether the sheet has any rows at all, fetching only the first."""
+        rows = self.sheets_service.iter_spreadsheet_rows(
+            self.config.spreadsheet_id, self.config.sheet_range, start_row=0, page_size=1
         )
+        return next(rows, None) is not None
 
     def _log_final_stats(self) -> None:
         """Log final upload statistics."""
@@ -1,13 +1,13 @@
 """Service interfaces (Protocols) for dependency injection."""
 
 from abc import abstractmethod
-from io import BufferedReader, BufferedWriter
+from io import BufferedReader, BufferedWriter, RawIOBase
 from os import PathLike, stat_result
-from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, Union
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import Resource
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaIoBaseDownload, MediaUpload
 
 from models import AuthTokens, UploadProgress, VideoData
 
@@ -88,6 +88,22 @@ class ILogger(Protocol):
         """
         ...
 
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Write any buffered messages to the log file.
+        
+        Implementations may buffer informational messages. Errors and
+        warnings should be written straight away.
+        
+        Example:
+            >>> try:
+            ...     process_videos(logger)
+            ... finally:
+            ...     logger.flush()
+        """
+        ...
+
 
 class IFileOperations(Protocol):
     """
@@ -137,6 +153,31 @@ class IFileOperations(Protocol):
         """
         ...
 
+    @abstractmethod
+    def read_json(self, path: Union[str, PathLike[str]]) -> Any:
+        """
+        Read and parse a JSON file.
+        
+        Parses the raw bytes directly, without first decoding the whole file
+        into a string. Use this rather than read_file() plus json.loads().
+        
+        Args:
+            path: Path to the JSON file. Can be string or Path object.
+        
+        Returns:
+            The parsed JSON value, typically a dict.
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            PermissionError: If the file can't be read due to permissions.
+            ValueError: If the file is not valid JSON.
+        
+        Example:
+            >>> tokens = file_ops.read_json("tokens.json")
+            >>> print(tokens["token_type"])
+        """
+        ...
+
     @abstractmethod
     def write_file(self, path: Union[str, PathLike[str]], content: str) -> None:
         """
@@ -190,6 +231,26 @@ class IFileOperations(Protocol):
         """
         ...
 
+    @abstractmethod
+    def flush(self, path: Union[str, PathLike[str]]) -> None:
+        """
+        Force content appended to a file so far onto disk.
+        
+        append_file() content survives the process crashing but not a power
+        loss. Call this at checkpoints where appended data must be durable,
+        rather than paying for a disk sync on every append. Does nothing if
+        nothing has been appended to the file.
+        
+        Args:
+            path: Path to a file previously passed to append_file().
+        
+        Example:
+            >>> for entry in batch:
+            ...     file_ops.append_file("journal.wal", entry)
+            >>> file_ops.flush("journal.wal")
+        """
+        ...
+
     @abstractmethod
     def exists(self, path: Union[str, PathLike[str]]) -> bool:
         """Check if file/directory exists."""
@@ -220,6 +281,29 @@ class IFileOperations(Protocol):
         """Get file statistics."""
         ...
 
+    @abstractmethod
+    def try_stat(self, path: Union[str, PathLike[str]]) -> Optional[stat_result]:
+        """
+        Get file statistics, or None if the path doesn't exist.
+        
+        Replaces an exists() check followed by stat() with a single call.
+        
+        Args:
+            path: Path to the file or directory.
+        
+        Returns:
+            File statistics, or None if nothing exists at the path.
+        
+        Raises:
+            PermissionError: If the path can't be accessed.
+        
+        Example:
+            >>> file_stat = file_ops.try_stat("/tmp/video.mp4")
+            >>> if file_stat is not None and file_stat.st_size == expected_size:
+            ...     print("Already downloaded")
+        """
+        ...
+
 
 class IAuthenticationService(Protocol):
     """
@@ -467,6 +551,56 @@ class IGoogleDriveService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def download_to_stream(
+        self,
+        file_id: str,
+        stream: Union[BufferedWriter, RawIOBase],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """
+        Downloads a file from Google Drive into a writable stream.
+        
+        Used to stream a video straight into an upload without writing it to
+        disk. The stream is not closed when the download ends.
+        
+        Args:
+            file_id: Google Drive file ID.
+            stream: Writable stream receiving the file contents, such as a MediaPipe.
+            progress_callback: Optional callback for download progress.
+                             Called with (bytes_downloaded, total_bytes).
+        
+        Raises:
+            FileNotFoundError: If the Drive file doesn't exist.
+            PermissionError: If the file isn't accessible.
+            IOError: If the download fails or the stream is closed.
+        
+        Example:
+            >>> pipe = MediaPipe()
+            >>> drive_service.download_to_stream("1ABC123def456", pipe)
+        """
+        ...
+
+    @abstractmethod
+    def prefetch_metadata(self, file_id: str) -> None:
+        """
+        Fetch a file's metadata ahead of its download.
+        
+        Lets the metadata request for an upcoming video overlap with the
+        transfer of the current one. Implementations without a metadata
+        cache may do nothing.
+        
+        Args:
+            file_id: Google Drive file ID.
+        
+        Raises:
+            Exception: If the metadata request fails.
+        
+        Example:
+            >>> drive_service.prefetch_metadata("1ABC123def456")
+        """
+        ...
+
 
 class IGoogleSheetsService(Protocol):
     """
@@ -537,6 +671,42 @@ class IGoogleSheetsService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def iter_spreadsheet_rows(
+        self,
+        spreadsheet_id: str,
+        range: str,
+        start_row: int = 0,
+        page_size: int = 500,
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields rows from a Google Sheets range, fetching them a page at a time.
+        
+        Lets callers start processing the first rows of a large sheet before
+        the rest has been fetched. Rows are read until an empty page is returned.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Sheets document.
+            range: A1 notation range. Column-only ranges such as "Sheet1!A:E"
+                   are paged; ranges with row bounds are fetched in one request.
+            start_row: Row index to start from (0-based).
+            page_size: Number of rows fetched per request.
+        
+        Yields:
+            Tuples of (row index (0-based), row cell values).
+        
+        Raises:
+            PermissionError: If the spreadsheet isn't accessible.
+            ValueError: If the range is invalid.
+        
+        Example:
+            >>> for index, row in sheets_service.iter_spreadsheet_rows(
+            ...     spreadsheet_id, "Videos!A:E", start_row=1
+            ... ):
+            ...     print(f"Row {index + 1}: {row[1]}")
+        """
+        ...
+
 
 class IProgressTracker(Protocol):
     """
@@ -546,8 +716,9 @@ class IProgressTracker(Protocol):
     uploads, failures, and current position in the spreadsheet. Essential for
     handling large batches and recovering from interruptions.
     
-    Progress is saved after each video to minimize re-processing. Failed uploads
-    are tracked separately to enable targeted retries.
+    Each change is appended to a journal straight away, so nothing is lost on a
+    crash, while the full progress file is only rewritten in batches. Failed
+    uploads are tracked separately to enable targeted retries.
     
     Example:
         >>> tracker: IProgressTracker = ProgressTracker(file_ops, "progress.json")
@@ -609,12 +780,28 @@ class IProgressTracker(Protocol):
         """
         ...
 
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Persist any changes not yet saved.
+        
+        Implementations may batch saves from the mark and update methods.
+        Call this when processing stops so no progress is lost.
+        
+        Example:
+            >>> try:
+            ...     process_videos(tracker)
+            ... finally:
+            ...     tracker.flush()
+        """
+        ...
+
     @abstractmethod
     def mark_video_processed(self, unique_id: str) -> None:
         """
         Mark a video as successfully uploaded.
         
-        Adds the video ID to the processed set and saves progress.
+        Adds the video ID to the processed set and records the change.
         Prevents duplicate uploads when resuming.
         
         Args:
@@ -652,6 +839,42 @@ class IProgressTracker(Protocol):
         """
         ...
 
+    @abstractmethod
+    def mark_videos_processed(self, unique_ids: Iterable[str]) -> None:
+        """
+        Mark several videos as successfully uploaded at once.
+        
+        Equivalent to calling mark_video_processed() for each ID, but the
+        changes are recorded together, so draining a batch of completions
+        costs one write instead of one per video.
+        
+        Args:
+            unique_ids: The unique identifiers of the processed videos.
+        
+        Example:
+            >>> tracker.mark_videos_processed(["video_1", "video_2", "video_3"])
+        """
+        ...
+
+    @abstractmethod
+    def mark_videos_failed(self, failures: Iterable[Tuple[str, str]]) -> None:
+        """
+        Record several failed upload attempts at once.
+        
+        Equivalent to calling mark_video_failed() for each pair, with the
+        changes recorded together.
+        
+        Args:
+            failures: (unique_id, error) pairs for the failed videos.
+        
+        Example:
+            >>> tracker.mark_videos_failed([
+            ...     ("video_1", "Quota exceeded"),
+            ...     ("video_2", "Invalid Google Drive link"),
+            ... ])
+        """
+        ...
+
     @abstractmethod
     def update_last_processed_row(self, row_number: int) -> None:
         """
@@ -826,6 +1049,38 @@ class IYouTubeService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def upload_stream(
+        self,
+        media: MediaUpload,
+        video_data: VideoData,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
+        """
+        Upload a video to YouTube from a resumable media body.
+        
+        Used when the video is streamed rather than read from a local file.
+        The media size may be unknown until the last chunk is sent.
+        
+        Args:
+            media: Resumable media body, such as a PipeMediaUpload.
+            video_data: Metadata for the video.
+            progress_callback: Optional callback for upload progress.
+                              Called with (bytes_uploaded, total_bytes), where
+                              total_bytes is 0 if the size is not known.
+        
+        Returns:
+            The YouTube video ID of the uploaded video.
+        
+        Raises:
+            NetworkError: If upload fails after retries.
+        
+        Example:
+            >>> pipe = MediaPipe()
+            >>> video_id = youtube_service.upload_stream(PipeMediaUpload(pipe), video_data)
+        """
+        ...
+
 
 __all__ = [
     "ILogger",
@@ -131,11 +131,19 @@ def build_config_from_args(args: argparse.Namespace) -> Config:
 async def main() -> None:
     """Main application entry point."""
     args = parse_arguments()
+    container: Optional[DependencyContainer] = None
     
     try:
         # Build configuration
         config = build_config_from_args(args)
         
+        # Clear progress if not resuming, before the progress tracker loads it
+        if not args.retry_failed and not args.resume:
+            for path in (config.progress_file, config.progress_journal_file):
+                if os.path.exists(path):
+                    print(f"Clearing previous progress from {path}")
+                    os.remove(path)
+
         # Create dependency container
         container = DependencyContainer(config)
         
@@ -151,11 +159,6 @@ async def main() -> None:
             print("Retrying failed uploads...")
             await uploader.retry_failed_uploads()
         else:
-            # Clear progress if not resuming
-            if not args.resume and os.path.exists(config.progress_file):
-                print(f"Clearing previous progress from {config.progress_file}")
-                os.remove(config.progress_file)
-            
             print(f"Processing spreadsheet: {config.spreadsheet_id}")
             print(f"Range: {config.sheet_range}")
             await uploader.process_spreadsheet()
@@ -168,6 +171,9 @@ async def main() -> None:
     except Exception as e:
         print_user_friendly_error(e)
         sys.exit(1)
+    finally:
+        if container is not None:
+            container.close()
 
 
 def cli() -> None:
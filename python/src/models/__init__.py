@@ -4,11 +4,17 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional, Set
 
+# YouTube Data API quota cost of a videos.insert call
+UPLOAD_QUOTA_COST = 1600
+
 
 @dataclass
 class VideoData:
     """Represents metadata for a single video to be uploaded."""
 
+    # One instance exists per pending row, so skip the per-instance __dict__
+    __slots__ = ("drive_link", "title", "description", "tags", "unique_id")
+
     drive_link: str
     title: str
     description: str
@@ -52,7 +58,8 @@ class UploadProgress:
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            "processed_ids": list(self.processed_ids),
+            # Sorted so the saved file does not change with set iteration order
+            "processed_ids": sorted(self.processed_ids),
             "last_processed_row": self.last_processed_row,
             "failed_uploads": [
                 {
@@ -87,6 +94,17 @@ class Config:
     log_file: str = "upload.log"
     token_file: str = "token.json"
     temp_dir: str = "./temp"
+    http_cache_dir: str = ".http_cache"
+    drive_metadata_cache: str = ".drive_metadata.sqlite3"
+    # Stream each Drive download straight into its upload; False downloads to temp_dir first
+    enable_pipeline: bool = True
+    # YouTube quota budget; an upload costs UPLOAD_QUOTA_COST (1600) units, so the
+    # defaults start one upload every 2 seconds with bursts of up to four
+    quota_units_per_second: float = 800.0
+    quota_burst_units: int = 6400
+    max_concurrent_uploads: int = 2
+    # Bytes per Drive range request; each chunk is held in memory while written
+    download_chunk_size: int = 16 * 1024 * 1024
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -99,6 +117,21 @@ class Config:
         for field_name, value in required_fields:
             if not value:
                 raise ValueError(f"{field_name} cannot be empty")
+        if self.max_concurrent_uploads < 1:
+            raise ValueError("max_concurrent_uploads must be at least 1")
+        if self.download_chunk_size < 1:
+            raise ValueError("download_chunk_size must be positive")
+        if self.quota_units_per_second <= 0:
+            raise ValueError("quota_units_per_second must be positive")
+        if self.quota_burst_units < UPLOAD_QUOTA_COST:
+            raise ValueError(
+                f"quota_burst_units must be at least the upload cost of {UPLOAD_QUOTA_COST}"
+            )
+
+    @property
+    def progress_journal_file(self) -> str:
+        """Path of the append-only journal kept next to the progress file."""
+        return f"{self.progress_file}.wal"
 
 
 @dataclass
@@ -138,6 +171,7 @@ class AuthTokens:
 
 
 __all__ = [
+    "UPLOAD_QUOTA_COST",
     "VideoData",
     "FailedUpload",
     "UploadProgress",
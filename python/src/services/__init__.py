@@ -1,18 +1,22 @@
 """Service implementations for YouTube Bulk Upload."""
 
 from services.authentication import AuthenticationService
+from services.drive_metadata_cache import DriveMetadataCache
 from services.file_operations import FileOperations
 from services.google_drive import GoogleDriveService
 from services.google_sheets import GoogleSheetsService
+from services.http_transport import HttpTransport
 from services.logger import Logger
 from services.progress_tracker import ProgressTracker
 from services.youtube import YouTubeService
 
 __all__ = [
     "AuthenticationService",
+    "DriveMetadataCache",
     "FileOperations",
     "GoogleDriveService",
     "GoogleSheetsService",
+    "HttpTransport",
     "Logger",
     "ProgressTracker",
     "YouTubeService",
@@ -1,8 +1,9 @@
 """OAuth2 authentication service for Google APIs."""
 
-import json
+from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
@@ -10,6 +11,28 @@ from google_auth_oauthlib.flow import Flow
 from interfaces import IAuthenticationService, IFileOperations, ILogger
 from models import AuthTokens, Config
 
+SCOPES = (
+    "https://www.googleapis.com/auth/youtube.upload",
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly",
+)
+AUTH_URI = "https://accounts.google.com/o/oauth2/auth"
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+
+def _expiry_to_millis(expiry: Optional[datetime]) -> Optional[int]:
+    """Convert a google-auth expiry (naive UTC) to epoch milliseconds."""
+    if expiry is None:
+        return None
+    return int(expiry.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _expiry_from_millis(expiry_date: Optional[int]) -> Optional[datetime]:
+    """Convert epoch milliseconds to the naive UTC expiry google-auth expects."""
+    if expiry_date is None:
+        return None
+    return datetime.fromtimestamp(expiry_date / 1000, tz=timezone.utc).replace(tzinfo=None)
+
 
 class AuthenticationService(IAuthenticationService):
     """OAuth2 authentication implementation for Google APIs."""
@@ -29,11 +52,7 @@ class AuthenticationService(IAuthenticationService):
         self.file_operations = file_operations
         self.logger = logger
         self.credentials: Optional[Credentials] = None
-        self.scopes = [
-            "https://www.googleapis.com/auth/youtube.upload",
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-            "https://www.googleapis.com/auth/drive.readonly",
-        ]
+        self.scopes = list(SCOPES)
 
     def initialize(self) -> Credentials:
         """
@@ -45,16 +64,23 @@ class AuthenticationService(IAuthenticationService):
         Raises:
             Exception: If authentication fails
         """
+        # Reuse credentials from an earlier call instead of reloading the token file
+        if self.credentials and self.credentials.valid:
+            return self.credentials
+
         saved_tokens = self.load_saved_tokens()
 
         if saved_tokens and saved_tokens.refresh_token:
             self.credentials = Credentials(
                 token=saved_tokens.access_token,
                 refresh_token=saved_tokens.refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
+                token_uri=TOKEN_URI,
                 client_id=self.config.client_id,
                 client_secret=self.config.client_secret,
                 scopes=self.scopes,
+                # Without the saved expiry a stale token looks valid, and every
+                # run would start with a rejected request before refreshing
+                expiry=_expiry_from_millis(saved_tokens.expiry_date),
             )
 
             # Refresh token if expired
@@ -100,9 +126,7 @@ class AuthenticationService(IAuthenticationService):
             refresh_token=credentials.refresh_token,
             scope=credentials.scopes[0] if credentials.scopes else None,
             token_type="Bearer",
-            expiry_date=int(credentials.expiry.timestamp() * 1000)
-            if credentials.expiry
-            else None,
+            expiry_date=_expiry_to_millis(credentials.expiry),
         )
 
     def save_tokens(self, tokens: AuthTokens) -> None:
@@ -112,8 +136,8 @@ class AuthenticationService(IAuthenticationService):
         Args:
             tokens: Authentication tokens to save
         """
-        token_data = tokens.to_dict()
-        self.file_operations.write_file(self.config.token_file, json.dumps(token_data, indent=2))
+        token_data = orjson.dumps(tokens.to_dict(), option=orjson.OPT_INDENT_2)
+        self.file_operations.write_file(self.config.token_file, token_data.decode("utf-8"))
 
     def load_saved_tokens(self) -> Optional[AuthTokens]:
         """
@@ -122,13 +146,11 @@ class AuthenticationService(IAuthenticationService):
         Returns:
             Saved authentication tokens or None if not found
         """
-        if not self.file_operations.exists(self.config.token_file):
-            return None
-
         try:
-            content = self.file_operations.read_file(self.config.token_file)
-            data = json.loads(content)
+            data = self.file_operations.read_json(self.config.token_file)
             return AuthTokens.from_dict(data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             self.logger.warn(f"Failed to load saved tokens: {e}")
             return None
@@ -158,8 +180,8 @@ class AuthenticationService(IAuthenticationService):
             "web": {
                 "client_id": self.config.client_id,
                 "client_secret": self.config.client_secret,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
+                "auth_uri": AUTH_URI,
+                "token_uri": TOKEN_URI,
             }
         }
 
@@ -188,10 +210,11 @@ class AuthenticationService(IAuthenticationService):
             self.credentials = Credentials(
                 token=tokens.access_token,
                 refresh_token=tokens.refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
+                token_uri=TOKEN_URI,
                 client_id=self.config.client_id,
                 client_secret=self.config.client_secret,
                 scopes=self.scopes,
+                expiry=_expiry_from_millis(tokens.expiry_date),
             )
         except Exception:
             # Don't set credentials on failure
@@ -207,8 +230,6 @@ class AuthenticationService(IAuthenticationService):
             refresh_token=self.credentials.refresh_token,
             scope=self.credentials.scopes[0] if self.credentials.scopes else None,
             token_type="Bearer",
-            expiry_date=int(self.credentials.expiry.timestamp() * 1000)
-            if self.credentials.expiry
-            else None,
+            expiry_date=_expiry_to_millis(self.credentials.expiry),
         )
         self.save_tokens(tokens)
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""SQLite cache of Google Drive file metadata."""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class DriveMetadataCache:
+    """
+    Least recently used cache of Drive file metadata, persisted in SQLite.
+
+    A retried or resumed video looks up the same file again, so its size, name
+    and checksum are kept between runs instead of being fetched from the API
+    every time. Entries expire after ``ttl`` seconds so a replaced file is
+    picked up, and only the ``max_entries`` most recently used are kept. Lookups
+    only read the database; their recency is kept in memory and written with the
+    next ``put`` or on ``close``. The connection is shared by worker threads
+    behind a lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 3600.0,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize metadata cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds after which a cached entry is fetched again
+            max_entries: Maximum number of files kept
+            clock: Wall clock returning seconds, so expiry works across runs
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Last use of entries looked up since recency was last written
+        self._used: Dict[str, float] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS drive_metadata ("
+                "file_id TEXT PRIMARY KEY, name TEXT, size INTEGER, md5 TEXT, "
+                "mime TEXT, fetched_at REAL, used_at REAL)"
+            )
+
+    def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached metadata.
+
+        Args:
+            file_id: Google Drive file ID
+
+        Returns:
+            Metadata with the Drive API field names, or None if missing or expired
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT name, size, md5, mime FROM drive_metadata "
+                "WHERE file_id = ? AND fetched_at > ?",
+                (file_id, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            self._used[file_id] = now
+
+        name, size, md5, mime = row
+        metadata: Dict[str, Any] = {"name": name, "size": str(size)}
+        if md5:
+            metadata["md5Checksum"] = md5
+        if mime:
+            metadata["mimeType"] = mime
+        return metadata
+
+    def put(self, file_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Store metadata fetched from the Drive API.
+
+        Args:
+            file_id: Google Drive file ID
+            metadata: Drive API file resource with size, name and optionally
+                md5Checksum and mimeType
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            self._write_used()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO drive_metadata VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    file_id,
+                    metadata.get("name", "unknown"),
+                    int(metadata.get("size", 0)),
+                    metadata.get("md5Checksum"),
+                    metadata.get("mimeType"),
+                    now,
+                    now,
+                ),
+            )
+            # Evict least recently used entries beyond the limit
+            self._connection.execute(
+                "DELETE FROM drive_metadata WHERE file_id NOT IN ("
+                "SELECT file_id FROM drive_metadata ORDER BY used_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def close(self) -> None:
+        """Write pending recency updates and close the database connection."""
+        with self._lock:
+            with self._connection:
+                self._write_used()
+            self._connection.close()
+
+    def _write_used(self) -> None:
+        """Write lookups since the last write; the caller must hold ``self._lock``."""
+        if self._used:
+            self._connection.executemany(
+                "UPDATE drive_metadata SET used_at = ? WHERE file_id = ?",
+                [(used_at, file_id) for file_id, used_at in self._used.items()],
+            )
+            self._used.clear()
@@ -1,17 +1,50 @@
 """File operations service implementation."""
 
+import mmap
 import os
-from io import BufferedReader, BufferedWriter
+import stat
+import tempfile
+import threading
+from io import BufferedReader, BufferedWriter, FileIO
 from os import PathLike, stat_result
-from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Set, Union
+
+import orjson
 
 from interfaces import IFileOperations
 
+# JSON files at least this large are parsed from a memory map instead of a copy
+MMAP_THRESHOLD = 1024 * 1024
+
+# Buffer size of video streams, so small reads and writes still reach the
+# kernel in large blocks; larger transfers bypass the buffer
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+def _advise_sequential(fd: int) -> None:
+    """Tell the kernel a file will be read once from start to end, where supported."""
+    # posix_fadvise is missing on Windows and macOS
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Advice is optional; some file systems reject it
+            pass
+
 
 class FileOperations(IFileOperations):
     """Implementation of file system operations."""
 
+    def __init__(self) -> None:
+        """Initialize file operations."""
+        # Directories this instance has created or confirmed, so the per-video
+        # mkdir of the temp directory does not hit the file system every time
+        self._known_dirs: Set[str] = set()
+        # Append-only descriptors kept open between appends, so each log flush
+        # or journal entry is a single write instead of open, write and close
+        self._append_fds: Dict[str, int] = {}
+        self._append_lock = threading.Lock()
+
     def read_file(self, path: Union[str, PathLike[str]]) -> str:
         """
         Read file contents synchronously.
@@ -29,27 +62,99 @@ class FileOperations(IFileOperations):
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
 
+    def read_json(self, path: Union[str, PathLike[str]]) -> Any:
+        """
+        Read and parse a JSON file.
+
+        Large files, such as the progress file of a big sheet, are parsed
+        straight from a read-only memory map of the page cache.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            Parsed JSON value
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file is not valid JSON
+        """
+        # orjson parses bytes directly, skipping the decode to str
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    # The map cannot close while a view of it is still open
+                    view.release()
+
     def write_file(self, path: Union[str, PathLike[str]], content: str) -> None:
         """
-        Write content to file.
+        Write content to file atomically.
+
+        Content goes to a temporary file in the same directory, which is synced
+        and then renamed over the target, so a crash never leaves a torn file.
 
         Args:
             path: Path to file
             content: Content to write
         """
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        directory = os.path.dirname(os.fspath(path)) or "."
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Keep the permissions of the file being replaced
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+
+            os.replace(temp_path, path)
+            # An open append descriptor would still point at the replaced file
+            self._close_append_fd(path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
     def append_file(self, path: Union[str, PathLike[str]], content: str) -> None:
         """
         Append to existing file.
 
+        The file is opened with O_APPEND on first use and kept open. Writes are
+        not buffered, so appended content is in the file as soon as this returns.
+
         Args:
             path: Path to file
             content: Content to append
         """
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(content)
+        data = memoryview(content.encode("utf-8"))
+        fd = self._get_append_fd(path)
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+
+    def flush(self, path: Union[str, PathLike[str]]) -> None:
+        """
+        Sync content appended to a file to disk.
+
+        Args:
+            path: Path to file
+        """
+        with self._append_lock:
+            fd = self._append_fds.get(os.fspath(path))
+            if fd is not None:
+                os.fsync(fd)
 
     def exists(self, path: Union[str, PathLike[str]]) -> bool:
         """
@@ -61,7 +166,7 @@ class FileOperations(IFileOperations):
         Returns:
             True if exists
         """
-        return Path(path).exists()
+        return self.try_stat(path) is not None
 
     def unlink(self, path: Union[str, PathLike[str]]) -> None:
         """
@@ -73,7 +178,8 @@ class FileOperations(IFileOperations):
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        Path(path).unlink()
+        self._close_append_fd(path)
+        os.unlink(path)
 
     def mkdir(self, path: Union[str, PathLike[str]], exist_ok: bool = False) -> None:
         """
@@ -83,19 +189,28 @@ class FileOperations(IFileOperations):
             path: Path to directory
             exist_ok: If True, don't raise if exists
         """
-        Path(path).mkdir(parents=True, exist_ok=exist_ok)
+        key = os.fspath(path)
+        if exist_ok and key in self._known_dirs:
+            return
+        os.makedirs(key, exist_ok=exist_ok)
+        self._known_dirs.add(key)
 
     def create_read_stream(self, path: Union[str, PathLike[str]]) -> BufferedReader:
         """
         Create readable stream.
 
+        Streams are used to read whole videos, so the kernel is asked for
+        aggressive read-ahead.
+
         Args:
             path: Path to file
 
         Returns:
             Buffered reader
         """
-        return open(path, "rb")
+        stream = BufferedReader(FileIO(path, "rb"), buffer_size=STREAM_BUFFER_SIZE)
+        _advise_sequential(stream.fileno())
+        return stream
 
     def create_write_stream(self, path: Union[str, PathLike[str]]) -> BufferedWriter:
         """
@@ -107,7 +222,7 @@ class FileOperations(IFileOperations):
         Returns:
             Buffered writer
         """
-        return open(path, "wb")
+        return BufferedWriter(FileIO(path, "wb"), buffer_size=STREAM_BUFFER_SIZE)
 
     def stat(self, path: Union[str, PathLike[str]]) -> stat_result:
         """
@@ -120,3 +235,43 @@ class FileOperations(IFileOperations):
             File statistics
         """
         return os.stat(path)
+
+    def try_stat(self, path: Union[str, PathLike[str]]) -> Optional[stat_result]:
+        """
+        Get file statistics if the path exists.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            File statistics, or None if the path doesn't exist
+        """
+        try:
+            return os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def close(self) -> None:
+        """Close file descriptors kept open for appending."""
+        with self._append_lock:
+            fds = list(self._append_fds.values())
+            self._append_fds.clear()
+        for fd in fds:
+            os.close(fd)
+
+    def _get_append_fd(self, path: Union[str, PathLike[str]]) -> int:
+        """Get the open append descriptor for path, opening it on first use."""
+        key = os.fspath(path)
+        with self._append_lock:
+            fd = self._append_fds.get(key)
+            if fd is None:
+                fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+                self._append_fds[key] = fd
+            return fd
+
+    def _close_append_fd(self, path: Union[str, PathLike[str]]) -> None:
+        """Close the append descriptor for path, if one is open."""
+        with self._append_lock:
+            fd = self._append_fds.pop(os.fspath(path), None)
+        if fd is not None:
+            os.close(fd)
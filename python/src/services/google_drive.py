@@ -1,12 +1,25 @@
 """Google Drive service implementation."""
 
-from typing import Callable, Optional
+import hashlib
+from io import BufferedWriter, RawIOBase
+from typing import Any, Callable, Dict, Optional, Union
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
 from interfaces import IFileOperations, IGoogleDriveService, ILogger
+from services.drive_metadata_cache import DriveMetadataCache
+from services.http_transport import HttpTransport
+
+# Each chunk is held in memory before it is written, so keep it bounded while
+# still large enough that a multi-GB video needs few range requests
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+METADATA_FIELDS = "size,name,md5Checksum,mimeType"
+
+# Read size when checksumming an existing download
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class GoogleDriveService(IGoogleDriveService):
@@ -17,6 +30,10 @@ class GoogleDriveService(IGoogleDriveService):
         credentials: Credentials,
         file_operations: IFileOperations,
         logger: ILogger,
+        http_transport: Optional[HttpTransport] = None,
+        max_retries: int = 5,
+        metadata_cache: Optional[DriveMetadataCache] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
     ) -> None:
         """
         Initialize Google Drive service.
@@ -25,10 +42,20 @@ class GoogleDriveService(IGoogleDriveService):
             credentials: Authenticated Google credentials
             file_operations: File operations service
             logger: Logger service
+            http_transport: Optional shared transport to reuse connections across clients
+            max_retries: Retries per chunk on transient errors, with exponential backoff
+            metadata_cache: Optional cache of file metadata, saving a lookup per retried file
+            chunk_size: Bytes fetched per range request
         """
-        self.service = build("drive", "v3", credentials=credentials)
+        if http_transport:
+            self.service = build("drive", "v3", **http_transport.build_kwargs())
+        else:
+            self.service = build("drive", "v3", credentials=credentials)
         self.file_operations = file_operations
         self.logger = logger
+        self.max_retries = max_retries
+        self.metadata_cache = metadata_cache
+        self.chunk_size = chunk_size
 
     def download_file(
         self,
@@ -39,6 +66,9 @@ class GoogleDriveService(IGoogleDriveService):
         """
         Downloads file from Drive to local filesystem.
 
+        If a complete copy is already at ``destination_path``, for example left
+        by a run that stopped before uploading it, the download is skipped.
+
         Args:
             file_id: Google Drive file ID
             destination_path: Local path to save the file
@@ -48,28 +78,110 @@ class GoogleDriveService(IGoogleDriveService):
             Exception: If download fails
         """
         try:
-            # Get file metadata first to know the size
-            file_metadata = self.service.files().get(fileId=file_id, fields="size,name").execute()
-            file_size = int(file_metadata.get("size", 0))
-            file_name = file_metadata.get("name", "unknown")
-
-            self.logger.log(f"Downloading file: {file_name} ({file_size} bytes)")
+            metadata = self._get_metadata(file_id)
+            if self._is_downloaded(destination_path, metadata):
+                self.logger.log(f"Using existing download: {destination_path}")
+                return
 
-            # Download the file
-            request = self.service.files().get_media(fileId=file_id)
-            
             with self.file_operations.create_write_stream(destination_path) as fh:
-                downloader = MediaIoBaseDownload(fh, request)
-                
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
-                    if status and progress_callback:
-                        bytes_downloaded = int(status.resumable_progress)
-                        progress_callback(bytes_downloaded, file_size)
+                self._download_media(file_id, fh, metadata, progress_callback)
 
             self.logger.log(f"Downloaded file: {destination_path}")
 
         except Exception as e:
             self.logger.error(f"Error downloading file: {str(e)}")
-            raise Exception(f"Failed to download file {file_id}: {str(e)}") from e
\ No newline at end of file
+            raise Exception(f"Failed to download file {file_id}: {str(e)}") from e
+
+    def download_to_stream(
+        self,
+        file_id: str,
+        stream: Union[BufferedWriter, RawIOBase],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        """
+        Downloads file from Drive into a writable stream.
+
+        Args:
+            file_id: Google Drive file ID
+            stream: Writable stream receiving the file contents
+            progress_callback: Optional callback for progress updates (bytes_downloaded, total_bytes)
+
+        Raises:
+            Exception: If download fails
+        """
+        try:
+            metadata = self._get_metadata(file_id)
+            self._download_media(file_id, stream, metadata, progress_callback)
+            self.logger.log(f"Downloaded file: {file_id}")
+
+        except Exception as e:
+            self.logger.error(f"Error downloading file: {str(e)}")
+            raise Exception(f"Failed to download file {file_id}: {str(e)}") from e
+
+    def prefetch_metadata(self, file_id: str) -> None:
+        """
+        Fetch file metadata into the cache ahead of the download.
+
+        Does nothing without a metadata cache or if the metadata is already cached.
+
+        Args:
+            file_id: Google Drive file ID
+
+        Raises:
+            Exception: If the metadata request fails
+        """
+        if self.metadata_cache:
+            self._get_metadata(file_id)
+
+    def _get_metadata(self, file_id: str) -> Dict[str, Any]:
+        """Get file metadata from the cache, or from the API on a miss."""
+        if self.metadata_cache:
+            cached = self.metadata_cache.get(file_id)
+            if cached is not None:
+                return cached
+
+        metadata: Dict[str, Any] = (
+            self.service.files()
+            .get(fileId=file_id, fields=METADATA_FIELDS)
+            .execute(num_retries=self.max_retries)
+        )
+        if self.metadata_cache:
+            self.metadata_cache.put(file_id, metadata)
+        return metadata
+
+    def _is_downloaded(self, path: str, metadata: Dict[str, Any]) -> bool:
+        """Check whether path already holds the file, by size and MD5 checksum."""
+        expected_md5 = metadata.get("md5Checksum")
+        if not expected_md5:
+            return False
+        file_stat = self.file_operations.try_stat(path)
+        if file_stat is None or file_stat.st_size != int(metadata.get("size", 0)):
+            return False
+
+        md5 = hashlib.md5()
+        with self.file_operations.create_read_stream(path) as fh:
+            for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b""):
+                md5.update(chunk)
+        return md5.hexdigest() == str(expected_md5)
+
+    def _download_media(
+        self,
+        file_id: str,
+        fh: Union[BufferedWriter, RawIOBase],
+        metadata: Dict[str, Any],
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> None:
+        """Download the file into fh chunk by chunk."""
+        file_size = int(metadata.get("size", 0))
+        file_name = metadata.get("name", "unknown")
+        self.logger.log(f"Downloading file: {file_name} ({file_size} bytes)")
+
+        request = self.service.files().get_media(fileId=file_id)
+        downloader = MediaIoBaseDownload(fh, request, chunksize=self.chunk_size)
+
+        done = False
+        while not done:
+            status, done = downloader.next_chunk(num_retries=self.max_retries)
+            if status and progress_callback:
+                bytes_downloaded = int(status.resumable_progress)
+                progress_callback(bytes_downloaded, file_size)
@@ -1,24 +1,32 @@
 """Google Sheets service implementation."""
 
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 
 from interfaces import IGoogleSheetsService
+from services.http_transport import HttpTransport
+from utils.sheet_range import build_page_range
 
 
 class GoogleSheetsService(IGoogleSheetsService):
     """Google Sheets API operations implementation."""
 
-    def __init__(self, credentials: Credentials) -> None:
+    def __init__(
+        self, credentials: Credentials, http_transport: Optional[HttpTransport] = None
+    ) -> None:
         """
         Initialize Google Sheets service.
 
         Args:
             credentials: Authenticated Google credentials
+            http_transport: Optional shared transport to reuse connections across clients
         """
-        self.service = build("sheets", "v4", credentials=credentials)
+        if http_transport:
+            self.service = build("sheets", "v4", **http_transport.build_kwargs())
+        else:
+            self.service = build("sheets", "v4", credentials=credentials)
 
     def fetch_spreadsheet_data(self, spreadsheet_id: str, range: str) -> List[List[str]]:
         """
@@ -44,8 +52,59 @@ class GoogleSheetsService(IGoogleSheetsService):
             
             values = result.get("values", [])
             
-            # Ensure all values are strings
-            return [[str(cell) if cell is not None else "" for cell in row] for row in values]
+            # Formatted values are already strings, so only rows that are not are
+            # replaced and the response list is returned without copying
+            rows: List[List[str]] = values
+            for i, row in enumerate(values):
+                if not all(type(cell) is str for cell in row):
+                    rows[i] = [str(cell) if cell is not None else "" for cell in row]
+            return rows
             
         except Exception as e:
-            raise Exception(f"Failed to fetch spreadsheet data: {str(e)}") from e
\ No newline at end of file
+            raise Exception(f"Failed to fetch spreadsheet data: {str(e)}") from e
+
+    def iter_spreadsheet_rows(
+        self,
+        spreadsheet_id: str,
+        range: str,
+        start_row: int = 0,
+        page_size: int = 500,
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Yields rows from a spreadsheet range, fetching them a page at a time.
+
+        Column-only ranges such as "Sheet1!A:E" are read in blocks of
+        ``page_size`` rows until an empty block is returned, so callers can start
+        on the first rows before the rest of the sheet is fetched. Ranges with
+        explicit row bounds are fetched in one request.
+
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            range: A1 notation range (e.g., "Sheet1!A:E")
+            start_row: Row index to start from (0-based)
+            page_size: Number of rows fetched per request
+
+        Yields:
+            Tuples of (row index (0-based), row cell values)
+
+        Raises:
+            Exception: If API call fails
+        """
+        first_row = start_row + 1
+        page_range = build_page_range(range, first_row, first_row + page_size - 1)
+
+        if page_range is None:
+            rows = self.fetch_spreadsheet_data(spreadsheet_id, range)
+            yield from enumerate(rows[start_row:], start=start_row)
+            return
+
+        while page_range is not None:
+            rows = self.fetch_spreadsheet_data(spreadsheet_id, page_range)
+            if not rows:
+                return
+
+            for offset, row in enumerate(rows):
+                yield first_row - 1 + offset, row
+
+            first_row += page_size
+            page_range = build_page_range(range, first_row, first_row + page_size - 1)
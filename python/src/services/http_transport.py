@@ -0,0 +1,123 @@
+"""Shared HTTP transport for Google API clients."""
+
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+import httplib2
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import HttpRequest
+
+
+class MetadataFileCache(httplib2.FileCache):  # type: ignore[misc]
+    """
+    On-disk HTTP cache for small API responses such as Sheets values and Drive metadata.
+
+    httplib2 would otherwise cache every cacheable GET body, including media
+    downloads, so media requests and large bodies are never stored. Entries are
+    written atomically because several worker threads share the directory.
+    """
+
+    def __init__(self, cache_dir: str, max_entry_size: int = 1024 * 1024) -> None:
+        """
+        Initialize metadata cache.
+
+        Args:
+            cache_dir: Directory holding cached responses
+            max_entry_size: Largest cached response in bytes, headers included
+        """
+        super().__init__(cache_dir)
+        self.max_entry_size = max_entry_size
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a response unless it is a media download or too large.
+
+        Args:
+            key: Request cache key (normalized URI)
+            value: Serialized response headers and body
+        """
+        if "alt=media" in key or len(value) > self.max_entry_size:
+            return
+
+        fd, temp_path = tempfile.mkstemp(dir=self.cache)
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(temp_path, os.path.join(self.cache, self.safe(key)))
+
+
+class HttpTransport:
+    """
+    Keep-alive HTTP transport shared by the Sheets, Drive and YouTube clients.
+
+    httplib2 connections are not thread-safe, so each thread gets its own
+    AuthorizedHttp. Within a thread every API client reuses the same open
+    TLS connections instead of reconnecting per request. When a cache
+    directory is given, metadata responses are cached and revalidated with
+    ETags, so unchanged resources come back as 304 Not Modified.
+    """
+
+    def __init__(
+        self, credentials: Credentials, timeout: int = 60, cache_dir: Optional[str] = None
+    ) -> None:
+        """
+        Initialize HTTP transport.
+
+        Args:
+            credentials: Authenticated Google credentials
+            timeout: Socket timeout in seconds
+            cache_dir: Optional directory for the HTTP response cache
+        """
+        self.credentials = credentials
+        self.timeout = timeout
+        self.cache = MetadataFileCache(cache_dir) if cache_dir else None
+        self._local = threading.local()
+
+    def get_http(self) -> AuthorizedHttp:
+        """
+        Get the authorized HTTP client for the current thread.
+
+        Returns:
+            AuthorizedHttp bound to the calling thread
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=self._create_http())
+            self._local.http = http
+        return http
+
+    def build_request(self, http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+        """
+        Request builder for googleapiclient's ``build(requestBuilder=...)``.
+
+        Ignores the client's own transport and binds the request to the
+        calling thread's connection instead.
+
+        Returns:
+            HttpRequest using the current thread's transport
+        """
+        return HttpRequest(self.get_http(), *args, **kwargs)
+
+    def build_kwargs(self) -> Dict[str, Any]:
+        """
+        Keyword arguments for ``googleapiclient.discovery.build``.
+
+        Discovery documents are read from the copies bundled with the client
+        library, skipping the discovery cache lookup, so building a client never
+        needs a network round trip.
+
+        Returns:
+            Dictionary with transport and discovery options
+        """
+        return {
+            "http": self.get_http(),
+            "requestBuilder": self.build_request,
+            "static_discovery": True,
+            "cache_discovery": False,
+        }
+
+    def _create_http(self) -> httplib2.Http:
+        """Create the underlying httplib2 client."""
+        return httplib2.Http(cache=self.cache, timeout=self.timeout)
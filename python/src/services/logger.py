@@ -1,5 +1,9 @@
 """Logger service implementation."""
 
+import threading
+import time
+from typing import List
+
 from interfaces import IFileOperations, ILogger
 from utils.logging import create_log_message
 
@@ -7,16 +11,34 @@ from utils.logging import create_log_message
 class Logger(ILogger):
     """Logger implementation with console and file output."""
 
-    def __init__(self, file_operations: IFileOperations, log_file: str) -> None:
+    def __init__(
+        self,
+        file_operations: IFileOperations,
+        log_file: str,
+        flush_every: int = 1,
+        flush_interval: float = 0.0,
+    ) -> None:
         """
         Initialize logger.
 
+        Messages are printed straight away, but file writes can be batched:
+        buffered messages are appended once ``flush_every`` are pending or
+        ``flush_interval`` seconds have passed since the last write. Errors and
+        warnings are always written immediately.
+
         Args:
             file_operations: File operations service
             log_file: Path to log file
+            flush_every: Number of buffered messages that triggers a write
+            flush_interval: Seconds since the last write after which a message triggers a write
         """
         self.file_operations = file_operations
         self.log_file = log_file
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
 
     def log(self, message: str) -> None:
         """
@@ -28,8 +50,13 @@ class Logger(ILogger):
         formatted = create_log_message(message)
         # Print to console without newline (create_log_message adds it)
         print(formatted.rstrip())
-        # Append to log file
-        self.file_operations.append_file(self.log_file, formatted)
+        with self._lock:
+            self._buffer.append(formatted)
+            if (
+                len(self._buffer) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
 
     def error(self, message: str) -> None:
         """
@@ -39,6 +66,7 @@ class Logger(ILogger):
             message: Error message to log
         """
         self.log(f"ERROR: {message}")
+        self.flush()
 
     def warn(self, message: str) -> None:
         """
@@ -48,3 +76,16 @@ class Logger(ILogger):
             message: Warning message to log
         """
         self.log(f"WARN: {message}")
+        self.flush()
+
+    def flush(self) -> None:
+        """Append buffered messages to the log file, if any."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write the buffer out; the caller must hold ``self._lock``."""
+        if self._buffer:
+            self.file_operations.append_file(self.log_file, "".join(self._buffer))
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
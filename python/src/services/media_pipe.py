@@ -0,0 +1,200 @@
+"""In-memory pipe for streaming a Drive download straight into a YouTube upload."""
+
+import io
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+from googleapiclient.http import MediaUpload
+
+# Resumable upload chunks must be a multiple of 256 KiB
+UPLOAD_CHUNK_SIZE = 32 * 256 * 1024
+
+
+class MediaPipe(io.RawIOBase):
+    """
+    Bounded pipe between a download thread and an upload.
+
+    The download side writes into the pipe like a file and blocks once
+    ``max_bytes`` are queued, so a slow upload throttles the download instead
+    of buffering the whole video. The upload side reads byte ranges and keeps
+    everything the server has not acknowledged yet, so a resumed upload can
+    resend the bytes it lost.
+    """
+
+    def __init__(self, max_bytes: int = 2 * UPLOAD_CHUNK_SIZE) -> None:
+        """
+        Initialize media pipe.
+
+        Args:
+            max_bytes: Maximum number of written bytes queued for the upload side.
+                A single larger write is still accepted when nothing is queued.
+        """
+        super().__init__()
+        self._max_bytes = max_bytes
+        self._condition = threading.Condition()
+        self._pending: Deque[bytes] = deque()
+        self._pending_bytes = 0
+        self._finished = False
+        self._aborted = False
+        self._error: Optional[BaseException] = None
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._eof = False
+
+    def writable(self) -> bool:
+        """Pipe accepts writes from the download side."""
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """
+        Queue a downloaded buffer, blocking while the pipe is full.
+
+        Args:
+            data: Bytes received from the download
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            BrokenPipeError: If the upload side has given up
+        """
+        chunk = bytes(data)
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._aborted
+                or not self._pending
+                or self._pending_bytes + len(chunk) <= self._max_bytes
+            )
+            if self._aborted:
+                raise BrokenPipeError("Upload side of the media pipe was closed")
+            self._pending.append(chunk)
+            self._pending_bytes += len(chunk)
+            self._condition.notify_all()
+        return len(chunk)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        Signal the end of the download.
+
+        Args:
+            error: Download failure to raise on the upload side, if any
+        """
+        with self._condition:
+            self._finished = True
+            self._error = error
+            self._condition.notify_all()
+
+    def abort(self) -> None:
+        """Stop the upload side reading, unblocking a waiting download."""
+        with self._condition:
+            self._aborted = True
+            self._condition.notify_all()
+
+    def read_range(self, begin: int, length: int) -> bytes:
+        """
+        Read bytes for the next upload chunk.
+
+        Bytes before ``begin`` have been acknowledged by the server and are
+        released. Returns fewer than ``length`` bytes only at the end of the
+        download.
+
+        Args:
+            begin: Offset of the first byte to read
+            length: Number of bytes to read
+
+        Returns:
+            Bytes from ``begin`` onwards
+
+        Raises:
+            ValueError: If ``begin`` points before bytes already released
+            Exception: If the download failed, on this and every later read
+        """
+        if self._eof and self._error is not None:
+            raise self._error
+        if begin < self._buffer_start:
+            raise ValueError(f"Offset {begin} was already released from the pipe")
+
+        del self._buffer[: begin - self._buffer_start]
+        self._buffer_start = begin
+
+        while len(self._buffer) < length and not self._eof:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._finished)
+                if self._pending:
+                    while self._pending:
+                        self._buffer += self._pending.popleft()
+                    self._pending_bytes = 0
+                    self._condition.notify_all()
+                    continue
+                self._eof = True
+            if self._error is not None:
+                raise self._error
+
+        return bytes(self._buffer[:length])
+
+
+class PipeMediaUpload(MediaUpload):  # type: ignore[misc]
+    """
+    Resumable upload body read from a MediaPipe.
+
+    The total size is unknown until the download ends, so each chunk is sent
+    with an open-ended range and the final short chunk completes the upload.
+    """
+
+    def __init__(
+        self,
+        pipe: MediaPipe,
+        mimetype: str = "video/*",
+        chunksize: int = UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize pipe upload.
+
+        Args:
+            pipe: Pipe fed by the download
+            mimetype: Media MIME type
+            chunksize: Bytes sent per request, a multiple of 256 KiB
+
+        Raises:
+            ValueError: If chunksize is not a positive multiple of 256 KiB
+        """
+        if chunksize <= 0 or chunksize % (256 * 1024):
+            raise ValueError("chunksize must be a positive multiple of 256 KiB")
+        super().__init__()
+        self._pipe = pipe
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+
+    def chunksize(self) -> int:
+        """Chunk size for resumable uploads."""
+        return self._chunksize
+
+    def mimetype(self) -> str:
+        """Mime type of the body."""
+        return self._mimetype
+
+    def size(self) -> Optional[int]:
+        """Size of the upload, unknown while streaming."""
+        return None
+
+    def resumable(self) -> bool:
+        """Pipe uploads are always resumable."""
+        return True
+
+    def has_stream(self) -> bool:
+        """Chunks are read with getbytes rather than from a seekable stream."""
+        return False
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        """
+        Get bytes for the next chunk.
+
+        Args:
+            begin: Offset of the first byte
+            length: Number of bytes to read
+
+        Returns:
+            Bytes read from the pipe
+        """
+        return self._pipe.read_range(begin, length)
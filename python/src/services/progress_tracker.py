@@ -1,24 +1,63 @@
 """Progress tracker service implementation."""
 
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 from interfaces import IFileOperations, IProgressTracker
 from models import FailedUpload, UploadProgress
-from utils.progress_serializer import deserialize_progress, serialize_progress
+from utils.progress_serializer import (
+    apply_progress_events,
+    serialize_progress,
+    serialize_progress_event,
+)
 
 
 class ProgressTracker(IProgressTracker):
     """Progress tracking implementation with file persistence."""
 
-    def __init__(self, file_operations: IFileOperations, progress_file: str) -> None:
+    def __init__(
+        self,
+        file_operations: IFileOperations,
+        progress_file: str,
+        flush_every: int = 1,
+        flush_interval: float = 0.0,
+        journal_file: Optional[str] = None,
+        journal_sync_every: int = 0,
+    ) -> None:
         """
         Initialize progress tracker.
 
+        Every change rewrites the whole progress file, so changes can be batched:
+        the file is saved once ``flush_every`` changes are pending or
+        ``flush_interval`` seconds have passed since the last save, whichever
+        comes first. Call ``flush`` to save any remaining changes.
+
+        With a ``journal_file``, each change is also appended to the journal as
+        one line as soon as it happens, so batched changes survive a crash. The
+        journal is replayed on load and emptied whenever the progress file is
+        saved. Appends survive the process crashing; to also bound what a power
+        loss can lose, the journal is synced to disk every ``journal_sync_every``
+        changes that are not yet in a saved progress file.
+
         Args:
             file_operations: File operations service
             progress_file: Path to progress file
+            flush_every: Number of pending changes that triggers a save
+            flush_interval: Seconds since the last save after which a change triggers a save
+            journal_file: Optional path to an append-only journal of changes
+            journal_sync_every: Number of journaled changes between disk syncs of
+                the journal; 0 leaves syncing to the operating system
         """
         self.file_operations = file_operations
         self.progress_file = progress_file
+        self.journal_file = journal_file
+        self.journal_sync_every = journal_sync_every
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
         self.progress = self.load_progress()
+        self._pending_changes = 0
+        self._unsynced_changes = 0
+        self._last_flush = time.monotonic()
 
     def load_progress(self) -> UploadProgress:
         """
@@ -27,16 +66,27 @@ class ProgressTracker(IProgressTracker):
         Returns:
             Loaded progress or empty progress if file doesn't exist
         """
-        if not self.file_operations.exists(self.progress_file):
-            return UploadProgress()
-
+        # Read straight away rather than checking existence first, saving a stat
+        progress = UploadProgress()
         try:
-            content = self.file_operations.read_file(self.progress_file)
-            return deserialize_progress(content)
+            data = self.file_operations.read_json(self.progress_file)
+            progress = UploadProgress.from_dict(data)
+        except FileNotFoundError:
+            pass
         except Exception:
-            # Return empty progress on any error
+            # Return empty progress on any other error
             return UploadProgress()
 
+        if self.journal_file:
+            try:
+                journal = self.file_operations.read_file(self.journal_file)
+                progress = apply_progress_events(progress, journal)
+            except Exception:
+                # Keep the snapshot if the journal is missing or cannot be read
+                pass
+
+        return progress
+
     def save_progress(self, progress: UploadProgress) -> None:
         """
         Persist current progress.
@@ -46,6 +96,17 @@ class ProgressTracker(IProgressTracker):
         """
         serialized = serialize_progress(progress)
         self.file_operations.write_file(self.progress_file, serialized)
+        if self.journal_file:
+            # Everything journaled so far is now in the snapshot
+            self.file_operations.write_file(self.journal_file, "")
+        self._pending_changes = 0
+        self._unsynced_changes = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Persist pending changes, if any."""
+        if self._pending_changes:
+            self.save_progress(self.progress)
 
     def mark_video_processed(self, unique_id: str) -> None:
         """
@@ -54,8 +115,7 @@ class ProgressTracker(IProgressTracker):
         Args:
             unique_id: Video unique ID
         """
-        self.progress.processed_ids.add(unique_id)
-        self.save_progress(self.progress)
+        self.mark_videos_processed([unique_id])
 
     def mark_video_failed(self, unique_id: str, error: str) -> None:
         """
@@ -65,9 +125,34 @@ class ProgressTracker(IProgressTracker):
             unique_id: Video unique ID
             error: Error message
         """
-        failed = FailedUpload(unique_id=unique_id, error=error)
-        self.progress.failed_uploads.append(failed)
-        self.save_progress(self.progress)
+        self.mark_videos_failed([(unique_id, error)])
+
+    def mark_videos_processed(self, unique_ids: Iterable[str]) -> None:
+        """
+        Mark several videos as successfully uploaded, recording them together.
+
+        Args:
+            unique_ids: Video unique IDs
+        """
+        events = []
+        for unique_id in unique_ids:
+            self.progress.processed_ids.add(unique_id)
+            events.append({"processed": unique_id})
+        self._record_changes(events)
+
+    def mark_videos_failed(self, failures: Iterable[Tuple[str, str]]) -> None:
+        """
+        Record several failed upload attempts, recording them together.
+
+        Args:
+            failures: (unique ID, error message) pairs
+        """
+        events = []
+        for unique_id, error in failures:
+            failed = FailedUpload(unique_id=unique_id, error=error)
+            self.progress.failed_uploads.append(failed)
+            events.append({"failed": unique_id, "error": error, "timestamp": failed.timestamp})
+        self._record_changes(events)
 
     def update_last_processed_row(self, row_number: int) -> None:
         """
@@ -77,7 +162,7 @@ class ProgressTracker(IProgressTracker):
             row_number: Last processed row number
         """
         self.progress.last_processed_row = row_number
-        self.save_progress(self.progress)
+        self._record_changes([{"row": row_number}])
 
     def is_video_processed(self, unique_id: str) -> bool:
         """
@@ -99,3 +184,30 @@ class ProgressTracker(IProgressTracker):
             Current progress
         """
         return self.progress
+
+    def _record_changes(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Journal changes and save once the batch size or interval is reached.
+
+        Between saves, the journal is synced at every ``journal_sync_every``
+        changes rather than on each append.
+
+        Args:
+            events: Changes to append to the journal, if one is configured
+        """
+        if not events:
+            return
+        if self.journal_file:
+            self.file_operations.append_file(
+                self.journal_file, "".join(map(serialize_progress_event, events))
+            )
+            self._unsynced_changes += len(events)
+        self._pending_changes += len(events)
+        if (
+            self._pending_changes >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.save_progress(self.progress)
+        elif self.journal_file and 0 < self.journal_sync_every <= self._unsynced_changes:
+            self.file_operations.flush(self.journal_file)
+            self._unsynced_changes = 0
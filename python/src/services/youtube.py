@@ -1,13 +1,50 @@
 """YouTube service implementation."""
 
-from typing import Callable, Optional
+import random
+import socket
+import time
+from typing import Any, Callable, Dict, Optional
 
+import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaUpload
 
 from interfaces import IFileOperations, IYouTubeService
 from models import VideoData
+from services.http_transport import HttpTransport
+from services.media_pipe import UPLOAD_CHUNK_SIZE
+
+# Rate limiting and server errors worth resuming an interrupted upload for
+RETRIABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRIABLE_EXCEPTIONS = (httplib2.HttpLib2Error, ConnectionError, socket.timeout)
+
+# Resource parts set by every insert, matching the keys of _build_insert_body
+_INSERT_PART = "snippet,status"
+
+
+def _is_retriable(error: Exception) -> bool:
+    """Check whether an upload error is transient and worth resuming after."""
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRIABLE_STATUS_CODES
+    return isinstance(error, RETRIABLE_EXCEPTIONS)
+
+
+def _build_insert_body(video_data: VideoData) -> Dict[str, Any]:
+    """Build the videos.insert body; only the snippet text varies per video."""
+    return {
+        "snippet": {
+            "title": video_data.title,
+            "description": video_data.description,
+            "tags": video_data.tags,
+            "categoryId": "22",  # People & Blogs
+        },
+        "status": {
+            "privacyStatus": "private",
+            "selfDeclaredMadeForKids": False,
+        },
+    }
 
 
 class YouTubeService(IYouTubeService):
@@ -17,6 +54,8 @@ class YouTubeService(IYouTubeService):
         self,
         credentials: Credentials,
         file_operations: IFileOperations,
+        http_transport: Optional[HttpTransport] = None,
+        max_retries: int = 5,
     ) -> None:
         """
         Initialize YouTube service.
@@ -24,9 +63,15 @@ class YouTubeService(IYouTubeService):
         Args:
             credentials: Authenticated Google credentials
             file_operations: File operations service
+            http_transport: Optional shared transport to reuse connections across clients
+            max_retries: Maximum resume attempts after a transient upload failure
         """
-        self.service = build("youtube", "v3", credentials=credentials)
+        if http_transport:
+            self.service = build("youtube", "v3", **http_transport.build_kwargs())
+        else:
+            self.service = build("youtube", "v3", credentials=credentials)
         self.file_operations = file_operations
+        self.max_retries = max_retries
 
     def upload_video(
         self,
@@ -37,6 +82,10 @@ class YouTubeService(IYouTubeService):
         """
         Upload video with metadata and optional progress callback.
 
+        The file is sent in resumable chunks of ``UPLOAD_CHUNK_SIZE`` bytes. If a
+        request fails with a transient error, the upload resumes from the last
+        byte the server received instead of starting over.
+
         Args:
             video_path: Path to video file
             video_data: Video metadata
@@ -53,49 +102,88 @@ class YouTubeService(IYouTubeService):
             file_stat = self.file_operations.stat(video_path)
             file_size = file_stat.st_size
 
-            # Prepare the upload
-            body = {
-                "snippet": {
-                    "title": video_data.title,
-                    "description": video_data.description,
-                    "tags": video_data.tags,
-                    "categoryId": "22",  # People & Blogs
-                },
-                "status": {
-                    "privacyStatus": "private",
-                    "selfDeclaredMadeForKids": False,
-                },
-            }
-
             # Create media upload object
             media = MediaFileUpload(
                 video_path,
-                chunksize=-1,  # Upload in a single request
+                # A finite chunk size keeps the Content-Range correct when resuming;
+                # the client library miscomputes it for single-request uploads
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True,
                 mimetype="video/*",
             )
 
-            # Insert video
-            request = self.service.videos().insert(
-                part=",".join(body.keys()),
-                body=body,
-                media_body=media,
-            )
+            return self._upload(media, video_data, file_size, progress_callback)
 
-            # Execute upload with progress tracking
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status and progress_callback:
-                    bytes_uploaded = int(status.resumable_progress)
-                    progress_callback(bytes_uploaded, file_size)
+        except Exception as e:
+            raise Exception(f"Failed to upload video: {str(e)}") from e
+
+    def upload_stream(
+        self,
+        media: MediaUpload,
+        video_data: VideoData,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
+        """
+        Upload video from a resumable media body with metadata.
+
+        Used when the video is streamed rather than read from disk, for example
+        from a MediaPipe fed by a Drive download.
+
+        Args:
+            media: Resumable media body to upload
+            video_data: Video metadata
+            progress_callback: Optional callback for progress updates (bytes_uploaded, total_bytes),
+                where total_bytes is 0 if the media size is not known up front
 
-            # Return the video ID
-            video_id = response.get("id", "")
-            if not video_id:
-                raise Exception("Upload succeeded but no video ID returned")
+        Returns:
+            YouTube video ID of uploaded video
 
-            return video_id
+        Raises:
+            Exception: If upload fails
+        """
+        try:
+            return self._upload(media, video_data, media.size() or 0, progress_callback)
 
         except Exception as e:
-            raise Exception(f"Failed to upload video: {str(e)}") from e
\ No newline at end of file
+            raise Exception(f"Failed to upload video: {str(e)}") from e
+
+    def _upload(
+        self,
+        media: MediaUpload,
+        video_data: VideoData,
+        total_bytes: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> str:
+        """Insert the video and send the media, resuming after transient errors."""
+        # Insert video
+        request = self.service.videos().insert(
+            part=_INSERT_PART,
+            body=_build_insert_body(video_data),
+            media_body=media,
+        )
+
+        # Execute upload with progress tracking
+        response = None
+        retry = 0
+        while response is None:
+            try:
+                status, response = request.next_chunk()
+            except Exception as e:
+                if not _is_retriable(e) or retry >= self.max_retries:
+                    raise
+                # The next call probes the server offset and resumes from there;
+                # jitter keeps concurrent workers from retrying in lockstep
+                retry += 1
+                time.sleep(2**retry + random.random())
+                continue
+
+            if status and progress_callback:
+                bytes_uploaded = int(status.resumable_progress)
+                progress_callback(bytes_uploaded, total_bytes)
+
+        # Return the video ID
+        video_id = response.get("id", "")
+        if not video_id:
+            raise Exception("Upload succeeded but no video ID returned")
+
+        return video_id
@@ -6,7 +6,13 @@ from .data_parser import parse_video_row
 from .drive_utils import extract_file_id_from_drive_link
 from .error_printer import print_missing_config_error
 from .logging import create_log_message
-from .progress_serializer import deserialize_progress, serialize_progress
+from .progress_serializer import (
+    apply_progress_events,
+    deserialize_progress,
+    serialize_progress,
+    serialize_progress_event,
+)
+from .sheet_range import build_page_range
 
 __all__ = [
     "parse_video_row",
@@ -14,7 +20,10 @@ __all__ = [
     "create_log_message",
     "serialize_progress",
     "deserialize_progress",
+    "serialize_progress_event",
+    "apply_progress_events",
     "build_config_from_env",
     "validate_required_config_fields",
     "print_missing_config_error",
+    "build_page_range",
 ]
@@ -26,4 +26,11 @@ def build_config_from_env(override_spreadsheet_id: Optional[str] = None) -> Conf
         log_file=os.environ.get("LOG_FILE", "upload.log"),
         token_file=os.environ.get("TOKEN_FILE", "token.json"),
         temp_dir=os.environ.get("TEMP_DIR", "./temp"),
+        http_cache_dir=os.environ.get("HTTP_CACHE_DIR", ".http_cache"),
+        drive_metadata_cache=os.environ.get("DRIVE_METADATA_CACHE", ".drive_metadata.sqlite3"),
+        enable_pipeline=os.environ.get("ENABLE_PIPELINE", "1").lower() not in ("0", "false", "no"),
+        quota_units_per_second=float(os.environ.get("QUOTA_UNITS_PER_SECOND", "800")),
+        quota_burst_units=int(os.environ.get("QUOTA_BURST_UNITS", "6400")),
+        max_concurrent_uploads=int(os.environ.get("MAX_CONCURRENT_UPLOADS", "2")),
+        download_chunk_size=int(os.environ.get("DOWNLOAD_CHUNK_SIZE", str(16 * 1024 * 1024))),
     )
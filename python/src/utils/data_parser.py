@@ -1,9 +1,31 @@
 """Parse video data from spreadsheet rows."""
 
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from models import VideoData
 
+# Column holding the video's unique ID
+UNIQUE_ID_COLUMN = 4
+
+
+@lru_cache(maxsize=1024)
+def _split_tags(tag_string: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated tag string into trimmed, non-empty tags.
+
+    Many rows share the same tag string, so results are cached. Tags are
+    interned so identical tags share one string object.
+
+    Args:
+        tag_string: Raw tag cell value
+
+    Returns:
+        Tuple of tags
+    """
+    return tuple(sys.intern(tag) for tag in map(str.strip, tag_string.split(",")) if tag)
+
 
 def parse_video_row(row: List[str]) -> Optional[VideoData]:
     """
@@ -16,22 +38,18 @@ def parse_video_row(row: List[str]) -> Optional[VideoData]:
         VideoData object if valid, None if invalid
     """
     # Validate row has enough columns
-    if len(row) < 5:
+    if len(row) <= UNIQUE_ID_COLUMN:
         return None
 
     # Destructure the row
-    drive_link = row[0].strip()
-    title = row[1].strip()
-    description = row[2].strip()
-    tag_string = row[3].strip()
-    unique_id = row[4].strip()
+    drive_link, title, description, tag_string, unique_id = (cell.strip() for cell in row[:5])
 
     # Check required fields (all except tags)
     if not drive_link or not title or not unique_id:
         return None
 
     # Parse tags - split by comma and trim each tag
-    tags = [tag.strip() for tag in tag_string.split(",") if tag.strip()] if tag_string else []
+    tags = list(_split_tags(tag_string)) if tag_string else []
 
     try:
         return VideoData(
@@ -1,9 +1,15 @@
 """Google Drive utility functions."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+# File ID from standard (/file/d/{id}), query parameter (?id={id}, &id={id})
+# and open link (/open?id={id}) URL formats, matched in a single pass
+_DRIVE_FILE_ID_RE = re.compile(r"(?:/file/d/|[?&]id=)([a-zA-Z0-9_-]+)")
 
+
+@lru_cache(maxsize=4096)
 def extract_file_id_from_drive_link(link: str) -> Optional[str]:
     """
     Extract the file ID from various Google Drive URL formats.
@@ -14,17 +20,5 @@ def extract_file_id_from_drive_link(link: str) -> Optional[str]:
     Returns:
         File ID if found, None otherwise
     """
-    # Define regex patterns for different Drive URL formats
-    patterns = [
-        r"/file/d/([a-zA-Z0-9-_]+)",  # Standard file URL
-        r"id=([a-zA-Z0-9-_]+)",  # Query parameter format
-        r"/open\?id=([a-zA-Z0-9-_]+)",  # Open link format
-    ]
-
-    # Try each pattern
-    for pattern in patterns:
-        match = re.search(pattern, link)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _DRIVE_FILE_ID_RE.search(link)
+    return match.group(1) if match else None
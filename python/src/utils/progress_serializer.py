@@ -1,9 +1,10 @@
 """Serialize and deserialize progress data."""
 
-import json
 from typing import Any, Dict
 
-from models import UploadProgress
+import orjson
+
+from models import FailedUpload, UploadProgress
 
 
 def serialize_progress(progress: UploadProgress) -> str:
@@ -14,9 +15,10 @@ def serialize_progress(progress: UploadProgress) -> str:
         progress: UploadProgress object to serialize
 
     Returns:
-        Pretty-printed JSON string
+        Compact JSON string
     """
-    return json.dumps(progress.to_dict(), indent=2)
+    # orjson writes compact JSON and is several times faster than the stdlib
+    return orjson.dumps(progress.to_dict()).decode("utf-8")
 
 
 def deserialize_progress(data: str) -> UploadProgress:
@@ -30,8 +32,62 @@ def deserialize_progress(data: str) -> UploadProgress:
         UploadProgress object (empty if parse fails)
     """
     try:
-        parsed_data = json.loads(data)
+        parsed_data = orjson.loads(data)
         return UploadProgress.from_dict(parsed_data)
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (orjson.JSONDecodeError, KeyError, TypeError):
         # Return empty progress on any parse failure
         return UploadProgress()
+
+
+def serialize_progress_event(event: Dict[str, Any]) -> str:
+    """
+    Convert a progress change to a single journal line.
+
+    Args:
+        event: Change to record, e.g. ``{"processed": "id1"}``
+
+    Returns:
+        Compact JSON line terminated by a newline
+    """
+    return orjson.dumps(event).decode("utf-8") + "\n"
+
+
+def apply_progress_events(progress: UploadProgress, data: str) -> UploadProgress:
+    """
+    Replay journal lines on top of a progress snapshot.
+
+    Unreadable lines, such as one cut short by a crash mid-write, are skipped.
+    Failures already present in the snapshot are not added again, so replaying
+    a journal that was not truncated after a save is harmless.
+
+    Args:
+        progress: Snapshot to update in place
+        data: Journal content, one JSON event per line
+
+    Returns:
+        The updated progress
+    """
+    recorded_failures = {(fu.unique_id, fu.timestamp) for fu in progress.failed_uploads}
+
+    for line in data.splitlines():
+        try:
+            event = orjson.loads(line)
+            if "processed" in event:
+                progress.processed_ids.add(event["processed"])
+            elif "failed" in event:
+                key = (event["failed"], event["timestamp"])
+                if key not in recorded_failures:
+                    recorded_failures.add(key)
+                    progress.failed_uploads.append(
+                        FailedUpload(
+                            unique_id=event["failed"],
+                            error=event["error"],
+                            timestamp=event["timestamp"],
+                        )
+                    )
+            elif "row" in event:
+                progress.last_processed_row = event["row"]
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            continue
+
+    return progress
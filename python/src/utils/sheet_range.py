@@ -0,0 +1,52 @@
+"""Google Sheets A1 range utility functions."""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Column-only ranges such as "A:E" or "Videos!A:E"
+_COLUMN_RANGE_RE = re.compile(r"^(?:(?P<sheet>.+)!)?(?P<first>[A-Za-z]+):(?P<last>[A-Za-z]+)$")
+
+
+@lru_cache(maxsize=128)
+def _parse_column_range(sheet_range: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a column-only A1 range into its parts.
+
+    Every page of a sheet is built from the same range, so results are cached.
+
+    Args:
+        sheet_range: A1 notation range (e.g., "Sheet1!A:E")
+
+    Returns:
+        Tuple of (sheet prefix including "!", first column, last column), or
+        None if the range is not column-only
+    """
+    match = _COLUMN_RANGE_RE.match(sheet_range)
+    if not match:
+        return None
+
+    sheet = match.group("sheet")
+    prefix = f"{sheet}!" if sheet else ""
+    return prefix, match.group("first"), match.group("last")
+
+
+def build_page_range(sheet_range: str, first_row: int, last_row: int) -> Optional[str]:
+    """
+    Restrict a column-only A1 range to a block of rows.
+
+    Args:
+        sheet_range: A1 notation range spanning whole columns (e.g., "Sheet1!A:E")
+        first_row: First row of the page (1-based)
+        last_row: Last row of the page (1-based, inclusive)
+
+    Returns:
+        Range covering the given rows (e.g., "Sheet1!A2:E501"), or None if the
+        range already has row bounds or cannot be paged
+    """
+    parts = _parse_column_range(sheet_range)
+    if parts is None:
+        return None
+
+    prefix, first_column, last_column = parts
+    return f"{prefix}{first_column}{first_row}:{last_column}{last_row}"
@@ -0,0 +1,19 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create fake clock."""
+    return FakeClock()
@@ -0,0 +1,84 @@
+"""Tests for DependencyContainer."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from models import Config
+
+
+class TestDependencyContainer:
+    """Test DependencyContainer resource handling."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Create test configuration."""
+        return Config(
+            client_id="test_client",
+            client_secret="test_secret",
+            redirect_uri="http://localhost",
+            spreadsheet_id="test_sheet",
+            progress_file=str(tmp_path / "progress.json"),
+            log_file=str(tmp_path / "upload.log"),
+        )
+
+    @pytest.fixture
+    def services(self):
+        """Patch the services the container builds."""
+        names = [
+            "AuthenticationService",
+            "DriveMetadataCache",
+            "FileOperations",
+            "GoogleDriveService",
+            "GoogleSheetsService",
+            "HttpTransport",
+            "Logger",
+            "ProgressTracker",
+            "YouTubeService",
+            "VideoProcessor",
+            "YouTubeBulkUploader",
+        ]
+        patchers = {name: patch(f"core.dependency_container.{name}") for name in names}
+        mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        yield mocks
+        for patcher in patchers.values():
+            patcher.stop()
+
+    def test_close_releases_uploader_resources(self, config, services):
+        """Test that close shuts down everything created for the uploader."""
+        from core.dependency_container import DependencyContainer
+
+        manager = Mock()
+        manager.attach_mock(services["VideoProcessor"].return_value.close, "processor_close")
+        manager.attach_mock(services["DriveMetadataCache"].return_value.close, "cache_close")
+        manager.attach_mock(services["Logger"].return_value.flush, "logger_flush")
+        manager.attach_mock(services["FileOperations"].return_value.close, "file_ops_close")
+
+        container = DependencyContainer(config)
+        container.create_youtube_bulk_uploader()
+        container.close()
+
+        services["DriveMetadataCache"].assert_called_once_with(config.drive_metadata_cache)
+        assert (
+            services["GoogleDriveService"].call_args[1]["metadata_cache"]
+            is services["DriveMetadataCache"].return_value
+        )
+        services["ProgressTracker"].return_value.flush.assert_called_once()
+        # Background work finishes before buffered logs are written and files close
+        assert [c[0] for c in manager.mock_calls] == [
+            "processor_close",
+            "cache_close",
+            "logger_flush",
+            "file_ops_close",
+        ]
+
+    def test_close_before_uploader_created(self, config, services):
+        """Test that close only releases the basic services when nothing else was built."""
+        from core.dependency_container import DependencyContainer
+
+        container = DependencyContainer(config)
+        container.close()
+
+        services["VideoProcessor"].return_value.close.assert_not_called()
+        services["DriveMetadataCache"].return_value.close.assert_not_called()
+        services["FileOperations"].return_value.close.assert_called_once()
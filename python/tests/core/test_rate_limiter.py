@@ -0,0 +1,73 @@
+"""Tests for TokenBucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from core.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test TokenBucket."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch, clock):
+        """Record sleeps and advance the fake clock instead of waiting."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            clock.now += delay
+
+        monkeypatch.setattr("core.rate_limiter.asyncio.sleep", fake_sleep)
+        return delays
+
+    async def test_burst_does_not_wait(self, clock, sleeps):
+        """Test that a full bucket serves its capacity immediately."""
+        bucket = TokenBucket(rate=800, capacity=3200, clock=clock)
+
+        await bucket.acquire(1600)
+        await bucket.acquire(1600)
+
+        assert sleeps == []
+
+    async def test_waits_for_refill(self, clock, sleeps):
+        """Test that an empty bucket waits for enough tokens."""
+        bucket = TokenBucket(rate=800, capacity=1600, clock=clock)
+
+        await bucket.acquire(1600)
+        await bucket.acquire(1600)
+
+        assert sleeps == [pytest.approx(2.0)]
+
+    async def test_refills_over_time(self, clock, sleeps):
+        """Test that elapsed time refills the bucket, capped at capacity."""
+        bucket = TokenBucket(rate=800, capacity=1600, clock=clock)
+
+        await bucket.acquire(1600)
+        clock.now += 10
+        await bucket.acquire(1600)
+
+        assert sleeps == []
+
+    async def test_concurrent_waiters_are_spaced(self, clock, sleeps):
+        """Test that concurrent acquirers are released one refill apart."""
+        bucket = TokenBucket(rate=800, capacity=1600, clock=clock)
+
+        await asyncio.gather(*(bucket.acquire(1600) for _ in range(3)))
+
+        assert sleeps == [pytest.approx(2.0), pytest.approx(2.0)]
+
+    async def test_cost_above_capacity(self, clock):
+        """Test that a cost the bucket can never hold is rejected."""
+        bucket = TokenBucket(rate=1, capacity=10, clock=clock)
+
+        with pytest.raises(ValueError, match="exceeds bucket capacity"):
+            await bucket.acquire(11)
+
+    def test_invalid_parameters(self):
+        """Test that rate and capacity must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=10)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0)
@@ -1,7 +1,8 @@
 """Tests for spreadsheet processor."""
 
-import asyncio
-from unittest.mock import Mock, call
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
@@ -58,6 +59,7 @@ class TestSpreadsheetProcessor:
             logger=mock_logger,
             progress_tracker=mock_progress_tracker,
             video_processor=mock_video_processor,
+            max_concurrent=1,
         )
         
         # Verify all videos were processed
@@ -79,6 +81,39 @@ class TestSpreadsheetProcessor:
         assert mock_logger.log.call_count >= 3
         mock_logger.log.assert_any_call("Processing video 2/4: video1")
 
+    async def test_process_video_rows_prefetches_next_video(
+        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
+    ):
+        """Test that the next video's metadata is fetched while one is processing."""
+        from core.spreadsheet_processor import process_video_rows
+
+        mock_progress_tracker.is_video_processed.return_value = False
+        second_prefetched = threading.Event()
+
+        def prefetch(video_data):
+            if video_data.unique_id == "video2":
+                second_prefetched.set()
+
+        def process_video(video_data):
+            if video_data.unique_id == "video1":
+                assert second_prefetched.wait(timeout=5)
+            return f"yt_{video_data.unique_id}"
+
+        mock_video_processor.prefetch.side_effect = prefetch
+        mock_video_processor.process_video.side_effect = process_video
+
+        await process_video_rows(
+            rows=sample_rows,
+            start_row=1,
+            logger=mock_logger,
+            progress_tracker=mock_progress_tracker,
+            video_processor=mock_video_processor,
+            max_concurrent=1,
+        )
+
+        assert mock_video_processor.prefetch.call_count == 3
+        assert mock_progress_tracker.mark_video_processed.call_count == 3
+
     async def test_process_video_rows_skip_processed(
         self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
     ):
@@ -103,6 +138,26 @@ class TestSpreadsheetProcessor:
         # Should log skip
         mock_logger.log.assert_any_call("Skipping already processed video: video1")
 
+    async def test_process_video_rows_skip_processed_before_parsing(
+        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
+    ):
+        """Test that processed rows are skipped without parsing them."""
+        from core.spreadsheet_processor import process_video_rows
+
+        mock_progress_tracker.is_video_processed.return_value = True
+
+        with patch("core.spreadsheet_processor.parse_video_row") as mock_parse:
+            await process_video_rows(
+                rows=sample_rows,
+                start_row=1,
+                logger=mock_logger,
+                progress_tracker=mock_progress_tracker,
+                video_processor=mock_video_processor,
+            )
+
+        mock_parse.assert_not_called()
+        mock_video_processor.process_video.assert_not_called()
+
     async def test_process_video_rows_with_failures(
         self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
     ):
@@ -123,6 +178,7 @@ class TestSpreadsheetProcessor:
             logger=mock_logger,
             progress_tracker=mock_progress_tracker,
             video_processor=mock_video_processor,
+            max_concurrent=1,
         )
         
         # All videos should be attempted
@@ -182,16 +238,12 @@ class TestSpreadsheetProcessor:
         rows = [
             ["Header"],
             ["https://drive.google.com/file/d/123/view", "Video 1", "Desc", "tags", "video1"],
-            ["not_a_drive_link", "Invalid", "Desc", "tags", "invalid"],  # Invalid link - will fail in processor
+            ["not_a_drive_link", "Invalid", "Desc", "tags", "invalid"],  # Invalid link - fails before processing
             ["https://drive.google.com/file/d/456/view"],  # Missing columns
         ]
         
         mock_progress_tracker.is_video_processed.return_value = False
-        # First video succeeds, second fails due to invalid link
-        mock_video_processor.process_video.side_effect = [
-            "yt_id_1",
-            ValueError("Invalid Google Drive link")
-        ]
+        mock_video_processor.process_video.return_value = "yt_id_1"
         
         await process_video_rows(
             rows=rows,
@@ -199,10 +251,11 @@ class TestSpreadsheetProcessor:
             logger=mock_logger,
             progress_tracker=mock_progress_tracker,
             video_processor=mock_video_processor,
+            max_concurrent=1,
         )
         
-        # Should attempt to process 2 videos (third row has missing columns)
-        assert mock_video_processor.process_video.call_count == 2
+        # Should only process the valid video (invalid link and missing columns are skipped)
+        assert mock_video_processor.process_video.call_count == 1
         
         # Should log invalid data for row with missing columns
         assert any("invalid data" in str(call) for call in mock_logger.log.call_args_list)
@@ -228,6 +281,7 @@ class TestSpreadsheetProcessor:
             logger=mock_logger,
             progress_tracker=mock_progress_tracker,
             video_processor=mock_video_processor,
+            max_concurrent=1,
         )
         
         # Should only process last 2 videos
@@ -239,21 +293,18 @@ class TestSpreadsheetProcessor:
         assert calls[1] == call(4)
 
     async def test_process_video_rows_rate_limiting(
-        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows, monkeypatch
+        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
     ):
-        """Test rate limiting between videos."""
+        """Test that each upload draws its quota cost from the rate limiter."""
+        from core.rate_limiter import TokenBucket
         from core.spreadsheet_processor import process_video_rows
+        from models import UPLOAD_QUOTA_COST
         
         mock_progress_tracker.is_video_processed.return_value = False
         mock_video_processor.process_video.return_value = "yt_id"
         
-        # Track sleep calls
-        sleep_calls = []
-        
-        async def mock_sleep(seconds):
-            sleep_calls.append(seconds)
-        
-        monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+        rate_limiter = Mock(spec=TokenBucket)
+        rate_limiter.acquire = AsyncMock()
         
         await process_video_rows(
             rows=sample_rows,
@@ -261,8 +312,127 @@ class TestSpreadsheetProcessor:
             logger=mock_logger,
             progress_tracker=mock_progress_tracker,
             video_processor=mock_video_processor,
+            rate_limiter=rate_limiter,
         )
         
-        # Should have delays between videos (3 videos = 3 delays)
-        assert len(sleep_calls) == 3
-        assert all(delay == 2 for delay in sleep_calls)
\ No newline at end of file
+        # One quota draw per video
+        assert rate_limiter.acquire.await_args_list == [call(UPLOAD_QUOTA_COST)] * 3
+
+    async def test_process_video_rows_rate_limiter_error_marks_failed(
+        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
+    ):
+        """Test that a failed quota draw fails that video instead of aborting the run."""
+        from core.rate_limiter import TokenBucket
+        from core.spreadsheet_processor import process_video_rows
+
+        mock_progress_tracker.is_video_processed.return_value = False
+        mock_video_processor.process_video.return_value = "yt_id"
+
+        rate_limiter = Mock(spec=TokenBucket)
+        rate_limiter.acquire = AsyncMock(side_effect=[ValueError("cost exceeds capacity"), None, None])
+
+        await process_video_rows(
+            rows=sample_rows,
+            start_row=1,
+            logger=mock_logger,
+            progress_tracker=mock_progress_tracker,
+            video_processor=mock_video_processor,
+            max_concurrent=1,
+            rate_limiter=rate_limiter,
+        )
+
+        mock_progress_tracker.mark_video_failed.assert_called_once_with(
+            "video1", "cost exceeds capacity"
+        )
+        assert mock_video_processor.process_video.call_count == 2
+        mock_progress_tracker.update_last_processed_row.assert_called_with(4)
+
+    async def test_process_video_rows_concurrent(
+        self, mock_logger, mock_progress_tracker, mock_video_processor, sample_rows
+    ):
+        """Test videos are processed concurrently up to the configured limit."""
+        from core.spreadsheet_processor import process_video_rows
+
+        mock_progress_tracker.is_video_processed.return_value = False
+
+        # Each upload waits until two are in flight at the same time
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+        both_started = threading.Barrier(2, timeout=5)
+
+        def process_video(video_data):
+            with lock:
+                in_flight.append(video_data.unique_id)
+                peak.append(len(in_flight))
+            if video_data.unique_id != "video3":
+                both_started.wait()
+            with lock:
+                in_flight.remove(video_data.unique_id)
+            return f"yt_{video_data.unique_id}"
+
+        mock_video_processor.process_video.side_effect = process_video
+
+        await process_video_rows(
+            rows=sample_rows,
+            start_row=1,
+            logger=mock_logger,
+            progress_tracker=mock_progress_tracker,
+            video_processor=mock_video_processor,
+            max_concurrent=2,
+        )
+
+        assert mock_video_processor.process_video.call_count == 3
+        assert max(peak) == 2
+        assert mock_progress_tracker.mark_video_processed.call_count == 3
+        mock_progress_tracker.update_last_processed_row.assert_called_with(4)
+
+    async def test_process_indexed_rows_does_not_read_ahead_of_uploads(
+        self, mock_logger, mock_progress_tracker, mock_video_processor
+    ):
+        """Test rows are only read once a lookahead slot is free."""
+        from core.spreadsheet_processor import process_indexed_rows
+
+        mock_progress_tracker.is_video_processed.return_value = False
+        rows_read = []
+
+        def indexed_rows():
+            for i in range(10):
+                rows_read.append(i)
+                yield i, [f"https://drive.google.com/file/d/{i}/view", "T", "D", "", f"video{i}"]
+
+        reads_during_first_upload = []
+
+        def process_video(video_data):
+            if video_data.unique_id == "video0":
+                # Give an eager reader time to drain the iterator
+                time.sleep(0.2)
+                reads_during_first_upload.append(len(rows_read))
+            return f"yt_{video_data.unique_id}"
+
+        mock_video_processor.process_video.side_effect = process_video
+
+        result = await process_indexed_rows(
+            indexed_rows(),
+            logger=mock_logger,
+            progress_tracker=mock_progress_tracker,
+            video_processor=mock_video_processor,
+            max_concurrent=1,
+        )
+
+        # One video uploading plus one waiting with its metadata prefetched
+        assert reads_during_first_upload == [2]
+        assert result == 10
+        assert mock_progress_tracker.mark_video_processed.call_count == 10
+
+    def test_row_watermark_waits_for_earlier_rows(self):
+        """Test last processed row never moves past a video still in flight."""
+        from core.spreadsheet_processor import _RowWatermark
+
+        watermark = _RowWatermark([1, 2, 4])
+
+        # Row index 2 finishes first, but row index 1 is still in flight
+        assert watermark.finish(2) is None
+        # Finishing row index 1 releases both, reported as 1-based row 3
+        assert watermark.finish(1) == 3
+        assert watermark.finish(4) == 5
@@ -1,6 +1,7 @@
 """Tests for VideoProcessor."""
 
 import os
+import threading
 from pathlib import Path
 from unittest.mock import Mock, call, patch
 
@@ -38,7 +39,8 @@ class TestVideoProcessor:
             client_secret="test_secret",
             redirect_uri="http://localhost",
             spreadsheet_id="test_sheet",
-            temp_dir="/tmp/test_videos"
+            temp_dir="/tmp/test_videos",
+            enable_pipeline=False,
         )
 
     @pytest.fixture
@@ -95,6 +97,7 @@ class TestVideoProcessor:
         assert call_args[0][1] == sample_video_data
         
         # Verify cleanup
+        video_processor.close()
         mock_file_ops.unlink.assert_called_once_with(expected_temp_path)
 
     def test_process_video_with_progress_callback(
@@ -153,6 +156,7 @@ class TestVideoProcessor:
         
         # Verify cleanup was attempted
         expected_temp_path = os.path.join(config.temp_dir, "unique123.mp4")
+        video_processor.close()
         mock_file_ops.unlink.assert_called_once_with(expected_temp_path)
 
     def test_process_video_custom_temp_dir(
@@ -165,7 +169,8 @@ class TestVideoProcessor:
             client_secret="test",
             redirect_uri="http://localhost",
             spreadsheet_id="test",
-            temp_dir="/custom/temp"
+            temp_dir="/custom/temp",
+            enable_pipeline=False,
         )
         
         from core.video_processor import VideoProcessor
@@ -198,4 +203,150 @@ class TestVideoProcessor:
         
         # Should not raise
         result = video_processor.process_video(sample_video_data)
-        assert result == "youtube_123"
\ No newline at end of file
+        assert result == "youtube_123"
+        video_processor.close()
+        mock_file_ops.unlink.assert_called_once()
+
+    def test_process_video_returns_before_cleanup(
+        self, video_processor, mock_youtube_service, mock_file_ops, sample_video_data
+    ):
+        """Test that deleting the temp file does not hold up the result."""
+        mock_youtube_service.upload_video.return_value = "youtube_123"
+        release_unlink = threading.Event()
+        unlink_finished = threading.Event()
+
+        def slow_unlink(path):
+            release_unlink.wait(timeout=5)
+            unlink_finished.set()
+
+        mock_file_ops.unlink.side_effect = slow_unlink
+
+        result = video_processor.process_video(sample_video_data)
+        assert result == "youtube_123"
+        assert not unlink_finished.is_set()
+
+        release_unlink.set()
+        video_processor.close()
+        assert unlink_finished.is_set()
+
+    def test_process_video_pipelined(
+        self, mock_drive_service, mock_youtube_service, mock_file_ops, sample_video_data
+    ):
+        """Test that pipeline mode streams the download into the upload."""
+        pipelined_config = Config(
+            client_id="test",
+            client_secret="test",
+            redirect_uri="http://localhost",
+            spreadsheet_id="test",
+            enable_pipeline=True,
+        )
+
+        from core.video_processor import VideoProcessor
+        processor = VideoProcessor(
+            mock_drive_service, mock_youtube_service, mock_file_ops, pipelined_config
+        )
+
+        def download(file_id, stream):
+            stream.write(b"video-bytes")
+
+        def upload(media, video_data, progress_callback=None):
+            return "youtube_" + media.getbytes(0, media.chunksize()).decode()
+
+        mock_drive_service.download_to_stream.side_effect = download
+        mock_youtube_service.upload_stream.side_effect = upload
+
+        result = processor.process_video(sample_video_data)
+
+        assert result == "youtube_video-bytes"
+        mock_drive_service.download_file.assert_not_called()
+        mock_file_ops.mkdir.assert_not_called()
+        mock_file_ops.unlink.assert_not_called()
+
+    def test_prefetch(self, video_processor, mock_drive_service, sample_video_data):
+        """Test that prefetch fetches the Drive metadata for the video."""
+        video_processor.prefetch(sample_video_data)
+
+        mock_drive_service.prefetch_metadata.assert_called_once_with("1234567890")
+
+    def test_prefetch_ignores_errors(self, video_processor, mock_drive_service, sample_video_data):
+        """Test that prefetch failures are left for process_video to report."""
+        mock_drive_service.prefetch_metadata.side_effect = Exception("API error")
+
+        # Must not raise
+        video_processor.prefetch(sample_video_data)
+
+        mock_drive_service.prefetch_metadata.assert_called_once_with("1234567890")
+
+    def test_prefetch_invalid_link(self, video_processor, mock_drive_service):
+        """Test that prefetch skips videos without a Drive file ID."""
+        video_data = VideoData(
+            drive_link="https://example.com/video",
+            title="Title",
+            description="",
+            tags=[],
+            unique_id="id1",
+        )
+
+        video_processor.prefetch(video_data)
+
+        mock_drive_service.prefetch_metadata.assert_not_called()
+
+    def test_process_video_pipelined_reuses_download_thread(
+        self, mock_drive_service, mock_youtube_service, mock_file_ops, sample_video_data
+    ):
+        """Test that consecutive pipelined downloads run on the same pooled thread."""
+        pipelined_config = Config(
+            client_id="test",
+            client_secret="test",
+            redirect_uri="http://localhost",
+            spreadsheet_id="test",
+            enable_pipeline=True,
+            max_concurrent_uploads=1,
+        )
+
+        from core.video_processor import VideoProcessor
+        processor = VideoProcessor(
+            mock_drive_service, mock_youtube_service, mock_file_ops, pipelined_config
+        )
+
+        download_threads = []
+
+        def download(file_id, stream):
+            download_threads.append(threading.get_ident())
+
+        mock_drive_service.download_to_stream.side_effect = download
+        mock_youtube_service.upload_stream.side_effect = (
+            lambda media, video_data, progress_callback=None: media.getbytes(0, media.chunksize())
+        )
+
+        processor.process_video(sample_video_data)
+        processor.process_video(sample_video_data)
+
+        assert len(download_threads) == 2
+        assert download_threads[0] == download_threads[1]
+        assert download_threads[0] != threading.get_ident()
+
+    def test_process_video_pipelined_download_error(
+        self, mock_drive_service, mock_youtube_service, mock_file_ops, sample_video_data
+    ):
+        """Test that a pipelined download failure surfaces in the upload."""
+        pipelined_config = Config(
+            client_id="test",
+            client_secret="test",
+            redirect_uri="http://localhost",
+            spreadsheet_id="test",
+            enable_pipeline=True,
+        )
+
+        from core.video_processor import VideoProcessor
+        processor = VideoProcessor(
+            mock_drive_service, mock_youtube_service, mock_file_ops, pipelined_config
+        )
+
+        mock_drive_service.download_to_stream.side_effect = Exception("Download failed")
+        mock_youtube_service.upload_stream.side_effect = (
+            lambda media, video_data, progress_callback=None: media.getbytes(0, media.chunksize())
+        )
+
+        with pytest.raises(Exception, match="Download failed"):
+            processor.process_video(sample_video_data)
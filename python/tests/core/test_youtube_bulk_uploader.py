@@ -78,61 +78,57 @@ class TestYouTubeBulkUploader:
         mock_video_processor, mock_logger, config
     ):
         """Test successful spreadsheet processing."""
-        # Mock spreadsheet data
-        mock_sheets_service.fetch_spreadsheet_data.return_value = [
-            ["Header", "Row"],
-            ["https://drive.google.com/file/d/123/view", "Video 1", "Desc", "tags", "video1"],
-            ["https://drive.google.com/file/d/456/view", "Video 2", "Desc", "tags", "video2"],
-        ]
+        # Mock spreadsheet rows after the header
+        rows = iter([
+            (1, ["https://drive.google.com/file/d/123/view", "Video 1", "Desc", "tags", "video1"]),
+            (2, ["https://drive.google.com/file/d/456/view", "Video 2", "Desc", "tags", "video2"]),
+        ])
+        mock_sheets_service.iter_spreadsheet_rows.return_value = rows
         
         # Mock progress
         mock_progress = UploadProgress(processed_ids=set(), last_processed_row=0)
         mock_progress_tracker.get_progress.return_value = mock_progress
         
-        # Mock video processing
-        mock_video_processor.process_video.side_effect = ["yt_id_1", "yt_id_2"]
-        mock_progress_tracker.is_video_processed.return_value = False
-        
-        # Process with mocked process_video_rows
-        with patch("core.youtube_bulk_uploader.process_video_rows") as mock_process_rows:
-            mock_process_rows.return_value = asyncio.create_task(asyncio.sleep(0))
+        # Process with mocked process_indexed_rows
+        with patch(
+            "core.youtube_bulk_uploader.process_indexed_rows", new_callable=AsyncMock
+        ) as mock_process_rows:
+            mock_process_rows.return_value = 2
             
             await bulk_uploader.process_spreadsheet()
             
-            # Verify spreadsheet fetch
-            mock_sheets_service.fetch_spreadsheet_data.assert_called_once_with(
-                config.spreadsheet_id, config.sheet_range
+            # Verify paged spreadsheet fetch starts after the header
+            mock_sheets_service.iter_spreadsheet_rows.assert_called_once_with(
+                config.spreadsheet_id, config.sheet_range, start_row=1
             )
             
-            # Verify process_video_rows was called
+            # Verify rows were handed to the processor
             mock_process_rows.assert_called_once()
-            call_kwargs = mock_process_rows.call_args[1]
-            assert call_kwargs["start_row"] == 1
-            assert len(call_kwargs["rows"]) == 3
+            assert mock_process_rows.call_args[0][0] is rows
+            assert mock_process_rows.call_args[1]["max_concurrent"] == config.max_concurrent_uploads
             
         # Verify final stats logged
         assert any("Upload process completed!" in str(call) for call in mock_logger.log.call_args_list)
+        mock_progress_tracker.flush.assert_called_once()
 
     async def test_process_spreadsheet_empty(
-        self, bulk_uploader, mock_sheets_service, mock_logger
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker, mock_logger
     ):
         """Test processing empty spreadsheet."""
-        mock_sheets_service.fetch_spreadsheet_data.return_value = []
+        mock_sheets_service.iter_spreadsheet_rows.return_value = iter([])
+        mock_progress_tracker.get_progress.return_value = UploadProgress()
         
         await bulk_uploader.process_spreadsheet()
         
         mock_logger.log.assert_any_call("No data found in spreadsheet")
 
     async def test_process_spreadsheet_resume(
-        self, bulk_uploader, mock_sheets_service, mock_progress_tracker
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker, config
     ):
         """Test resuming from saved progress."""
-        # Mock spreadsheet data
-        mock_sheets_service.fetch_spreadsheet_data.return_value = [
-            ["Header"],
-            ["https://drive.google.com/file/d/123/view", "Video 1", "Desc", "tags", "video1"],
-            ["https://drive.google.com/file/d/456/view", "Video 2", "Desc", "tags", "video2"],
-        ]
+        mock_sheets_service.iter_spreadsheet_rows.return_value = iter([
+            (2, ["https://drive.google.com/file/d/456/view", "Video 2", "Desc", "tags", "video2"]),
+        ])
         
         # Mock progress - already processed first video
         mock_progress = UploadProgress(
@@ -141,26 +137,83 @@ class TestYouTubeBulkUploader:
         )
         mock_progress_tracker.get_progress.return_value = mock_progress
         
-        with patch("core.youtube_bulk_uploader.process_video_rows") as mock_process_rows:
-            mock_process_rows.return_value = asyncio.create_task(asyncio.sleep(0))
-            
+        with patch(
+            "core.youtube_bulk_uploader.process_indexed_rows", new_callable=AsyncMock
+        ) as mock_process_rows:
+            mock_process_rows.return_value = 1
             await bulk_uploader.process_spreadsheet()
-            
-            # Should start from row 2 (continuing from last_processed_row)
-            call_kwargs = mock_process_rows.call_args[1]
-            assert call_kwargs["start_row"] == 2
+        
+        # Should start from row 2 (continuing from last_processed_row)
+        mock_sheets_service.iter_spreadsheet_rows.assert_called_once_with(
+            config.spreadsheet_id, config.sheet_range, start_row=2
+        )
+
+    async def test_process_spreadsheet_resume_past_last_row(
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker, mock_logger, config
+    ):
+        """Test that a finished sheet is not reported as empty when resumed."""
+        header = (0, ["Link", "Title", "Description", "Tags", "ID"])
+        mock_sheets_service.iter_spreadsheet_rows.side_effect = [iter([]), iter([header])]
+        mock_progress_tracker.get_progress.return_value = UploadProgress(
+            processed_ids={"video1", "video2"}, last_processed_row=3
+        )
+
+        await bulk_uploader.process_spreadsheet()
+
+        assert mock_sheets_service.iter_spreadsheet_rows.call_args_list[1] == (
+            (config.spreadsheet_id, config.sheet_range), {"start_row": 0, "page_size": 1}
+        )
+        logged = [c[0][0] for c in mock_logger.log.call_args_list]
+        assert "No data found in spreadsheet" not in logged
+        assert "Upload process completed!" in logged
+        assert "Total processed: 2" in logged
+
+    async def test_process_spreadsheet_processes_rows(
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker,
+        mock_video_processor
+    ):
+        """Test that streamed rows are uploaded."""
+        mock_sheets_service.iter_spreadsheet_rows.return_value = iter([
+            (1, ["https://drive.google.com/file/d/123/view", "Video 1", "Desc", "tags", "video1"]),
+        ])
+        mock_progress_tracker.get_progress.return_value = UploadProgress()
+        mock_progress_tracker.is_video_processed.return_value = False
+        mock_video_processor.process_video.return_value = "yt_id_1"
+        
+        await bulk_uploader.process_spreadsheet()
+        
+        mock_progress_tracker.mark_video_processed.assert_called_once_with("video1")
+        mock_progress_tracker.update_last_processed_row.assert_called_once_with(2)
 
     async def test_process_spreadsheet_error_handling(
-        self, bulk_uploader, mock_sheets_service, mock_logger
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker, mock_logger
     ):
         """Test error handling in spreadsheet processing."""
-        mock_sheets_service.fetch_spreadsheet_data.side_effect = Exception("API Error")
+        mock_sheets_service.iter_spreadsheet_rows.side_effect = Exception("API Error")
+        mock_progress_tracker.get_progress.return_value = UploadProgress()
         
         with pytest.raises(Exception, match="API Error"):
             await bulk_uploader.process_spreadsheet()
         
         mock_logger.error.assert_called_once_with("Fatal error: API Error")
 
+    async def test_process_spreadsheet_flushes_progress_on_error(
+        self, bulk_uploader, mock_sheets_service, mock_progress_tracker, mock_logger
+    ):
+        """Test that batched progress is saved when processing is interrupted."""
+        mock_sheets_service.iter_spreadsheet_rows.return_value = iter([(1, ["row"])])
+        mock_progress_tracker.get_progress.return_value = UploadProgress()
+
+        with patch(
+            "core.youtube_bulk_uploader.process_indexed_rows",
+            side_effect=KeyboardInterrupt,
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                await bulk_uploader.process_spreadsheet()
+
+        mock_progress_tracker.flush.assert_called_once()
+        mock_logger.flush.assert_called_once()
+
     async def test_retry_failed_uploads(
         self, bulk_uploader, mock_progress_tracker, mock_logger
     ):
@@ -187,8 +240,8 @@ class TestYouTubeBulkUploader:
             
             await bulk_uploader.retry_failed_uploads()
             
-            # Verify failed uploads were cleared
-            assert len(saved_progress) >= 1
+            # Verify failed uploads were cleared in a single save
+            assert len(saved_progress) == 1
             first_save = saved_progress[0]
             assert len(first_save.failed_uploads) == 0
             
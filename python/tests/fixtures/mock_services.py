@@ -7,14 +7,17 @@ def create_mock_file_ops() -> Mock:
     """Create mock IFileOperations"""
     mock = Mock()
     mock.read_file = Mock(return_value="{}")
+    mock.read_json = Mock(return_value={})
     mock.write_file = Mock(return_value=None)
     mock.append_file = Mock(return_value=None)
+    mock.flush = Mock(return_value=None)
     mock.exists = Mock(return_value=True)
     mock.unlink = Mock(return_value=None)
     mock.mkdir = Mock(return_value=None)
     mock.create_read_stream = Mock(return_value=mock_open(read_data=b"test data")())
     mock.create_write_stream = Mock(return_value=mock_open()())
     mock.stat = Mock(return_value=Mock(st_size=1024))
+    mock.try_stat = Mock(return_value=Mock(st_size=1024))
     return mock
 
 
@@ -24,6 +27,7 @@ def create_mock_logger() -> Mock:
     mock.log = Mock()
     mock.error = Mock()
     mock.warn = Mock()
+    mock.flush = Mock()
     return mock
 
 
@@ -34,8 +38,11 @@ def create_mock_progress_tracker() -> Mock:
         return_value=Mock(processed_ids=set(), last_processed_row=0, failed_uploads=[])
     )
     mock.save_progress = Mock()
+    mock.flush = Mock()
     mock.mark_video_processed = Mock()
     mock.mark_video_failed = Mock()
+    mock.mark_videos_processed = Mock()
+    mock.mark_videos_failed = Mock()
     mock.update_last_processed_row = Mock()
     mock.is_video_processed = Mock(return_value=False)
     mock.get_progress = Mock(
@@ -30,7 +30,7 @@ class TestAuthenticationService:
         """Create mock file operations."""
         mock = Mock(spec=IFileOperations)
         # Default: token file doesn't exist
-        mock.exists.return_value = False
+        mock.read_json.side_effect = FileNotFoundError
         return mock
 
     @pytest.fixture
@@ -54,19 +54,18 @@ class TestAuthenticationService:
             expiry_date=int((datetime.now() + timedelta(hours=1)).timestamp() * 1000),
         )
 
-    def test_load_saved_tokens_file_not_exists(self, auth_service, mock_file_ops):
+    def test_load_saved_tokens_file_not_exists(self, auth_service, mock_file_ops, mock_logger):
         """Test loading tokens when file doesn't exist."""
-        mock_file_ops.exists.return_value = False
-        
         result = auth_service.load_saved_tokens()
         
         assert result is None
-        mock_file_ops.read_file.assert_not_called()
+        mock_file_ops.exists.assert_not_called()
+        mock_logger.warn.assert_not_called()
 
     def test_load_saved_tokens_success(self, auth_service, mock_file_ops, sample_tokens):
         """Test successfully loading saved tokens."""
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = json.dumps(sample_tokens.to_dict())
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
         
         result = auth_service.load_saved_tokens()
         
@@ -76,8 +75,7 @@ class TestAuthenticationService:
 
     def test_load_saved_tokens_invalid_json(self, auth_service, mock_file_ops, mock_logger):
         """Test loading tokens with invalid JSON."""
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = "invalid json{"
+        mock_file_ops.read_json.side_effect = ValueError("invalid json")
         
         result = auth_service.load_saved_tokens()
         
@@ -141,8 +139,8 @@ class TestAuthenticationService:
     ):
         """Test initialization with existing saved tokens."""
         # Setup saved tokens
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = json.dumps(sample_tokens.to_dict())
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
         
         # Create mock credentials
         mock_credentials = Mock(spec=Credentials)
@@ -156,6 +154,26 @@ class TestAuthenticationService:
         assert auth_service.credentials == mock_credentials
         mock_credentials.refresh.assert_not_called()
 
+    @patch("services.authentication.Credentials")
+    def test_initialize_reuses_valid_credentials(
+        self, mock_credentials_class, auth_service, mock_file_ops, sample_tokens
+    ):
+        """Test that a second initialize call does not reload the token file."""
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
+
+        mock_credentials = Mock(spec=Credentials)
+        mock_credentials.expired = False
+        mock_credentials.valid = True
+        mock_credentials.refresh_token = sample_tokens.refresh_token
+        mock_credentials_class.return_value = mock_credentials
+
+        first = auth_service.initialize()
+        second = auth_service.initialize()
+
+        assert first is second
+        mock_file_ops.read_json.assert_called_once()
+
     @patch("services.authentication.Request")
     @patch("services.authentication.Credentials")
     def test_initialize_with_expired_tokens(
@@ -163,8 +181,8 @@ class TestAuthenticationService:
     ):
         """Test initialization with expired tokens that need refresh."""
         # Setup saved tokens
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = json.dumps(sample_tokens.to_dict())
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
         
         # Create mock credentials
         mock_credentials = Mock(spec=Credentials)
@@ -186,6 +204,40 @@ class TestAuthenticationService:
         # Should save refreshed credentials
         mock_file_ops.write_file.assert_called()
 
+    @patch("services.authentication.Request")
+    def test_initialize_refreshes_token_past_saved_expiry(
+        self, mock_request_class, auth_service, mock_file_ops, sample_tokens
+    ):
+        """Test that the saved expiry is restored, so a stale token is refreshed up front."""
+        sample_tokens.expiry_date = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
+
+        with patch.object(Credentials, "refresh") as mock_refresh:
+            credentials = auth_service.initialize()
+
+        assert credentials.expired is True
+        mock_refresh.assert_called_once_with(mock_request_class.return_value)
+        mock_file_ops.write_file.assert_called_once()
+
+    def test_initialize_keeps_token_before_saved_expiry(
+        self, auth_service, mock_file_ops, sample_tokens
+    ):
+        """Test that a saved token that has not expired is used without refreshing."""
+        sample_tokens.expiry_date = 1_900_000_000_000
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = sample_tokens.to_dict()
+
+        with patch.object(Credentials, "refresh") as mock_refresh:
+            credentials = auth_service.initialize()
+
+        assert credentials.expiry == datetime(2030, 3, 17, 17, 46, 40)
+        mock_refresh.assert_not_called()
+
+        auth_service._save_credentials()
+        saved_data = json.loads(mock_file_ops.write_file.call_args[0][1])
+        assert saved_data["expiry_date"] == 1_900_000_000_000
+
     @patch("builtins.input", return_value="auth_code_123")
     @patch("services.authentication.Flow")
     @patch("services.authentication.Credentials")
@@ -194,8 +246,7 @@ class TestAuthenticationService:
         auth_service, mock_file_ops, mock_logger
     ):
         """Test initialization without saved tokens (full OAuth flow)."""
-        # No saved tokens
-        mock_file_ops.exists.return_value = False
+        # No saved tokens (fixture default)
         
         # Setup mock flow
         mock_flow = Mock()
@@ -292,8 +343,7 @@ class TestAuthenticationService:
     @patch("services.authentication.Flow")
     def test_initialize_failure(self, mock_flow_class, mock_input, auth_service, mock_file_ops):
         """Test initialization failure raises exception."""
-        # No saved tokens
-        mock_file_ops.exists.return_value = False
+        # No saved tokens (fixture default)
         
         # Setup mock flow
         mock_flow = Mock()
@@ -0,0 +1,100 @@
+"""Tests for DriveMetadataCache."""
+
+import pytest
+
+from services.drive_metadata_cache import DriveMetadataCache
+
+
+class TestDriveMetadataCache:
+    """Test DriveMetadataCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        """Create cache backed by a temporary database."""
+        cache = DriveMetadataCache(str(tmp_path / "drive.sqlite3"), ttl=60.0, clock=clock)
+        yield cache
+        cache.close()
+
+    def test_miss(self, cache):
+        """Test that an unknown file is a miss."""
+        assert cache.get("file123") is None
+
+    def test_round_trip(self, cache):
+        """Test that stored metadata is returned with Drive field names."""
+        metadata = {
+            "size": "1024",
+            "name": "test.mp4",
+            "md5Checksum": "abc",
+            "mimeType": "video/mp4",
+        }
+        cache.put("file123", metadata)
+
+        assert cache.get("file123") == metadata
+
+    def test_optional_fields(self, cache):
+        """Test metadata without checksum or MIME type."""
+        cache.put("file123", {"size": "1024", "name": "test.mp4"})
+
+        assert cache.get("file123") == {"size": "1024", "name": "test.mp4"}
+
+    def test_expiry(self, cache, clock):
+        """Test that entries older than the TTL are misses."""
+        cache.put("file123", {"size": "1024", "name": "test.mp4"})
+
+        clock.now += 61.0
+
+        assert cache.get("file123") is None
+
+    def test_evicts_least_recently_used(self, tmp_path, clock):
+        """Test that only the most recently used entries are kept."""
+        cache = DriveMetadataCache(str(tmp_path / "drive.sqlite3"), max_entries=2, clock=clock)
+        cache.put("a", {"size": "1", "name": "a"})
+        clock.now += 1
+        cache.put("b", {"size": "2", "name": "b"})
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.put("c", {"size": "3", "name": "c"})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        cache.close()
+
+    def test_get_does_not_write(self, cache):
+        """Test that a cache hit leaves the database unchanged."""
+        cache.put("file123", {"size": "1024", "name": "test.mp4"})
+        changes = cache._connection.total_changes
+
+        assert cache.get("file123") is not None
+        assert cache._connection.total_changes == changes
+
+    def test_recency_persists_across_instances(self, tmp_path, clock):
+        """Test that lookups still count towards recency after reopening."""
+        path = str(tmp_path / "drive.sqlite3")
+        first = DriveMetadataCache(path, max_entries=2, clock=clock)
+        first.put("a", {"size": "1", "name": "a"})
+        clock.now += 1
+        first.put("b", {"size": "2", "name": "b"})
+        clock.now += 1
+        first.get("a")
+        first.close()
+
+        second = DriveMetadataCache(path, max_entries=2, clock=clock)
+        clock.now += 1
+        second.put("c", {"size": "3", "name": "c"})
+
+        assert second.get("a") is not None
+        assert second.get("b") is None
+        second.close()
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        """Test that entries survive reopening the database."""
+        path = str(tmp_path / "drive.sqlite3")
+        first = DriveMetadataCache(path, clock=clock)
+        first.put("file123", {"size": "1024", "name": "test.mp4"})
+        first.close()
+
+        second = DriveMetadataCache(path, clock=clock)
+        assert second.get("file123") == {"size": "1024", "name": "test.mp4"}
+        second.close()
@@ -1,13 +1,14 @@
 """Tests for FileOperations service."""
 
+import json
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from services.file_operations import FileOperations
+from services.file_operations import MMAP_THRESHOLD, STREAM_BUFFER_SIZE, FileOperations
 
 
 class TestFileOperations:
@@ -16,7 +17,9 @@ class TestFileOperations:
     @pytest.fixture
     def file_ops(self):
         """Create FileOperations instance."""
-        return FileOperations()
+        file_ops = FileOperations()
+        yield file_ops
+        file_ops.close()
 
     @pytest.fixture
     def temp_file(self):
@@ -47,6 +50,27 @@ class TestFileOperations:
         with pytest.raises(FileNotFoundError):
             file_ops.read_file("/nonexistent/file.txt")
 
+    def test_read_json(self, file_ops, temp_dir):
+        """Test reading and parsing a JSON file."""
+        path = os.path.join(temp_dir, "data.json")
+        Path(path).write_text('{"ids": ["a", "é"], "row": 3}', encoding="utf-8")
+
+        assert file_ops.read_json(path) == {"ids": ["a", "é"], "row": 3}
+
+    def test_read_json_large_file(self, file_ops, temp_dir):
+        """Test parsing a JSON file above the memory map threshold."""
+        path = os.path.join(temp_dir, "progress.json")
+        ids = [f"video_{i:08d}" for i in range(100_000)]
+        Path(path).write_text(json.dumps({"processed_ids": ids}), encoding="utf-8")
+        assert os.path.getsize(path) >= MMAP_THRESHOLD
+
+        assert file_ops.read_json(path)["processed_ids"] == ids
+
+    def test_read_json_invalid(self, file_ops, temp_file):
+        """Test reading a file that is not JSON."""
+        with pytest.raises(ValueError):
+            file_ops.read_json(temp_file)
+
     def test_write_file(self, file_ops, temp_dir):
         """Test writing to file."""
         file_path = Path(temp_dir) / "test.txt"
@@ -62,6 +86,22 @@ class TestFileOperations:
         content = file_ops.read_file(temp_file)
         assert content == "overwritten"
 
+    def test_write_file_leaves_no_temp_files(self, file_ops, temp_dir):
+        """Test that the atomic write cleans up its temporary file."""
+        file_path = Path(temp_dir) / "progress.json"
+        file_ops.write_file(file_path, "first")
+        file_ops.write_file(file_path, "second")
+
+        assert os.listdir(temp_dir) == ["progress.json"]
+        assert file_path.read_text() == "second"
+
+    def test_write_file_keeps_permissions(self, file_ops, temp_file):
+        """Test that replacing a file keeps its permissions."""
+        os.chmod(temp_file, 0o644)
+        file_ops.write_file(temp_file, "updated")
+
+        assert os.stat(temp_file).st_mode & 0o777 == 0o644
+
     def test_append_file(self, file_ops, temp_file):
         """Test appending to file."""
         file_ops.append_file(temp_file, " appended")
@@ -77,6 +117,48 @@ class TestFileOperations:
         assert file_path.exists()
         assert file_path.read_text() == "created"
 
+    def test_append_file_reuses_descriptor(self, file_ops, temp_dir):
+        """Test that repeated appends keep one descriptor open."""
+        file_path = os.path.join(temp_dir, "log.txt")
+
+        with patch("services.file_operations.os.open", wraps=os.open) as mock_open:
+            file_ops.append_file(file_path, "one\n")
+            file_ops.append_file(file_path, "two\n")
+
+        mock_open.assert_called_once()
+        assert Path(file_path).read_text() == "one\ntwo\n"
+
+    def test_append_after_write_file(self, file_ops, temp_dir):
+        """Test that appends go to the new file after it is replaced."""
+        file_path = os.path.join(temp_dir, "journal.wal")
+        file_ops.append_file(file_path, "old\n")
+
+        file_ops.write_file(file_path, "")
+        file_ops.append_file(file_path, "new\n")
+
+        assert Path(file_path).read_text() == "new\n"
+
+    def test_append_after_unlink(self, file_ops, temp_dir):
+        """Test that appending after unlink creates the file again."""
+        file_path = os.path.join(temp_dir, "log.txt")
+        file_ops.append_file(file_path, "old\n")
+
+        file_ops.unlink(file_path)
+        file_ops.append_file(file_path, "new\n")
+
+        assert Path(file_path).read_text() == "new\n"
+
+    def test_flush_syncs_append_descriptor(self, file_ops, temp_dir):
+        """Test that flush syncs the descriptor appends were written to."""
+        file_path = os.path.join(temp_dir, "journal.wal")
+        file_ops.append_file(file_path, "entry\n")
+
+        with patch("services.file_operations.os.fsync") as mock_fsync:
+            file_ops.flush(file_path)
+            file_ops.flush(os.path.join(temp_dir, "other.wal"))
+
+        mock_fsync.assert_called_once()
+
     def test_exists_file(self, file_ops, temp_file):
         """Test checking if file exists."""
         assert file_ops.exists(temp_file) is True
@@ -115,12 +197,63 @@ class TestFileOperations:
         with pytest.raises(FileExistsError):
             file_ops.mkdir(temp_dir, exist_ok=False)
 
+    def test_mkdir_exist_ok_cached(self, file_ops, temp_dir, monkeypatch):
+        """Test that a directory already created is not created again."""
+        new_dir = Path(temp_dir) / "cached"
+        file_ops.mkdir(new_dir, exist_ok=True)
+
+        def fail_mkdir(*args, **kwargs):
+            raise AssertionError("mkdir should not be called again")
+
+        monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+        file_ops.mkdir(new_dir, exist_ok=True)
+
+    def test_exists_under_file(self, file_ops, temp_file):
+        """Test that a path below a regular file does not exist."""
+        assert file_ops.exists(Path(temp_file) / "child") is False
+
+    def test_stream_buffer_size(self, file_ops, temp_dir):
+        """Test that video streams are opened with large buffers."""
+        file_path = os.path.join(temp_dir, "video.mp4")
+        content = os.urandom(2 * STREAM_BUFFER_SIZE)
+
+        with file_ops.create_write_stream(file_path) as stream:
+            stream.write(content[: STREAM_BUFFER_SIZE - 1])
+            # Nothing reaches the file until the buffer fills
+            assert os.path.getsize(file_path) == 0
+            stream.write(content[STREAM_BUFFER_SIZE - 1 :])
+
+        with file_ops.create_read_stream(file_path) as stream:
+            first = stream.read(1)
+            # The first read filled a whole buffer from the file
+            assert len(stream.peek()) == STREAM_BUFFER_SIZE - 1
+            assert first + stream.read() == content
+
+    def test_try_stat(self, file_ops, temp_file):
+        """Test getting statistics only for existing paths."""
+        assert file_ops.try_stat(temp_file).st_size == len("test content")
+        assert file_ops.try_stat("/nonexistent/file.txt") is None
+        assert file_ops.try_stat(Path(temp_file) / "child") is None
+
     def test_create_read_stream(self, file_ops, temp_file):
         """Test creating read stream."""
         with file_ops.create_read_stream(temp_file) as stream:
             content = stream.read()
             assert content == b"test content"
 
+    def test_create_read_stream_ignores_rejected_advice(self, file_ops, temp_file, monkeypatch):
+        """Test that a file system rejecting read-ahead advice still reads."""
+        def reject(*args):
+            raise OSError("not supported")
+
+        monkeypatch.setattr("services.file_operations.os.posix_fadvise", reject, raising=False)
+        monkeypatch.setattr(
+            "services.file_operations.os.POSIX_FADV_SEQUENTIAL", 2, raising=False
+        )
+
+        with file_ops.create_read_stream(temp_file) as stream:
+            assert stream.read() == b"test content"
+
     def test_create_write_stream(self, file_ops, temp_dir):
         """Test creating write stream."""
         file_path = Path(temp_dir) / "stream.txt"
@@ -1,5 +1,6 @@
 """Tests for GoogleDriveService."""
 
+import hashlib
 from io import BytesIO
 from unittest.mock import Mock, MagicMock, patch, call
 
@@ -57,6 +58,18 @@ class TestGoogleDriveService:
         assert service.file_operations == mock_file_ops
         assert service.logger == mock_logger
 
+    @patch("services.google_drive.build")
+    def test_initialization_with_http_transport(
+        self, mock_build, mock_credentials, mock_file_ops, mock_logger
+    ):
+        """Test service initialization with a shared HTTP transport."""
+        mock_transport = Mock()
+        mock_transport.build_kwargs.return_value = {"http": "http", "requestBuilder": "builder"}
+
+        GoogleDriveService(mock_credentials, mock_file_ops, mock_logger, mock_transport)
+
+        mock_build.assert_called_once_with("drive", "v3", http="http", requestBuilder="builder")
+
     @patch("services.google_drive.MediaIoBaseDownload")
     def test_download_file_success(
         self, mock_downloader_class, drive_service, mock_drive_service, mock_file_ops, mock_logger
@@ -97,13 +110,22 @@ class TestGoogleDriveService:
         drive_service.download_file("file123", "/tmp/video.mp4", track_progress)
         
         # Verify metadata fetch
-        mock_files.get.assert_called_with(fileId="file123", fields="size,name")
+        mock_files.get.assert_called_with(
+            fileId="file123", fields="size,name,md5Checksum,mimeType"
+        )
+        mock_files.get.return_value.execute.assert_called_with(num_retries=5)
         
         # Verify download request
         mock_files.get_media.assert_called_once_with(fileId="file123")
         
         # Verify file operations
         mock_file_ops.create_write_stream.assert_called_once_with("/tmp/video.mp4")
+
+        # Verify bounded chunk size and per-chunk retries
+        mock_downloader_class.assert_called_once_with(
+            mock_stream, mock_media_request, chunksize=16 * 1024 * 1024
+        )
+        mock_downloader.next_chunk.assert_called_with(num_retries=5)
         
         # Verify progress callbacks
         assert progress_updates == [(512, 1024), (1024, 1024)]
@@ -251,6 +273,152 @@ class TestGoogleDriveService:
         assert len(progress_updates) == 10
         assert progress_updates[-1] == (104857600, 104857600)
 
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_to_stream(
+        self, mock_downloader_class, drive_service, mock_drive_service, mock_file_ops
+    ):
+        """Test downloading into a caller-provided stream."""
+        _, mock_files = mock_drive_service
+        mock_files.get.return_value.execute.return_value = {"size": "1024", "name": "test.mp4"}
+
+        mock_downloader = Mock()
+        mock_downloader_class.return_value = mock_downloader
+        mock_downloader.next_chunk.return_value = (None, True)
+
+        stream = BytesIO()
+        drive_service.download_to_stream("file123", stream)
+
+        assert mock_downloader_class.call_args[0][0] is stream
+        mock_file_ops.create_write_stream.assert_not_called()
+
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_to_stream_custom_chunk_size(
+        self, mock_downloader_class, mock_credentials, mock_file_ops, mock_logger,
+        mock_drive_service
+    ):
+        """Test that the configured chunk size is used for range requests."""
+        mock_service, mock_files = mock_drive_service
+        mock_files.get.return_value.execute.return_value = {"size": "1024", "name": "test.mp4"}
+        mock_downloader_class.return_value.next_chunk.return_value = (None, True)
+
+        with patch("services.google_drive.build", return_value=mock_service):
+            service = GoogleDriveService(
+                mock_credentials, mock_file_ops, mock_logger, chunk_size=64 * 1024 * 1024
+            )
+        service.download_to_stream("file123", BytesIO())
+
+        assert mock_downloader_class.call_args[1]["chunksize"] == 64 * 1024 * 1024
+
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_file_uses_metadata_cache(
+        self, mock_downloader_class, mock_credentials, mock_file_ops, mock_logger,
+        mock_drive_service
+    ):
+        """Test that cached metadata saves the metadata request."""
+        mock_service, mock_files = mock_drive_service
+        mock_cache = Mock()
+        mock_cache.get.return_value = {"size": "1024", "name": "test.mp4"}
+        mock_downloader_class.return_value.next_chunk.return_value = (None, True)
+        mock_file_ops.create_write_stream.return_value = MagicMock()
+
+        with patch("services.google_drive.build", return_value=mock_service):
+            service = GoogleDriveService(
+                mock_credentials, mock_file_ops, mock_logger, metadata_cache=mock_cache
+            )
+        service.download_file("file123", "/tmp/video.mp4")
+
+        mock_cache.get.assert_called_once_with("file123")
+        mock_files.get.assert_not_called()
+        mock_cache.put.assert_not_called()
+
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_file_caches_metadata(
+        self, mock_downloader_class, mock_credentials, mock_file_ops, mock_logger,
+        mock_drive_service
+    ):
+        """Test that fetched metadata is stored in the cache."""
+        mock_service, mock_files = mock_drive_service
+        metadata = {"size": "1024", "name": "test.mp4"}
+        mock_files.get.return_value.execute.return_value = metadata
+        mock_cache = Mock()
+        mock_cache.get.return_value = None
+        mock_downloader_class.return_value.next_chunk.return_value = (None, True)
+        mock_file_ops.create_write_stream.return_value = MagicMock()
+
+        with patch("services.google_drive.build", return_value=mock_service):
+            service = GoogleDriveService(
+                mock_credentials, mock_file_ops, mock_logger, metadata_cache=mock_cache
+            )
+        service.download_file("file123", "/tmp/video.mp4")
+
+        mock_cache.put.assert_called_once_with("file123", metadata)
+
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_file_skips_complete_file(
+        self, mock_downloader_class, drive_service, mock_drive_service, mock_file_ops
+    ):
+        """Test that a complete earlier download is reused."""
+        _, mock_files = mock_drive_service
+        content = b"video bytes"
+        mock_files.get.return_value.execute.return_value = {
+            "size": str(len(content)),
+            "name": "test.mp4",
+            "md5Checksum": hashlib.md5(content).hexdigest(),
+        }
+        mock_file_ops.try_stat.return_value = Mock(st_size=len(content))
+        mock_file_ops.create_read_stream.return_value = BytesIO(content)
+
+        drive_service.download_file("file123", "/tmp/video.mp4")
+
+        mock_downloader_class.assert_not_called()
+        mock_file_ops.create_write_stream.assert_not_called()
+
+    @patch("services.google_drive.MediaIoBaseDownload")
+    def test_download_file_replaces_incomplete_file(
+        self, mock_downloader_class, drive_service, mock_drive_service, mock_file_ops
+    ):
+        """Test that a partial earlier download is downloaded again."""
+        _, mock_files = mock_drive_service
+        mock_files.get.return_value.execute.return_value = {
+            "size": "1024",
+            "name": "test.mp4",
+            "md5Checksum": "abc",
+        }
+        mock_file_ops.try_stat.return_value = Mock(st_size=512)
+        mock_downloader_class.return_value.next_chunk.return_value = (None, True)
+        mock_file_ops.create_write_stream.return_value = MagicMock()
+
+        drive_service.download_file("file123", "/tmp/video.mp4")
+
+        mock_file_ops.create_read_stream.assert_not_called()
+        mock_file_ops.create_write_stream.assert_called_once_with("/tmp/video.mp4")
+
+    def test_prefetch_metadata_without_cache(self, drive_service, mock_drive_service):
+        """Test that prefetching is skipped when nothing would keep the result."""
+        _, mock_files = mock_drive_service
+
+        drive_service.prefetch_metadata("file123")
+
+        mock_files.get.assert_not_called()
+
+    def test_prefetch_metadata_fills_cache(
+        self, mock_credentials, mock_file_ops, mock_logger, mock_drive_service
+    ):
+        """Test that prefetched metadata is stored in the cache."""
+        mock_service, mock_files = mock_drive_service
+        metadata = {"size": "1024", "name": "test.mp4"}
+        mock_files.get.return_value.execute.return_value = metadata
+        mock_cache = Mock()
+        mock_cache.get.return_value = None
+
+        with patch("services.google_drive.build", return_value=mock_service):
+            service = GoogleDriveService(
+                mock_credentials, mock_file_ops, mock_logger, metadata_cache=mock_cache
+            )
+        service.prefetch_metadata("file123")
+
+        mock_cache.put.assert_called_once_with("file123", metadata)
+
     def test_implements_protocol(self, mock_credentials, mock_file_ops, mock_logger):
         """Test that GoogleDriveService implements IGoogleDriveService protocol."""
         from interfaces import IGoogleDriveService
@@ -40,6 +40,16 @@ class TestGoogleSheetsService:
         mock_build.assert_called_once_with("sheets", "v4", credentials=mock_credentials)
         assert service.service is not None
 
+    @patch("services.google_sheets.build")
+    def test_initialization_with_http_transport(self, mock_build, mock_credentials):
+        """Test service initialization with a shared HTTP transport."""
+        mock_transport = Mock()
+        mock_transport.build_kwargs.return_value = {"http": "http", "requestBuilder": "builder"}
+
+        GoogleSheetsService(mock_credentials, mock_transport)
+
+        mock_build.assert_called_once_with("sheets", "v4", http="http", requestBuilder="builder")
+
     def test_fetch_spreadsheet_data_success(self, sheets_service, mock_sheets_service):
         """Test successful spreadsheet data fetch."""
         _, mock_values = mock_sheets_service
@@ -95,6 +105,17 @@ class TestGoogleSheetsService:
             ["", "Value2", ""],
         ]
 
+    def test_fetch_spreadsheet_data_reuses_string_rows(self, sheets_service, mock_sheets_service):
+        """Test rows that are already strings are returned without copying."""
+        _, mock_values = mock_sheets_service
+        row = ["Text", "More text"]
+        mock_values.get.return_value.execute.return_value = {"values": [row]}
+
+        result = sheets_service.fetch_spreadsheet_data("test_id", "A1:B1")
+
+        assert result is mock_values.get.return_value.execute.return_value["values"]
+        assert result[0] is row
+
     def test_fetch_spreadsheet_data_with_numbers(self, sheets_service, mock_sheets_service):
         """Test converting numeric values to strings."""
         _, mock_values = mock_sheets_service
@@ -134,6 +155,50 @@ class TestGoogleSheetsService:
         with pytest.raises(Exception, match="Failed to fetch spreadsheet data"):
             sheets_service.fetch_spreadsheet_data("test_id", "Sheet1")
 
+    def test_iter_spreadsheet_rows_pages(self, sheets_service, mock_sheets_service):
+        """Test that column ranges are fetched page by page until an empty page."""
+        _, mock_values = mock_sheets_service
+        mock_values.get.return_value.execute.side_effect = [
+            {"values": [["row2"], ["row3"]]},
+            {"values": [["row4"]]},
+            {},
+        ]
+
+        rows = list(
+            sheets_service.iter_spreadsheet_rows("test_id", "Sheet1!A:E", start_row=1, page_size=2)
+        )
+
+        assert rows == [(1, ["row2"]), (2, ["row3"]), (3, ["row4"])]
+        requested_ranges = [c[1]["range"] for c in mock_values.get.call_args_list]
+        assert requested_ranges == ["Sheet1!A2:E3", "Sheet1!A4:E5", "Sheet1!A6:E7"]
+
+    def test_iter_spreadsheet_rows_keeps_indexes_across_short_pages(
+        self, sheets_service, mock_sheets_service
+    ):
+        """Test that trimmed trailing rows do not shift later row indexes."""
+        _, mock_values = mock_sheets_service
+        mock_values.get.return_value.execute.side_effect = [
+            {"values": [["row1"]]},
+            {"values": [["row3"]]},
+            {},
+        ]
+
+        rows = list(sheets_service.iter_spreadsheet_rows("test_id", "A:E", page_size=2))
+
+        assert rows == [(0, ["row1"]), (2, ["row3"])]
+
+    def test_iter_spreadsheet_rows_bounded_range(self, sheets_service, mock_sheets_service):
+        """Test that ranges with row bounds are fetched in one request."""
+        _, mock_values = mock_sheets_service
+        mock_values.get.return_value.execute.return_value = {
+            "values": [["Header"], ["row2"], ["row3"]]
+        }
+
+        rows = list(sheets_service.iter_spreadsheet_rows("test_id", "Sheet1!A1:E3", start_row=1))
+
+        assert rows == [(1, ["row2"]), (2, ["row3"])]
+        mock_values.get.assert_called_once_with(spreadsheetId="test_id", range="Sheet1!A1:E3")
+
     def test_different_range_formats(self, sheets_service, mock_sheets_service):
         """Test various A1 notation range formats."""
         _, mock_values = mock_sheets_service
@@ -0,0 +1,107 @@
+"""Tests for HttpTransport."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from services.http_transport import HttpTransport, MetadataFileCache
+
+
+class TestHttpTransport:
+    """Test HttpTransport."""
+
+    @pytest.fixture
+    def mock_credentials(self):
+        """Create mock credentials."""
+        return Mock(spec=Credentials)
+
+    @pytest.fixture
+    def transport(self, mock_credentials):
+        """Create HttpTransport instance."""
+        return HttpTransport(mock_credentials, timeout=30)
+
+    def test_get_http_reused_within_thread(self, transport, mock_credentials):
+        """Test the same client is returned for repeated calls on one thread."""
+        first = transport.get_http()
+        second = transport.get_http()
+
+        assert first is second
+        assert first.credentials is mock_credentials
+        assert first.http.timeout == 30
+
+    def test_get_http_per_thread(self, transport):
+        """Test each thread gets its own client."""
+        main_http = transport.get_http()
+        other = []
+
+        thread = threading.Thread(target=lambda: other.append(transport.get_http()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_http
+
+    @patch("services.http_transport.HttpRequest")
+    def test_build_request_uses_thread_http(self, mock_request_class, transport):
+        """Test requests are bound to the calling thread's client."""
+        client_http = Mock()
+
+        transport.build_request(client_http, "postproc", "https://example.com", method="GET")
+
+        mock_request_class.assert_called_once_with(
+            transport.get_http(), "postproc", "https://example.com", method="GET"
+        )
+
+    def test_build_kwargs(self, transport):
+        """Test keyword arguments for googleapiclient build."""
+        kwargs = transport.build_kwargs()
+
+        assert kwargs["http"] is transport.get_http()
+        assert kwargs["requestBuilder"] == transport.build_request
+        assert kwargs["static_discovery"] is True
+        assert kwargs["cache_discovery"] is False
+
+    def test_no_cache_by_default(self, transport):
+        """Test responses are not cached unless a cache directory is given."""
+        assert transport.cache is None
+        assert transport.get_http().http.cache is None
+
+    def test_cache_dir_enables_cache(self, mock_credentials, tmp_path):
+        """Test a cache directory is wired into the underlying client."""
+        transport = HttpTransport(mock_credentials, cache_dir=str(tmp_path / "cache"))
+
+        assert isinstance(transport.get_http().http.cache, MetadataFileCache)
+
+
+class TestMetadataFileCache:
+    """Test MetadataFileCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create MetadataFileCache instance."""
+        return MetadataFileCache(str(tmp_path / "cache"), max_entry_size=64)
+
+    def test_set_and_get(self, cache):
+        """Test small metadata responses are stored."""
+        key = "https://www.googleapis.com/drive/v3/files/abc?fields=size"
+
+        cache.set(key, b"status: 200\r\n\r\n{}")
+
+        assert cache.get(key) == b"status: 200\r\n\r\n{}"
+
+    def test_skips_media_downloads(self, cache):
+        """Test media download bodies are never stored."""
+        key = "https://www.googleapis.com/drive/v3/files/abc?alt=media"
+
+        cache.set(key, b"video bytes")
+
+        assert cache.get(key) is None
+
+    def test_skips_large_entries(self, cache):
+        """Test responses above the size limit are not stored."""
+        key = "https://sheets.googleapis.com/v4/spreadsheets/abc/values/A%3AE"
+
+        cache.set(key, b"x" * 65)
+
+        assert cache.get(key) is None
@@ -1,5 +1,6 @@
 """Tests for Logger service."""
 
+import threading
 from io import StringIO
 from unittest.mock import Mock, patch
 
@@ -112,6 +113,70 @@ class TestLogger:
         file_path = mock_file_ops.append_file.call_args[0][0]
         assert file_path == "/var/log/app.log"
 
+    @patch("builtins.print")
+    def test_batched_writes(self, mock_print, mock_file_ops):
+        """Test that messages are appended once the batch size is reached."""
+        logger = Logger(mock_file_ops, "test.log", flush_every=3, flush_interval=60.0)
+
+        logger.log("First")
+        logger.log("Second")
+        assert mock_print.call_count == 2
+        mock_file_ops.append_file.assert_not_called()
+
+        logger.log("Third")
+        mock_file_ops.append_file.assert_called_once()
+        content = mock_file_ops.append_file.call_args[0][1]
+        assert content.count("\n") == 3
+        assert content.index("First") < content.index("Second") < content.index("Third")
+
+    @patch("builtins.print")
+    def test_error_writes_immediately(self, mock_print, mock_file_ops):
+        """Test that an error writes buffered messages straight away."""
+        logger = Logger(mock_file_ops, "test.log", flush_every=64, flush_interval=60.0)
+
+        logger.log("Info")
+        logger.error("Broken")
+
+        mock_file_ops.append_file.assert_called_once()
+        content = mock_file_ops.append_file.call_args[0][1]
+        assert "Info" in content
+        assert "ERROR: Broken" in content
+
+    @patch("builtins.print")
+    def test_flush(self, mock_print, mock_file_ops):
+        """Test that flush writes buffered messages only."""
+        logger = Logger(mock_file_ops, "test.log", flush_every=64, flush_interval=60.0)
+
+        logger.flush()
+        mock_file_ops.append_file.assert_not_called()
+
+        logger.log("Info")
+        logger.flush()
+        logger.flush()
+
+        mock_file_ops.append_file.assert_called_once()
+
+    @patch("builtins.print")
+    def test_concurrent_writers(self, mock_print, mock_file_ops):
+        """Test that messages logged from several threads are written exactly once."""
+        logger = Logger(mock_file_ops, "test.log", flush_every=7, flush_interval=60.0)
+
+        def write(worker):
+            for n in range(200):
+                logger.log(f"worker-{worker}-{n}")
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.flush()
+
+        written = "".join(call[0][1] for call in mock_file_ops.append_file.call_args_list)
+        lines = [line.rsplit(" ", 1)[-1] for line in written.splitlines()]
+        expected = [f"worker-{w}-{n}" for w in range(4) for n in range(200)]
+        assert sorted(lines) == sorted(expected)
+
     def test_implements_protocol(self, mock_file_ops):
         """Test that Logger implements ILogger protocol."""
         from interfaces import ILogger
@@ -0,0 +1,140 @@
+"""Tests for MediaPipe and PipeMediaUpload."""
+
+import threading
+
+import pytest
+
+from services.media_pipe import MediaPipe, PipeMediaUpload
+
+
+class TestMediaPipe:
+    """Test MediaPipe."""
+
+    def test_read_range_until_eof(self):
+        """Test reading chunks and a short final chunk."""
+        pipe = MediaPipe()
+        pipe.write(b"abcd")
+        pipe.write(b"efg")
+        pipe.finish()
+
+        assert pipe.read_range(0, 4) == b"abcd"
+        assert pipe.read_range(4, 4) == b"efg"
+
+    def test_read_range_keeps_unacknowledged_bytes(self):
+        """Test that a chunk can be re-read after a failed request."""
+        pipe = MediaPipe()
+        pipe.write(b"abcdef")
+        pipe.finish()
+
+        assert pipe.read_range(0, 4) == b"abcd"
+        # Server only acknowledged the first two bytes
+        assert pipe.read_range(2, 4) == b"cdef"
+
+    def test_read_range_before_released_offset(self):
+        """Test that released bytes cannot be read again."""
+        pipe = MediaPipe()
+        pipe.write(b"abcdef")
+        pipe.finish()
+        pipe.read_range(4, 2)
+
+        with pytest.raises(ValueError, match="already released"):
+            pipe.read_range(0, 2)
+
+    def test_download_error_raised_on_read(self):
+        """Test that a download failure is raised on the upload side."""
+        pipe = MediaPipe()
+        pipe.write(b"ab")
+        pipe.finish(IOError("Download failed"))
+
+        with pytest.raises(IOError, match="Download failed"):
+            pipe.read_range(0, 4)
+
+    def test_download_error_raised_on_every_later_read(self):
+        """Test that a download failure is not lost after the first read raises it."""
+        pipe = MediaPipe()
+        pipe.write(b"ab")
+        pipe.finish(ConnectionError("Connection reset"))
+
+        with pytest.raises(ConnectionError, match="Connection reset"):
+            pipe.read_range(0, 4)
+        # A retried chunk must not look like a short final chunk
+        with pytest.raises(ConnectionError, match="Connection reset"):
+            pipe.read_range(0, 4)
+        with pytest.raises(ConnectionError, match="Connection reset"):
+            pipe.read_range(0, 1)
+
+    def test_write_blocks_on_queued_bytes(self):
+        """Test that the pipe is bounded by bytes queued, not by writes."""
+        pipe = MediaPipe(max_bytes=4)
+        pipe.write(b"abc")
+        written = threading.Event()
+
+        def write():
+            pipe.write(b"de")
+            written.set()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        # Five bytes would exceed the limit, so the second write waits
+        assert not written.wait(timeout=0.2)
+
+        assert pipe.read_range(0, 3) == b"abc"
+        assert written.wait(timeout=5)
+        writer.join(timeout=5)
+        pipe.finish()
+        assert pipe.read_range(3, 4) == b"de"
+
+    def test_oversized_write_accepted_when_empty(self):
+        """Test that a write larger than the limit goes through on an empty pipe."""
+        pipe = MediaPipe(max_bytes=2)
+        pipe.write(b"abcdef")
+        pipe.finish()
+
+        assert pipe.read_range(0, 6) == b"abcdef"
+
+    def test_abort_unblocks_writer(self):
+        """Test that aborting releases a download blocked on a full pipe."""
+        pipe = MediaPipe(max_bytes=1)
+        pipe.write(b"a")
+        errors = []
+
+        def write():
+            try:
+                pipe.write(b"b")
+            except BrokenPipeError as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        pipe.abort()
+        writer.join(timeout=5)
+
+        assert not writer.is_alive()
+        assert len(errors) == 1
+
+
+class TestPipeMediaUpload:
+    """Test PipeMediaUpload."""
+
+    def test_media_properties(self):
+        """Test resumable upload of unknown size."""
+        media = PipeMediaUpload(MediaPipe(), chunksize=256 * 1024)
+
+        assert media.size() is None
+        assert media.resumable() is True
+        assert media.has_stream() is False
+        assert media.chunksize() == 256 * 1024
+        assert media.mimetype() == "video/*"
+
+    def test_getbytes_reads_from_pipe(self):
+        """Test that chunks are read from the pipe."""
+        pipe = MediaPipe()
+        pipe.write(b"video")
+        pipe.finish()
+
+        assert PipeMediaUpload(pipe).getbytes(0, 3) == b"vid"
+
+    def test_invalid_chunksize(self):
+        """Test that chunk sizes must be multiples of 256 KiB."""
+        with pytest.raises(ValueError):
+            PipeMediaUpload(MediaPipe(), chunksize=1000)
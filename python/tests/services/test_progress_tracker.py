@@ -17,8 +17,9 @@ class TestProgressTracker:
     def mock_file_ops(self):
         """Create mock file operations."""
         mock = Mock(spec=IFileOperations)
-        # Default: progress file doesn't exist
-        mock.exists.return_value = False
+        # Default: progress file and journal don't exist
+        mock.read_json.side_effect = FileNotFoundError
+        mock.read_file.side_effect = FileNotFoundError
         return mock
 
     @pytest.fixture
@@ -34,21 +35,23 @@ class TestProgressTracker:
         assert tracker.progress.last_processed_row == 0
         assert tracker.progress.failed_uploads == []
 
-        # Should not try to read non-existent file
-        mock_file_ops.read_file.assert_not_called()
+        # Reads the file directly instead of checking it exists first
+        mock_file_ops.read_json.assert_called_once_with("progress.json")
+        mock_file_ops.exists.assert_not_called()
 
     def test_load_progress_from_file(self, mock_file_ops):
         """Test loading existing progress file."""
-        mock_file_ops.exists.return_value = True
+        mock_file_ops.read_json.side_effect = None
         progress_data = {
             "processed_ids": ["id1", "id2"],
             "last_processed_row": 5,
             "failed_uploads": [{"unique_id": "id3", "error": "Failed", "timestamp": "2023-01-01"}],
         }
-        mock_file_ops.read_file.return_value = json.dumps(progress_data)
+        mock_file_ops.read_json.return_value = progress_data
 
         tracker = ProgressTracker(mock_file_ops, "progress.json")
 
+        mock_file_ops.read_json.assert_called_once_with("progress.json")
         assert tracker.progress.processed_ids == {"id1", "id2"}
         assert tracker.progress.last_processed_row == 5
         assert len(tracker.progress.failed_uploads) == 1
@@ -56,8 +59,7 @@ class TestProgressTracker:
 
     def test_load_progress_corrupted_file(self, mock_file_ops):
         """Test loading corrupted progress file returns empty progress."""
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = "invalid json{{"
+        mock_file_ops.read_json.side_effect = ValueError("invalid json")
 
         tracker = ProgressTracker(mock_file_ops, "progress.json")
 
@@ -67,8 +69,7 @@ class TestProgressTracker:
 
     def test_load_progress_read_error(self, mock_file_ops):
         """Test handling read error returns empty progress."""
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.side_effect = PermissionError("No read access")
+        mock_file_ops.read_json.side_effect = PermissionError("No read access")
 
         tracker = ProgressTracker(mock_file_ops, "progress.json")
 
@@ -194,14 +195,175 @@ class TestProgressTracker:
         saved_content = mock_file_ops.write_file.call_args[0][1]
 
         # Second tracker loads the saved progress
-        mock_file_ops.exists.return_value = True
-        mock_file_ops.read_file.return_value = saved_content
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = json.loads(saved_content)
 
         tracker2 = ProgressTracker(mock_file_ops, "progress.json")
 
         assert tracker2.is_video_processed("id1") is True
         assert tracker2.progress.last_processed_row == 1
 
+    def test_batched_saves(self, mock_file_ops):
+        """Test that changes are saved once the batch size is reached."""
+        tracker = ProgressTracker(
+            mock_file_ops, "progress.json", flush_every=3, flush_interval=60.0
+        )
+
+        tracker.mark_video_processed("id1")
+        tracker.mark_video_failed("id2", "Network error")
+        mock_file_ops.write_file.assert_not_called()
+
+        tracker.update_last_processed_row(2)
+        mock_file_ops.write_file.assert_called_once()
+
+    def test_mark_videos_processed(self, mock_file_ops):
+        """Test that a batch of completions is journaled with one append."""
+        tracker = ProgressTracker(
+            mock_file_ops,
+            "progress.json",
+            flush_every=16,
+            flush_interval=60.0,
+            journal_file="progress.json.wal",
+        )
+
+        tracker.mark_videos_processed(["id1", "id2", "id3"])
+
+        assert tracker.progress.processed_ids == {"id1", "id2", "id3"}
+        mock_file_ops.append_file.assert_called_once_with(
+            "progress.json.wal",
+            '{"processed":"id1"}\n{"processed":"id2"}\n{"processed":"id3"}\n',
+        )
+        mock_file_ops.write_file.assert_not_called()
+
+    def test_mark_videos_failed(self, mock_file_ops):
+        """Test that a batch of failures counts towards the save batch."""
+        tracker = ProgressTracker(
+            mock_file_ops, "progress.json", flush_every=2, flush_interval=60.0
+        )
+
+        tracker.mark_videos_failed([("id1", "Network error"), ("id2", "Quota exceeded")])
+
+        assert [fu.unique_id for fu in tracker.progress.failed_uploads] == ["id1", "id2"]
+        assert tracker.progress.failed_uploads[1].error == "Quota exceeded"
+        mock_file_ops.write_file.assert_called_once()
+
+    def test_mark_videos_processed_empty(self, tracker, mock_file_ops):
+        """Test that an empty batch records nothing."""
+        tracker.mark_videos_processed([])
+
+        mock_file_ops.append_file.assert_not_called()
+        mock_file_ops.write_file.assert_not_called()
+
+    def test_batched_saves_after_interval(self, mock_file_ops, monkeypatch):
+        """Test that a change is saved once the flush interval has passed."""
+        clock = [100.0]
+        monkeypatch.setattr("services.progress_tracker.time.monotonic", lambda: clock[0])
+        tracker = ProgressTracker(
+            mock_file_ops, "progress.json", flush_every=16, flush_interval=5.0
+        )
+
+        tracker.mark_video_processed("id1")
+        mock_file_ops.write_file.assert_not_called()
+
+        clock[0] += 5.0
+        tracker.mark_video_processed("id2")
+        mock_file_ops.write_file.assert_called_once()
+
+    def test_flush(self, mock_file_ops):
+        """Test that flush saves pending changes only."""
+        tracker = ProgressTracker(
+            mock_file_ops, "progress.json", flush_every=16, flush_interval=60.0
+        )
+
+        tracker.flush()
+        mock_file_ops.write_file.assert_not_called()
+
+        tracker.mark_video_processed("id1")
+        tracker.flush()
+        tracker.flush()
+
+        mock_file_ops.write_file.assert_called_once()
+        saved_data = json.loads(mock_file_ops.write_file.call_args[0][1])
+        assert saved_data["processed_ids"] == ["id1"]
+
+    def test_journal_appends_each_change(self, mock_file_ops):
+        """Test that every change is journaled before the batched save."""
+        tracker = ProgressTracker(
+            mock_file_ops,
+            "progress.json",
+            flush_every=16,
+            flush_interval=60.0,
+            journal_file="progress.json.wal",
+        )
+
+        tracker.mark_video_processed("id1")
+        tracker.mark_video_failed("id2", "Network error")
+        tracker.update_last_processed_row(2)
+
+        mock_file_ops.write_file.assert_not_called()
+        assert mock_file_ops.append_file.call_count == 3
+        lines = [json.loads(c[0][1]) for c in mock_file_ops.append_file.call_args_list]
+        assert lines[0] == {"processed": "id1"}
+        assert lines[1]["failed"] == "id2"
+        assert lines[1]["error"] == "Network error"
+        assert lines[2] == {"row": 2}
+
+    def test_save_truncates_journal(self, mock_file_ops):
+        """Test that saving the snapshot empties the journal."""
+        tracker = ProgressTracker(
+            mock_file_ops,
+            "progress.json",
+            flush_every=16,
+            flush_interval=60.0,
+            journal_file="progress.json.wal",
+        )
+
+        tracker.mark_video_processed("id1")
+        tracker.flush()
+
+        written = [c[0] for c in mock_file_ops.write_file.call_args_list]
+        assert written[0][0] == "progress.json"
+        assert written[1] == ("progress.json.wal", "")
+
+    def test_journal_synced_at_checkpoints(self, mock_file_ops):
+        """Test that the journal is synced every few changes, not on each append."""
+        tracker = ProgressTracker(
+            mock_file_ops,
+            "progress.json",
+            flush_every=16,
+            flush_interval=60.0,
+            journal_file="progress.json.wal",
+            journal_sync_every=3,
+        )
+
+        tracker.mark_video_processed("id1")
+        tracker.mark_video_processed("id2")
+        mock_file_ops.flush.assert_not_called()
+
+        tracker.mark_video_processed("id3")
+        mock_file_ops.flush.assert_called_once_with("progress.json.wal")
+
+        # A saved snapshot covers the journal, so the count starts over
+        tracker.mark_video_processed("id4")
+        tracker.flush()
+        tracker.mark_video_processed("id5")
+        tracker.mark_video_processed("id6")
+        assert mock_file_ops.flush.call_count == 1
+
+    def test_load_replays_journal(self, mock_file_ops):
+        """Test that journaled changes are applied on top of the snapshot."""
+        mock_file_ops.read_json.side_effect = None
+        mock_file_ops.read_json.return_value = {"processed_ids": ["id1"], "last_processed_row": 1}
+        mock_file_ops.read_file.side_effect = None
+        mock_file_ops.read_file.return_value = '{"processed":"id2"}\n{"row":2}\n'
+
+        tracker = ProgressTracker(
+            mock_file_ops, "progress.json", journal_file="progress.json.wal"
+        )
+
+        assert tracker.progress.processed_ids == {"id1", "id2"}
+        assert tracker.progress.last_processed_row == 2
+
     def test_implements_protocol(self, mock_file_ops):
         """Test that ProgressTracker implements IProgressTracker protocol."""
         from interfaces import IProgressTracker
@@ -1,13 +1,17 @@
 """Tests for YouTubeService."""
 
-from unittest.mock import Mock, patch, MagicMock
+import json
+from unittest.mock import Mock, patch, MagicMock, call
 
+import httplib2
 import pytest
 from google.oauth2.credentials import Credentials
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, MediaFileUpload
 
 from interfaces import IFileOperations
 from models import VideoData
+from services.media_pipe import UPLOAD_CHUNK_SIZE
 from services.youtube import YouTubeService
 
 
@@ -62,6 +66,16 @@ class TestYouTubeService:
         assert service.service is not None
         assert service.file_operations == mock_file_ops
 
+    @patch("services.youtube.build")
+    def test_initialization_with_http_transport(self, mock_build, mock_credentials, mock_file_ops):
+        """Test service initialization with a shared HTTP transport."""
+        mock_transport = Mock()
+        mock_transport.build_kwargs.return_value = {"http": "http", "requestBuilder": "builder"}
+
+        YouTubeService(mock_credentials, mock_file_ops, mock_transport)
+
+        mock_build.assert_called_once_with("youtube", "v3", http="http", requestBuilder="builder")
+
     @patch("services.youtube.MediaFileUpload")
     def test_upload_video_success(
         self, mock_media_class, youtube_service, mock_youtube_service, 
@@ -107,7 +121,7 @@ class TestYouTubeService:
         # Verify media upload creation
         mock_media_class.assert_called_once_with(
             "/tmp/video.mp4",
-            chunksize=-1,
+            chunksize=UPLOAD_CHUNK_SIZE,
             resumable=True,
             mimetype="video/*"
         )
@@ -315,6 +329,170 @@ class TestYouTubeService:
         assert body["status"]["privacyStatus"] == "private"
         assert body["status"]["selfDeclaredMadeForKids"] is False
 
+    @patch("services.youtube.random.random", return_value=0.5)
+    @patch("services.youtube.time.sleep")
+    @patch("services.youtube.MediaFileUpload")
+    def test_upload_video_resumes_after_server_error(
+        self, mock_media_class, mock_sleep, mock_random, youtube_service, mock_youtube_service,
+        mock_file_ops, sample_video_data
+    ):
+        """Test upload resumes after a transient server error."""
+        _, mock_videos = mock_youtube_service
+        mock_file_ops.stat.return_value = Mock(st_size=1024)
+
+        mock_request = Mock()
+        mock_videos.insert.return_value = mock_request
+        mock_request.next_chunk.side_effect = [
+            HttpError(Mock(status=503), b"Service Unavailable"),
+            ConnectionError("Connection reset"),
+            (None, {"id": "video123"}),
+        ]
+
+        video_id = youtube_service.upload_video("/tmp/video.mp4", sample_video_data)
+
+        assert video_id == "video123"
+        assert mock_request.next_chunk.call_count == 3
+        assert mock_sleep.call_args_list == [call(2.5), call(4.5)]
+
+    @patch("services.youtube.time.sleep")
+    def test_upload_video_resume_sends_remaining_bytes(
+        self, mock_sleep, youtube_service, mock_youtube_service, mock_file_ops,
+        sample_video_data, tmp_path
+    ):
+        """Test a real resumable request resumes from the offset the server reports."""
+        _, mock_videos = mock_youtube_service
+        video_path = tmp_path / "video.mp4"
+        video_path.write_bytes(bytes(range(250)) * 4)
+        mock_file_ops.stat.return_value = Mock(st_size=1000)
+
+        requests = []
+        responses = [
+            ({"status": "200", "location": "https://upload.example/session"}, b""),
+            ConnectionError("Connection reset"),
+            ({"status": "308", "range": "bytes=0-399"}, b""),
+            ({"status": "200"}, b'{"id": "video123"}'),
+        ]
+
+        class FakeHttp:
+            def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+                if hasattr(body, "read"):
+                    body = body.read()
+                requests.append((method, headers, body))
+                response = responses.pop(0)
+                if isinstance(response, Exception):
+                    raise response
+                return httplib2.Response(response[0]), response[1]
+
+        def insert(part, body, media_body):
+            return HttpRequest(
+                FakeHttp(),
+                lambda resp, content: json.loads(content),
+                "https://upload.example/videos",
+                method="POST",
+                body=json.dumps(body),
+                headers={"content-type": "application/json"},
+                resumable=media_body,
+            )
+
+        mock_videos.insert.side_effect = insert
+
+        video_id = youtube_service.upload_video(str(video_path), sample_video_data)
+
+        assert video_id == "video123"
+        # The probe after the failure asks the server how much it received
+        assert requests[2][1]["Content-Range"] == "bytes */1000"
+        method, headers, body = requests[3]
+        assert method == "PUT"
+        assert headers["Content-Range"] == "bytes 400-999/1000"
+        assert headers["Content-Length"] == "600"
+        assert body == video_path.read_bytes()[400:]
+
+    @patch("services.youtube.time.sleep")
+    @patch("services.youtube.MediaFileUpload")
+    def test_upload_video_resumes_after_rate_limit(
+        self, mock_media_class, mock_sleep, youtube_service, mock_youtube_service,
+        mock_file_ops, sample_video_data
+    ):
+        """Test upload resumes after a 429 Too Many Requests response."""
+        _, mock_videos = mock_youtube_service
+        mock_file_ops.stat.return_value = Mock(st_size=1024)
+
+        mock_request = Mock()
+        mock_videos.insert.return_value = mock_request
+        mock_request.next_chunk.side_effect = [
+            HttpError(Mock(status=429), b"Too Many Requests"),
+            (None, {"id": "video123"}),
+        ]
+
+        video_id = youtube_service.upload_video("/tmp/video.mp4", sample_video_data)
+
+        assert video_id == "video123"
+        mock_sleep.assert_called_once()
+
+    @patch("services.youtube.time.sleep")
+    @patch("services.youtube.MediaFileUpload")
+    def test_upload_video_client_error_not_retried(
+        self, mock_media_class, mock_sleep, youtube_service, mock_youtube_service,
+        mock_file_ops, sample_video_data
+    ):
+        """Test client errors fail immediately without retrying."""
+        _, mock_videos = mock_youtube_service
+        mock_file_ops.stat.return_value = Mock(st_size=1024)
+
+        mock_request = Mock()
+        mock_videos.insert.return_value = mock_request
+        mock_request.next_chunk.side_effect = HttpError(Mock(status=403), b"quotaExceeded")
+
+        with pytest.raises(Exception, match="Failed to upload video"):
+            youtube_service.upload_video("/tmp/video.mp4", sample_video_data)
+
+        assert mock_request.next_chunk.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("services.youtube.time.sleep")
+    @patch("services.youtube.MediaFileUpload")
+    def test_upload_video_gives_up_after_max_retries(
+        self, mock_media_class, mock_sleep, mock_youtube_service,
+        mock_credentials, mock_file_ops, sample_video_data
+    ):
+        """Test upload fails once retries are exhausted."""
+        mock_service, mock_videos = mock_youtube_service
+        with patch("services.youtube.build", return_value=mock_service):
+            service = YouTubeService(mock_credentials, mock_file_ops, max_retries=2)
+        mock_file_ops.stat.return_value = Mock(st_size=1024)
+
+        mock_request = Mock()
+        mock_videos.insert.return_value = mock_request
+        mock_request.next_chunk.side_effect = HttpError(Mock(status=500), b"Backend Error")
+
+        with pytest.raises(Exception, match="Failed to upload video"):
+            service.upload_video("/tmp/video.mp4", sample_video_data)
+
+        assert mock_request.next_chunk.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_upload_stream(self, youtube_service, mock_youtube_service, sample_video_data):
+        """Test uploading from a media body of unknown size."""
+        _, mock_videos = mock_youtube_service
+        mock_media = Mock()
+        mock_media.size.return_value = None
+
+        mock_request = Mock()
+        mock_videos.insert.return_value = mock_request
+        mock_request.next_chunk.side_effect = [
+            (Mock(resumable_progress=512), None),
+            (None, {"id": "stream_video_id"}),
+        ]
+
+        progress_updates = []
+        video_id = youtube_service.upload_stream(
+            mock_media, sample_video_data, lambda c, t: progress_updates.append((c, t))
+        )
+
+        assert video_id == "stream_video_id"
+        assert mock_videos.insert.call_args[1]["media_body"] is mock_media
+        assert progress_updates == [(512, 0)]
+
     def test_implements_protocol(self, mock_credentials, mock_file_ops):
         """Test that YouTubeService implements IYouTubeService protocol."""
         from interfaces import IYouTubeService
@@ -162,6 +162,69 @@ class TestMain:
         mock_uploader.initialize.assert_called_once()
         mock_uploader.process_spreadsheet.assert_called_once()
         assert any("completed successfully" in str(call) for call in mock_print.call_args_list)
+        mock_container_instance.close.assert_called_once()
+
+    @patch('main.print_user_friendly_error')
+    @patch('main.DependencyContainer')
+    @patch('main.build_config_from_args')
+    @patch('main.parse_arguments')
+    @patch('main.print')
+    async def test_main_closes_container_on_failure(
+        self, mock_print, mock_parse, mock_build_config, mock_container, mock_error_print
+    ):
+        """Test that services are closed even when the upload fails."""
+        from main import main
+
+        mock_args = Mock()
+        mock_args.resume = True
+        mock_args.retry_failed = False
+        mock_parse.return_value = mock_args
+        mock_build_config.return_value = Mock(spec=Config)
+
+        mock_uploader = AsyncMock()
+        mock_uploader.process_spreadsheet.side_effect = RuntimeError("Upload failed")
+        mock_container.return_value.create_youtube_bulk_uploader.return_value = mock_uploader
+
+        with pytest.raises(SystemExit):
+            await main()
+
+        mock_error_print.assert_called_once()
+        mock_container.return_value.close.assert_called_once()
+
+    @patch('main.print_user_friendly_error')
+    @patch('main.DependencyContainer')
+    @patch('main.build_config_from_args')
+    @patch('main.parse_arguments')
+    @patch('main.print')
+    async def test_main_clears_progress_before_loading(
+        self, mock_print, mock_parse, mock_build_config, mock_container, mock_error_print
+    ):
+        """Test that previous progress and its journal are removed before the tracker loads."""
+        from main import main
+
+        mock_args = Mock()
+        mock_args.resume = False
+        mock_args.retry_failed = False
+        mock_parse.return_value = mock_args
+
+        mock_config = Mock(spec=Config)
+        mock_config.spreadsheet_id = 'test_sheet'
+        mock_config.sheet_range = 'A:E'
+        mock_config.progress_file = 'progress.json'
+        mock_config.progress_journal_file = 'progress.json.wal'
+        mock_build_config.return_value = mock_config
+
+        mock_container.return_value.create_youtube_bulk_uploader.return_value = AsyncMock()
+
+        removed = []
+        def remove(path):
+            mock_container.assert_not_called()
+            removed.append(path)
+
+        with patch('main.os.path.exists', return_value=True), patch('main.os.remove', remove):
+            await main()
+
+        assert removed == ['progress.json', 'progress.json.wal']
 
     # TODO: Fix this test - it hangs due to async/mock interaction
     # @patch('main.print')
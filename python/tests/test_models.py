@@ -5,7 +5,7 @@ from datetime import datetime
 
 import pytest
 
-from models import AuthTokens, Config, FailedUpload, UploadProgress, VideoData
+from models import UPLOAD_QUOTA_COST, AuthTokens, Config, FailedUpload, UploadProgress, VideoData
 
 
 class TestVideoData:
@@ -81,6 +81,17 @@ class TestVideoData:
         )
         assert video.tags == []
 
+    def test_uses_slots(self) -> None:
+        """Test that instances carry no per-instance __dict__."""
+        video = VideoData(
+            drive_link="https://drive.google.com/file/d/123",
+            title="Test",
+            description="Test",
+            tags=[],
+            unique_id="123",
+        )
+        assert not hasattr(video, "__dict__")
+
 
 class TestFailedUpload:
     """Test FailedUpload dataclass."""
@@ -148,7 +159,7 @@ class TestUploadProgress:
         )
         result = progress.to_dict()
 
-        assert set(result["processed_ids"]) == {"id1", "id2"}
+        assert result["processed_ids"] == ["id1", "id2"]
         assert result["last_processed_row"] == 5
         assert len(result["failed_uploads"]) == 1
         assert result["failed_uploads"][0] == {
@@ -157,6 +168,12 @@ class TestUploadProgress:
             "timestamp": "2023-01-01",
         }
 
+    def test_to_dict_sorts_processed_ids(self) -> None:
+        """Test processed IDs are saved in a stable order."""
+        progress = UploadProgress(processed_ids={"id3", "id1", "id2"})
+
+        assert progress.to_dict()["processed_ids"] == ["id1", "id2", "id3"]
+
     def test_from_dict(self) -> None:
         """Test creation from dictionary."""
         data = {
@@ -225,6 +242,8 @@ class TestConfig:
         assert config.log_file == "upload.log"
         assert config.token_file == "token.json"
         assert config.temp_dir == "./temp"
+        assert config.max_concurrent_uploads == 2
+        assert config.download_chunk_size == 16 * 1024 * 1024
 
     def test_custom_optional_values(self) -> None:
         """Test Config with custom optional values."""
@@ -245,6 +264,50 @@ class TestConfig:
         assert config.token_file == "/home/user/.token.json"
         assert config.temp_dir == "/tmp/videos"
 
+    def test_invalid_max_concurrent_uploads_raises_error(self) -> None:
+        """Test that fewer than one concurrent upload raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrent_uploads must be at least 1"):
+            Config(
+                client_id="client123",
+                client_secret="secret456",
+                redirect_uri="http://localhost:8080",
+                spreadsheet_id="sheet789",
+                max_concurrent_uploads=0,
+            )
+
+    def test_invalid_download_chunk_size_raises_error(self) -> None:
+        """Test that a non-positive download chunk size raises ValueError."""
+        with pytest.raises(ValueError, match="download_chunk_size must be positive"):
+            Config(
+                client_id="client123",
+                client_secret="secret456",
+                redirect_uri="http://localhost:8080",
+                spreadsheet_id="sheet789",
+                download_chunk_size=0,
+            )
+
+    def test_invalid_quota_rate_raises_error(self) -> None:
+        """Test that a non-positive quota refill rate raises ValueError."""
+        with pytest.raises(ValueError, match="quota_units_per_second must be positive"):
+            Config(
+                client_id="client123",
+                client_secret="secret456",
+                redirect_uri="http://localhost:8080",
+                spreadsheet_id="sheet789",
+                quota_units_per_second=0,
+            )
+
+    def test_quota_burst_below_upload_cost_raises_error(self) -> None:
+        """Test that a burst too small for a single upload raises ValueError."""
+        with pytest.raises(ValueError, match="quota_burst_units must be at least"):
+            Config(
+                client_id="client123",
+                client_secret="secret456",
+                redirect_uri="http://localhost:8080",
+                spreadsheet_id="sheet789",
+                quota_burst_units=UPLOAD_QUOTA_COST - 1,
+            )
+
     def test_empty_client_id_raises_error(self) -> None:
         """Test that empty client_id raises ValueError."""
         with pytest.raises(ValueError, match="client_id cannot be empty"):
@@ -63,6 +63,41 @@ class TestBuildConfigFromEnv:
         assert config.log_file == "upload.log"
         assert config.token_file == "token.json"
         assert config.temp_dir == "./temp"
+        assert config.enable_pipeline is True
+
+    @patch.dict(
+        os.environ,
+        {
+            "GOOGLE_CLIENT_ID": "client_id",
+            "GOOGLE_CLIENT_SECRET": "client_secret",
+            "GOOGLE_REDIRECT_URI": "http://localhost",
+            "SPREADSHEET_ID": "sheet_id",
+            "ENABLE_PIPELINE": "false",
+        },
+        clear=True,
+    )
+    def test_disable_pipeline(self) -> None:
+        """Test falling back to temp file downloads."""
+        config = build_config_from_env()
+
+        assert config.enable_pipeline is False
+
+    @patch.dict(
+        os.environ,
+        {
+            "GOOGLE_CLIENT_ID": "client_id",
+            "GOOGLE_CLIENT_SECRET": "client_secret",
+            "GOOGLE_REDIRECT_URI": "http://localhost",
+            "SPREADSHEET_ID": "sheet_id",
+            "DOWNLOAD_CHUNK_SIZE": "67108864",
+        },
+        clear=True,
+    )
+    def test_download_chunk_size(self) -> None:
+        """Test setting the Drive download chunk size."""
+        config = build_config_from_env()
+
+        assert config.download_chunk_size == 64 * 1024 * 1024
 
     @patch.dict(os.environ, {}, clear=True)
     def test_no_env_vars_set(self) -> None:
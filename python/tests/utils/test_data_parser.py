@@ -153,3 +153,21 @@ class TestParseVideoRow:
         """Test that all empty required fields returns None."""
         row = ["", "", "", "", ""]
         assert parse_video_row(row) is None
+
+    def test_tags_shared_across_rows(self) -> None:
+        """Test that identical tags from different rows are the same object."""
+        first = parse_video_row(["https://drive.google.com/file/d/1", "A", "", "maths, year 7", "id1"])
+        second = parse_video_row(["https://drive.google.com/file/d/2", "B", "", "maths,year 7", "id2"])
+
+        assert first is not None and second is not None
+        assert first.tags[0] is second.tags[0]
+        assert first.tags[1] is second.tags[1]
+
+    def test_tags_not_shared_between_rows(self) -> None:
+        """Test that cached tag parsing still gives each row its own list."""
+        first = parse_video_row(["https://drive.google.com/file/d/1", "A", "", "maths", "id1"])
+        second = parse_video_row(["https://drive.google.com/file/d/2", "B", "", "maths", "id2"])
+
+        assert first is not None and second is not None
+        first.tags.append("extra")
+        assert second.tags == ["maths"]
@@ -5,7 +5,12 @@ import json
 import pytest
 
 from models import FailedUpload, UploadProgress
-from utils.progress_serializer import deserialize_progress, serialize_progress
+from utils.progress_serializer import (
+    apply_progress_events,
+    deserialize_progress,
+    serialize_progress,
+    serialize_progress_event,
+)
 
 
 class TestSerializeProgress:
@@ -48,15 +53,13 @@ class TestSerializeProgress:
             "timestamp": "2023-01-01T00:00:00Z",
         }
 
-    def test_pretty_printed_json(self) -> None:
-        """Test that JSON is pretty-printed with 2-space indentation."""
+    def test_compact_json(self) -> None:
+        """Test that JSON is written without indentation or extra whitespace."""
         progress = UploadProgress(processed_ids={"id1"})
         result = serialize_progress(progress)
 
-        # Check for indentation
-        lines = result.split("\n")
-        assert len(lines) > 1  # Should be multi-line
-        assert lines[1].startswith("  ")  # 2-space indentation
+        assert "\n" not in result
+        assert result == '{"processed_ids":["id1"],"last_processed_row":0,"failed_uploads":[]}'
 
     def test_unicode_in_progress(self) -> None:
         """Test serializing progress with unicode characters."""
@@ -195,3 +198,53 @@ class TestDeserializeProgress:
         assert result.processed_ids == set()
         assert result.last_processed_row == 0
         assert result.failed_uploads == []
+
+
+class TestProgressEvents:
+    """Test progress journal helpers."""
+
+    def test_serialize_event_is_one_line(self) -> None:
+        """Test that an event serializes to a single compact line."""
+        line = serialize_progress_event({"processed": "id1"})
+
+        assert line == '{"processed":"id1"}\n'
+
+    def test_apply_events(self) -> None:
+        """Test replaying events on top of a snapshot."""
+        progress = UploadProgress(processed_ids={"id1"}, last_processed_row=1)
+        journal = "".join(
+            serialize_progress_event(event)
+            for event in [
+                {"processed": "id2"},
+                {"failed": "id3", "error": "Network error", "timestamp": "2023-01-01"},
+                {"row": 3},
+            ]
+        )
+
+        result = apply_progress_events(progress, journal)
+
+        assert result.processed_ids == {"id1", "id2"}
+        assert result.last_processed_row == 3
+        assert result.failed_uploads == [
+            FailedUpload(unique_id="id3", error="Network error", timestamp="2023-01-01")
+        ]
+
+    def test_apply_events_skips_torn_line(self) -> None:
+        """Test that a line cut short by a crash is ignored."""
+        journal = '{"processed":"id1"}\n{"processed":"id'
+
+        result = apply_progress_events(UploadProgress(), journal)
+
+        assert result.processed_ids == {"id1"}
+
+    def test_apply_events_does_not_duplicate_failures(self) -> None:
+        """Test that failures already in the snapshot are not added again."""
+        failed = FailedUpload(unique_id="id1", error="Failed", timestamp="2023-01-01")
+        progress = UploadProgress(failed_uploads=[failed])
+        journal = serialize_progress_event(
+            {"failed": "id1", "error": "Failed", "timestamp": "2023-01-01"}
+        )
+
+        result = apply_progress_events(progress, journal)
+
+        assert len(result.failed_uploads) == 1
@@ -0,0 +1,31 @@
+"""Tests for Google Sheets range utilities."""
+
+import pytest
+
+from utils.sheet_range import build_page_range
+
+
+class TestBuildPageRange:
+    """Test build_page_range function."""
+
+    def test_column_range(self) -> None:
+        """Test paging a bare column range."""
+        assert build_page_range("A:E", 2, 501) == "A2:E501"
+
+    def test_column_range_with_sheet(self) -> None:
+        """Test paging a column range on a named sheet."""
+        assert build_page_range("Videos!A:E", 501, 1000) == "Videos!A501:E1000"
+        assert build_page_range("'My Videos'!B:F", 1, 10) == "'My Videos'!B1:F10"
+
+    @pytest.mark.parametrize(
+        "sheet_range",
+        ["A1:E100", "Videos!A2:E", "Sheet1", "", "A"],
+    )
+    def test_unpageable_ranges(self, sheet_range: str) -> None:
+        """Test that ranges with row bounds or no columns are not paged."""
+        assert build_page_range(sheet_range, 1, 500) is None
+
+    def test_successive_pages_of_same_range(self) -> None:
+        """Test that pages built from one range each get their own rows."""
+        assert build_page_range("Videos!A:E", 1, 500) == "Videos!A1:E500"
+        assert build_page_range("Videos!A:E", 501, 1000) == "Videos!A501:E1000"